@@ -17,6 +17,7 @@ from .silly_commands import SillyCommands
 from .start_command import StartCommand
 from .status_command import StatusCommand
 from .stop_command import StopCommand
+from .tick_stats_command import TickStatsCommand
 from .ticker_command import TickerCommand
 
 __all__ = [
@@ -38,6 +39,7 @@ __all__ = [
     StartCommand,
     StatusCommand,
     StopCommand,
+    TickStatsCommand,
     TickerCommand,
     MQTTCommand,
 ]
@@ -65,6 +65,9 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_events",
                              "mqtt_external_events",
                              "mqtt_autostart",
+                             "mqtt_events_batch_interval",
+                             "mqtt_market_data",
+                             "mqtt_market_data_interval",
                              "instance_id",
                              "send_error_logs",
                              "pmm_script_mode",
@@ -89,6 +92,7 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_collection_columnar",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -3,9 +3,10 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
+from sqlalchemy.orm import Session
 
 from hummingbot.client.command.gateway_command import GatewayCommand
 from hummingbot.client.performance import PerformanceMetrics
@@ -13,6 +14,7 @@ from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllCo
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_performance import TradePerformance, TradePerformanceTotals
 from hummingbot.user.user_balances import UserBalances
 
 s_float_0 = float(0)
@@ -42,16 +44,13 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            performances: List[TradePerformanceTotals] = self._get_trade_performances(session, start_time)
+        if not performances:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        safe_ensure_future(self.performance_report(start_time, performances, precision))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -65,6 +64,82 @@ class HistoryCommand:
                 config_file_path=self.strategy_file_name)
             return list([TradeFill.to_bounty_api_json(t) for t in trades])
 
+    def get_history_performance_json(self,  # type: HummingbotApplication
+                                     days: float = 0,
+                                     start_time: Optional[float] = None,
+                                     end_time: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Returns the trade volumes, prices and fees per market and trading pair from the performance ledger. The
+        start_time and end_time (in seconds) take precedence over days.
+        """
+        if self.strategy_file_name is None:
+            return
+        if start_time is None:
+            start_time = get_timestamp(days) if days > 0 else self.init_time
+        with self.trade_fill_db.get_new_session() as session:
+            performances = self._get_trade_performances(session, start_time, end_time)
+        return [performance.to_json() for performance in performances]
+
+    def _get_trade_performances(self,  # type: HummingbotApplication
+                                session: Session,
+                                start_time: float,
+                                end_time: Optional[float] = None) -> List[TradePerformanceTotals]:
+        # Fills recorded in this session update the ledger in the same transaction, so it only needs to be checked
+        # once per config file, for the fills recorded before the ledger existed.
+        if self.strategy_file_name not in self._trade_performance_checked_configs:
+            if not TradePerformance.is_consistent(session, self.strategy_file_name):
+                TradePerformance.rebuild(session, self.strategy_file_name)
+                session.commit()
+            self._trade_performance_checked_configs.add(self.strategy_file_name)
+        return TradePerformance.get_totals(session,
+                                           self.strategy_file_name,
+                                           int(start_time * 1e3),
+                                           int(end_time * 1e3) if end_time is not None else None)
+
+    async def _get_current_balances_with_timeout(self,  # type: HummingbotApplication
+                                                 market: str) -> Dict[str, Decimal]:
+        network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+        try:
+            return await asyncio.wait_for(self.get_current_balances(market), network_timeout)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
+
+    async def performance_report(self,  # type: HummingbotApplication
+                                 start_time: float,
+                                 performances: List[TradePerformanceTotals],
+                                 precision: Optional[int] = None,
+                                 display_report: bool = True) -> Decimal:
+        """
+        Same report as `history_report`, from the performance ledger totals. Markets with position fills need their
+        positions paired, so their trade fills are loaded and reported as in `history_report`.
+        """
+        if display_report:
+            self.report_header(start_time)
+        return_pcts = []
+        for performance in performances:
+            cur_balances = await self._get_current_balances_with_timeout(performance.market)
+            if performance.num_position_fills > 0:
+                with self.trade_fill_db.get_new_session() as session:
+                    trades: List[TradeFill] = [
+                        t for t in self._get_trades_from_session(int(start_time * 1e3),
+                                                                 session=session,
+                                                                 config_file_path=self.strategy_file_name)
+                        if t.market == performance.market and t.symbol == performance.symbol
+                    ]
+                perf = await PerformanceMetrics.create(performance.symbol, trades, cur_balances)
+            else:
+                perf = await PerformanceMetrics.create_from_totals(performance.symbol, performance, cur_balances)
+            if display_report:
+                self.report_performance_by_market(performance.market, performance.symbol, perf, precision)
+            return_pcts.append(perf.return_pct)
+        avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+        if display_report and len(return_pcts) > 1:
+            self.notify(f"\nAveraged Return = {avg_return:.2%}")
+        return avg_return
+
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
                              trades: List[TradeFill],
@@ -76,14 +151,7 @@ class HistoryCommand:
         return_pcts = []
         for market, symbol in market_info:
             cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
+            cur_balances = await self._get_current_balances_with_timeout(market)
             perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
@@ -209,11 +277,8 @@ class HistoryCommand:
         start_time = self.init_time
 
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+            performances: List[TradePerformanceTotals] = self._get_trade_performances(session, start_time)
+        avg_return = await self.performance_report(start_time, performances, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
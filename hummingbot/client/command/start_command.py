@@ -245,7 +245,12 @@ class StartCommand(GatewayChainApiManager):
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            tick_timing = self.client_config_map.tick_timing
+            self.clock = Clock(ClockMode.REALTIME,
+                               tick_size=tick_size,
+                               tick_timing_enabled=tick_timing.tick_timing_enabled,
+                               slow_iterator_threshold=tick_timing.slow_iterator_threshold_ms / 1e3,
+                               tick_overrun_threshold=tick_timing.tick_overrun_threshold_ms / 1e3)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
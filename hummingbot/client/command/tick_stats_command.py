@@ -0,0 +1,58 @@
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class TickStatsCommand:
+    def tick_stats(self,  # type: HummingbotApplication
+                   reset: bool = False):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.tick_stats, reset)
+            return
+
+        if self.clock is None:
+            self.notify("\n  This command can only be used while a strategy is running.")
+            return
+        if reset:
+            self.clock.reset_tick_stats()
+            self.notify("\n  Tick statistics have been reset.")
+            return
+        if not self.clock.tick_timing_enabled:
+            self.notify("\n  Tick timing is disabled. Enable it with `config tick_timing` before starting the strategy.")
+            return
+        self.notify(self.tick_stats_report(self.clock.get_tick_stats()))
+
+    def get_tick_stats_json(self,  # type: HummingbotApplication
+                            ) -> Optional[Dict[str, Any]]:
+        if self.clock is None:
+            return None
+        return self.clock.get_tick_stats()
+
+    def tick_stats_report(self,  # type: HummingbotApplication
+                          tick_stats: Dict[str, Any]) -> str:
+        lines = [
+            f"\n  Ticks: {tick_stats['tick_count']}"
+            f"  Avg: {tick_stats['avg_tick_ms']:.3f} ms"
+            f"  Max: {tick_stats['max_tick_ms']:.3f} ms"
+            f"  Overruns (> {tick_stats['overrun_threshold_ms']:.1f} ms): {tick_stats['overrun_count']}"
+        ]
+        if len(tick_stats["iterators"]) > 0:
+            columns = ["Iterator", "Ticks", "Avg (us)", "p50 (us)", "p99 (us)", "Max (us)", "Slow"]
+            data = [[stats["name"],
+                     stats["count"],
+                     round(stats["avg_us"], 1),
+                     stats["p50_us"],
+                     stats["p99_us"],
+                     round(stats["max_us"], 1),
+                     stats["slow_count"]] for stats in tick_stats["iterators"]]
+            df = pd.DataFrame(data=data, columns=columns)
+            df_lines = format_df_for_printout(df, self.client_config_map.tables_format).split("\n")
+            lines.extend(["", f"  Slow ticks are over {tick_stats['slow_iterator_threshold_ms']:.1f} ms"] +
+                         ["    " + line for line in df_lines])
+        return "\n".join(lines)
@@ -146,6 +146,32 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_events_batch_interval: float = Field(
+        default=0.0,
+        ge=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the window in seconds used to batch forwarded events (0 publishes every event immediately)"
+            ),
+        ),
+    )
+    mqtt_market_data: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the throttled market data topic"
+            ),
+        ),
+    )
+    mqtt_market_data_interval: float = Field(
+        default=1.0,
+        gt=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the market data publishing interval in seconds (Default=1.0)"
+            ),
+        ),
+    )
 
     class Config:
         title = "mqtt_bridge"
@@ -178,11 +204,87 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_columnar: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Store market data in per pair columnar files instead of the trades database"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
 
+class EventLogRetentionConfigMap(BaseClientModel):
+    order_filled_events_max_count: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum number of order fill events each connector keeps in memory (0 to keep all of them)"
+            ),
+        ),
+    )
+    order_filled_events_max_age: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum age in seconds of the order fill events each connector keeps in memory "
+                "(0 to keep all of them)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "event_log_retention"
+
+
+class TickTimingConfigMap(BaseClientModel):
+    tick_timing_enabled: bool = Field(
+        default=True,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to keep the tick durations of the strategy, connectors and trackers? (Yes/No)"
+            ),
+        ),
+    )
+    slow_iterator_threshold_ms: float = Field(
+        default=100,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Tick duration in milliseconds over which a strategy, connector or tracker tick is counted as slow "
+                "(0 to not count them)"
+            ),
+        ),
+    )
+    tick_overrun_threshold_ms: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Clock tick duration in milliseconds over which the tick is reported as an overrun "
+                "(0 to use the tick size)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "tick_timing"
+
+    @validator("tick_timing_enabled", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -326,6 +428,15 @@ class PaperTradeConfigMap(BaseClientModel):
             ),
         ),
     )
+    paper_trade_queue_position_matching: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Should paper limit orders wait for the volume queued ahead of them at their price level and fill "
+                "partially? (True/False)"
+            ),
+        ),
+    )
 
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
@@ -333,6 +444,15 @@ class PaperTradeConfigMap(BaseClientModel):
             v = json.loads(v)
         return v
 
+    @validator("paper_trade_queue_position_matching", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
 
 class KillSwitchMode(BaseClientModel, ABC):
     @abstractmethod
@@ -1152,6 +1272,8 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    event_log_retention: EventLogRetentionConfigMap = Field(default=EventLogRetentionConfigMap())
+    tick_timing: TickTimingConfigMap = Field(default=TickTimingConfigMap())
 
     class Config:
         title = "client_config_map"
@@ -2,14 +2,14 @@ from typing import Callable
 
 from pydantic.json import pydantic_encoder
 
-from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.config_var import FeeOverrideConfigVar
 
 
 def new_fee_config_var(key: str, type_str: str = "decimal"):
-    return ConfigVar(key=key,
-                     prompt=None,
-                     required_if=lambda: False,
-                     type_str=type_str)
+    return FeeOverrideConfigVar(key=key,
+                                prompt=None,
+                                required_if=lambda: False,
+                                type_str=type_str)
 
 
 def using_exchange(exchange: str) -> Callable:
@@ -83,3 +83,20 @@ class ConfigVar:
             elif inspect.isfunction(self._on_validated):
                 self._on_validated(value)
         return err_msg
+
+
+class FeeOverrideConfigVar(ConfigVar):
+    """
+    ConfigVar for trade fee overrides. Every change of value bumps the class level `version`, which is used to
+    invalidate the compiled trade fee schemas.
+    """
+    version: int = 0
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        FeeOverrideConfigVar.version += 1
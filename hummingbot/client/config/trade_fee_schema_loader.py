@@ -1,5 +1,7 @@
 from decimal import Decimal
+from typing import Dict, Tuple
 
+from hummingbot.client.config.config_var import FeeOverrideConfigVar
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema, TokenAmount
@@ -9,18 +11,44 @@ class TradeFeeSchemaLoader:
     """
     Utility class that contains the requried logic to load fee schemas applying any override the user
     might have configured.
+
+    The configured schemas are compiled once per exchange and cached. A cached schema is rebuilt only when a fee
+    override changes or the connector settings provide a different schema. The returned schemas are shared and must
+    not be modified.
     """
+    # exchange name -> (connector settings schema, fee overrides version, configured schema)
+    _configured_schemas: Dict[str, Tuple[TradeFeeSchema, int, TradeFeeSchema]] = {}
 
     @classmethod
     def configured_schema_for_exchange(cls, exchange_name: str) -> TradeFeeSchema:
-        if exchange_name not in AllConnectorSettings.get_connector_settings():
+        connector_settings = AllConnectorSettings.get_connector_settings()
+        if exchange_name not in connector_settings:
             raise Exception(f"Invalid connector. {exchange_name} does not exist in AllConnectorSettings")
-        trade_fee_schema = AllConnectorSettings.get_connector_settings()[exchange_name].trade_fee_schema
-        trade_fee_schema = cls._superimpose_overrides(exchange_name, trade_fee_schema)
-        return trade_fee_schema
+        source_schema = connector_settings[exchange_name].trade_fee_schema
+        cached = cls._configured_schemas.get(exchange_name)
+        if cached is None or cached[0] is not source_schema or cached[1] != FeeOverrideConfigVar.version:
+            cached = (
+                source_schema,
+                FeeOverrideConfigVar.version,
+                cls._superimpose_overrides(exchange_name, source_schema),
+            )
+            cls._configured_schemas[exchange_name] = cached
+        return cached[2]
 
     @classmethod
-    def _superimpose_overrides(cls, exchange: str, trade_fee_schema: TradeFeeSchema):
+    def clear_cache(cls):
+        cls._configured_schemas.clear()
+
+    @classmethod
+    def _superimpose_overrides(cls, exchange: str, source_schema: TradeFeeSchema) -> TradeFeeSchema:
+        trade_fee_schema = TradeFeeSchema(
+            percent_fee_token=source_schema.percent_fee_token,
+            maker_percent_fee_decimal=source_schema.maker_percent_fee_decimal,
+            taker_percent_fee_decimal=source_schema.taker_percent_fee_decimal,
+            buy_percent_fee_deducted_from_returns=source_schema.buy_percent_fee_deducted_from_returns,
+            maker_fixed_fees=list(source_schema.maker_fixed_fees),
+            taker_fixed_fees=list(source_schema.taker_fixed_fees),
+        )
         trade_fee_schema.percent_fee_token = (
             fee_overrides_config_map.get(f"{exchange}_percent_fee_token").value
             or trade_fee_schema.percent_fee_token
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Deque, Dict, List, Optional, Tuple, Union
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
 
 from hummingbot.client.command import __all__ as commands
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -103,6 +103,7 @@ class HummingbotApplication(*commands):
         self._last_started_strategy_file: Optional[str] = None
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
+        self._trade_performance_checked_configs: Set[str] = set()
         self.markets_recorder: Optional[MarketsRecorder] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
@@ -10,6 +10,7 @@ from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, Tok
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_performance import TradePerformanceTotals
 
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
@@ -71,6 +72,19 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_totals(cls,
+                                 trading_pair: str,
+                                 totals: TradePerformanceTotals,
+                                 current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Same as `create`, from the trade fill aggregates of the performance ledger instead of the trade fills. It does
+        not pair derivative positions, so derivative markets with position fills should use `create`.
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_totals(trading_pair, totals, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,15 +210,7 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
-        self.tot_vol_base = self.b_vol_base + self.s_vol_base
-        self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
-
-        self.avg_b_price = self.divide(self.b_vol_quote, self.b_vol_base)
-        self.avg_s_price = self.divide(self.s_vol_quote, self.s_vol_base)
-        self.avg_tot_price = self.divide(abs(self.b_vol_quote) + abs(self.s_vol_quote),
-                                         abs(self.b_vol_base) + abs(self.s_vol_base))
-        self.avg_b_price = abs(self.avg_b_price)
-        self.avg_s_price = abs(self.avg_s_price)
+        self._calculate_volume_averages()
 
         return buys, sells
 
@@ -248,6 +254,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -284,6 +293,17 @@ class PerformanceMetrics:
 
             self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
 
+    def _calculate_volume_averages(self):
+        self.tot_vol_base = self.b_vol_base + self.s_vol_base
+        self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
+
+        self.avg_b_price = self.divide(self.b_vol_quote, self.b_vol_base)
+        self.avg_s_price = self.divide(self.s_vol_quote, self.s_vol_base)
+        self.avg_tot_price = self.divide(abs(self.b_vol_quote) + abs(self.s_vol_quote),
+                                         abs(self.b_vol_base) + abs(self.s_vol_base))
+        self.avg_b_price = abs(self.avg_b_price)
+        self.avg_s_price = abs(self.avg_s_price)
+
     async def _initialize_metrics(self,
                                   trading_pair: str,
                                   trades: List[Any],
@@ -302,15 +322,58 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._initialize_values(trading_pair,
+                                      current_balances,
+                                      Decimal(str(trades[0].price)),
+                                      Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_totals(self,
+                                              trading_pair: str,
+                                              totals: TradePerformanceTotals,
+                                              current_balances: Dict[str, Decimal]):
+        base, quote = split_hb_trading_pair(trading_pair)
+
+        self.num_buys = totals.num_buys
+        self.num_sells = totals.num_sells
+        self.num_trades = totals.num_trades
+        self.b_vol_base = totals.b_vol_base
+        self.b_vol_quote = totals.b_vol_quote
+        self.s_vol_base = totals.s_vol_base
+        self.s_vol_quote = totals.s_vol_quote + totals.deducted_fee_impact
+        self._calculate_volume_averages()
+
+        await self._initialize_values(trading_pair, current_balances, totals.first_price, totals.last_price)
+        self.trade_pnl = self.cur_value - self.hold_value
+
+        for fee_token, fee_amount in totals.fee_amounts.items():
+            self.fees[fee_token] += fee_amount
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_values(self,
+                                 trading_pair: str,
+                                 current_balances: Dict[str, Decimal],
+                                 first_price: Decimal,
+                                 last_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
+
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = first_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +381,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
@@ -142,6 +142,10 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    tick_stats_parser = subparsers.add_parser("tick_stats", help="Show how long the strategy, connectors and trackers take to tick")
+    tick_stats_parser.add_argument("--reset", default=False, action="store_true", dest="reset", help="Reset the tick statistics")
+    tick_stats_parser.set_defaults(func=hummingbot.tick_stats)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
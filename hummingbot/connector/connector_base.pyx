@@ -12,7 +12,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.market_order import MarketOrder
-from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.event_logger import EventLogger, OrderFilledSummary
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
@@ -48,7 +48,12 @@ cdef class ConnectorBase(NetworkIterator):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        event_log_retention = client_config_map.event_log_retention
+        self._event_logger = EventLogger(
+            event_source=self.display_name,
+            max_order_filled_events=event_log_retention.order_filled_events_max_count or None,
+            max_order_filled_age=event_log_retention.order_filled_events_max_age or None,
+        )
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
@@ -139,9 +144,13 @@ cdef class ConnectorBase(NetworkIterator):
         Calculates total asset balance changes from filled orders since the timestamp
         For BUY filled order, the quote balance goes down while the base balance goes up, and for SELL order, it's the
         opposite. This does not account for fee.
+        The balance changes of the whole session are taken from the order fill summaries, so they don't depend on the
+        order fill events retained.
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
+        if starting_timestamp <= 0:
+            return self._order_filled_balances_from_summaries()
         order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
         order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
         balances = {}
@@ -161,6 +170,20 @@ cdef class ConnectorBase(NetworkIterator):
             balances[quote] += quote_value
         return balances
 
+    def _order_filled_balances_from_summaries(self) -> Dict[str, Decimal]:
+        balances = {}
+        for (trading_pair, trade_type), summary in self.order_filled_summaries.items():
+            base, quote = trading_pair.split("-")[0], trading_pair.split("-")[1]
+            if trade_type is TradeType.BUY:
+                base_value = summary.volume
+                quote_value = Decimal("-1") * summary.notional
+            else:
+                base_value = Decimal("-1") * summary.volume
+                quote_value = summary.notional
+            balances[base] = balances.get(base, s_decimal_0) + base_value
+            balances[quote] = balances.get(quote, s_decimal_0) + quote_value
+        return balances
+
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
         """
         Retrieves the Balance Limits for the specified market.
@@ -187,6 +210,20 @@ cdef class ConnectorBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    @property
+    def order_filled_events(self) -> List[OrderFilledEvent]:
+        """
+        The order fill events kept by the connector event logger, oldest first.
+        """
+        return self._event_logger.order_filled_events
+
+    @property
+    def order_filled_summaries(self) -> Dict[Tuple[str, TradeType], OrderFilledSummary]:
+        """
+        Volume, notional, fees and average price of all the order fills of the session per trading pair and side.
+        """
+        return self._event_logger.order_filled_summaries
+
     @property
     def ready(self) -> bool:
         """
@@ -1,4 +1,5 @@
 from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.data_type.common import OrderType
 from hummingbot.core.data_type.in_flight_order import OrderState
 
 EXCHANGE_NAME = "binance_perpetual"
@@ -53,6 +54,14 @@ BINANCE_USER_STREAM_ENDPOINT = "v1/listenKey"
 # Funding Settlement Time Span
 FUNDING_SETTLEMENT_DURATION = (0, 30)  # seconds before snapshot, seconds after snapshot
 
+ORDER_TYPE_MAP = {
+    OrderType.LIMIT: "LIMIT",
+    OrderType.LIMIT_MAKER: "LIMIT",
+    OrderType.MARKET: "MARKET",
+    OrderType.STOP_MARKET: "STOP_MARKET",
+    OrderType.TAKE_PROFIT_MARKET: "TAKE_PROFIT_MARKET",
+}
+
 # Order Statuses
 ORDER_STATE = {
     "NEW": OrderState.OPEN,
@@ -24,7 +24,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -119,7 +119,8 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
         """
         :return a list of OrderType supported by this connector
         """
-        return [OrderType.LIMIT, OrderType.MARKET, OrderType.LIMIT_MAKER]
+        return [OrderType.LIMIT, OrderType.MARKET, OrderType.LIMIT_MAKER, OrderType.STOP_MARKET,
+                OrderType.TAKE_PROFIT_MARKET]
 
     def supported_position_modes(self):
         """
@@ -238,6 +239,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             order_type: OrderType,
             price: Decimal,
             position_action: PositionAction = PositionAction.NIL,
+            trigger_price: Optional[Decimal] = None,
             **kwargs,
     ) -> Tuple[str, float]:
 
@@ -247,7 +249,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
         api_params = {"symbol": symbol,
                       "side": "BUY" if trade_type is TradeType.BUY else "SELL",
                       "quantity": amount_str,
-                      "type": "MARKET" if order_type is OrderType.MARKET else "LIMIT",
+                      "type": CONSTANTS.ORDER_TYPE_MAP[order_type],
                       "newClientOrderId": order_id
                       }
         if order_type.is_limit_type():
@@ -256,11 +258,16 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
         if order_type == OrderType.LIMIT_MAKER:
             api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTX
+        if order_type.is_trigger_type():
+            api_params["stopPrice"] = f"{trigger_price:f}"
         if self._position_mode == PositionMode.HEDGE:
             if position_action == PositionAction.OPEN:
                 api_params["positionSide"] = "LONG" if trade_type is TradeType.BUY else "SHORT"
             else:
                 api_params["positionSide"] = "SHORT" if trade_type is TradeType.BUY else "LONG"
+        elif order_type.is_trigger_type() and position_action == PositionAction.CLOSE:
+            # Binance only accepts reduceOnly in one-way mode, in hedge mode the position side is enough
+            api_params["reduceOnly"] = "true"
         try:
             order_result = await self._api_post(
                 path_url=CONSTANTS.ORDER_URL,
@@ -422,10 +429,15 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
 
             tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
             if tracked_order is not None:
+                new_state = CONSTANTS.ORDER_STATE[order_message["X"]]
+                if tracked_order.order_type.is_trigger_type() and order_message["X"] == "EXPIRED":
+                    # Binance expires a triggered conditional order and reopens it as a market order with the same
+                    # ids, so the order is kept open. The status polling settles the ones that really expired.
+                    new_state = OrderState.OPEN
                 order_update: OrderUpdate = OrderUpdate(
                     trading_pair=tracked_order.trading_pair,
                     update_timestamp=event_message["T"] * 1e-3,
-                    new_state=CONSTANTS.ORDER_STATE[order_message["X"]],
+                    new_state=new_state,
                     client_order_id=client_order_id,
                     exchange_order_id=str(order_message["i"]),
                 )
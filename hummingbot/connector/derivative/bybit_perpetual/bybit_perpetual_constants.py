@@ -30,7 +30,10 @@ POSITION_IDX_HEDGE_SELL = 2
 ORDER_TYPE_MAP = {
     OrderType.LIMIT: "Limit",
     OrderType.MARKET: "Market",
+    OrderType.STOP_MARKET: "Market",
+    OrderType.TAKE_PROFIT_MARKET: "Market",
 }
+CONDITIONAL_ORDER_TRIGGER_BY = "LastPrice"
 
 POSITION_MODE_API_ONEWAY = "MergedSingle"
 POSITION_MODE_API_HEDGE = "BothSide"
@@ -83,6 +86,15 @@ CANCEL_ALL_ACTIVE_ORDERS_PATH_URL = {
 QUERY_ACTIVE_ORDER_PATH_URL = {
     LINEAR_MARKET: "private/linear/order/search",
     NON_LINEAR_MARKET: f"{REST_API_VERSION}/private/order"}
+PLACE_CONDITIONAL_ORDER_PATH_URL = {
+    LINEAR_MARKET: "private/linear/stop-order/create",
+    NON_LINEAR_MARKET: f"{REST_API_VERSION}/private/stop-order/create"}
+CANCEL_CONDITIONAL_ORDER_PATH_URL = {
+    LINEAR_MARKET: "private/linear/stop-order/cancel",
+    NON_LINEAR_MARKET: f"{REST_API_VERSION}/private/stop-order/cancel"}
+QUERY_CONDITIONAL_ORDER_PATH_URL = {
+    LINEAR_MARKET: "private/linear/stop-order/search",
+    NON_LINEAR_MARKET: f"{REST_API_VERSION}/private/stop-order"}
 USER_TRADE_RECORDS_PATH_URL = {
     LINEAR_MARKET: "private/linear/trade/execution/list",
     NON_LINEAR_MARKET: f"{REST_API_VERSION}/private/execution/list"}
@@ -115,7 +127,13 @@ ORDER_STATE = {
     "Cancelled": OrderState.CANCELED,
     "PendingCancel": OrderState.PENDING_CANCEL,
     "Rejected": OrderState.FAILED,
+    # Conditional orders
+    "Untriggered": OrderState.OPEN,
+    "Triggered": OrderState.OPEN,
+    "Active": OrderState.OPEN,
+    "Deactivated": OrderState.CANCELED,
 }
+CONDITIONAL_ORDER_TRIGGERED_STATUS = "Triggered"
 
 GET_LIMIT_ID = "GETLimit"
 POST_LIMIT_ID = "POSTLimit"
@@ -117,7 +117,7 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
         """
         :return a list of OrderType supported by this connector
         """
-        return [OrderType.LIMIT, OrderType.MARKET]
+        return [OrderType.LIMIT, OrderType.MARKET, OrderType.STOP_MARKET, OrderType.TAKE_PROFIT_MARKET]
 
     def supported_position_modes(self) -> List[PositionMode]:
         if all(bybit_utils.is_linear_perpetual(tp) for tp in self._trading_pairs):
@@ -173,12 +173,15 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         data = {"symbol": await self.exchange_symbol_associated_to_pair(tracked_order.trading_pair)}
+        is_conditional = tracked_order.order_type.is_trigger_type()
         if tracked_order.exchange_order_id:
-            data["order_id"] = tracked_order.exchange_order_id
+            data["stop_order_id" if is_conditional else "order_id"] = tracked_order.exchange_order_id
         else:
             data["order_link_id"] = tracked_order.client_order_id
         cancel_result = await self._api_post(
-            path_url=CONSTANTS.CANCEL_ACTIVE_ORDER_PATH_URL,
+            path_url=(CONSTANTS.CANCEL_CONDITIONAL_ORDER_PATH_URL
+                      if is_conditional
+                      else CONSTANTS.CANCEL_ACTIVE_ORDER_PATH_URL),
             data=data,
             is_auth_required=True,
             trading_pair=tracked_order.trading_pair,
@@ -202,6 +205,7 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
         order_type: OrderType,
         price: Decimal,
         position_action: PositionAction = PositionAction.NIL,
+        trigger_price: Optional[Decimal] = None,
         **kwargs,
     ) -> Tuple[str, float]:
         position_idx = self._get_position_idx(trade_type, position_action)
@@ -218,9 +222,16 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
         }
         if order_type.is_limit_type():
             data["price"] = float(price)
+        if order_type.is_trigger_type():
+            # Bybit infers the trigger direction from the base price
+            data["stop_px"] = float(trigger_price)
+            data["base_price"] = float(self.get_price(trading_pair, trade_type == TradeType.BUY))
+            data["trigger_by"] = CONSTANTS.CONDITIONAL_ORDER_TRIGGER_BY
 
         resp = await self._api_post(
-            path_url=CONSTANTS.PLACE_ACTIVE_ORDER_PATH_URL,
+            path_url=(CONSTANTS.PLACE_CONDITIONAL_ORDER_PATH_URL
+                      if order_type.is_trigger_type()
+                      else CONSTANTS.PLACE_ACTIVE_ORDER_PATH_URL),
             data=data,
             is_auth_required=True,
             trading_pair=trading_pair,
@@ -232,7 +243,8 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
             formatted_ret_code = self._format_ret_code_for_print(resp['ret_code'])
             raise IOError(f"Error submitting order {order_id}: {formatted_ret_code} - {resp['ret_msg']}")
 
-        return str(resp["result"]["order_id"]), self.current_timestamp
+        exchange_order_id = resp["result"]["stop_order_id" if order_type.is_trigger_type() else "order_id"]
+        return str(exchange_order_id), self.current_timestamp
 
     def _get_position_idx(self, trade_type: TradeType, position_action: PositionAction) -> int:
         if position_action == PositionAction.NIL:
@@ -503,7 +515,7 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
                 update_timestamp=self.current_timestamp,
                 new_state=CONSTANTS.ORDER_STATE[order_msg["order_status"]],
                 client_order_id=client_order_id,
-                exchange_order_id=order_msg["order_id"],
+                exchange_order_id=order_msg.get("order_id", order_msg.get("stop_order_id")),
             )
 
             return order_update
@@ -527,7 +539,18 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
             "symbol": exchange_symbol,
             "order_link_id": tracked_order.client_order_id
         }
-        if tracked_order.exchange_order_id is not None:
+        if tracked_order.order_type.is_trigger_type():
+            resp = await self._api_get(
+                path_url=CONSTANTS.QUERY_CONDITIONAL_ORDER_PATH_URL,
+                params=query_params,
+                is_auth_required=True,
+                trading_pair=tracked_order.trading_pair,
+            )
+            conditional_order_status = (resp.get("result") or {}).get("order_status")
+            if conditional_order_status != CONSTANTS.CONDITIONAL_ORDER_TRIGGERED_STATUS:
+                return resp
+            # Once triggered the conditional order is executed as an active order with the same order link id
+        elif tracked_order.exchange_order_id is not None:
             query_params["order_id"] = tracked_order.exchange_order_id
 
         resp = await self._api_get(
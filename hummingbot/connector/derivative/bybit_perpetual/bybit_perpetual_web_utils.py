@@ -321,6 +321,36 @@ def _build_private_pair_specific_non_linear_rate_limits(trading_pair: str) -> Li
             linked_limits=[LinkedLimitWeightPair(CONSTANTS.GET_LIMIT_ID),
                            LinkedLimitWeightPair(pair_specific_non_linear_private_bucket_600_limit_id)],
         ),
+        RateLimit(
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.PLACE_CONDITIONAL_ORDER_PATH_URL[CONSTANTS.NON_LINEAR_MARKET],
+                trading_pair=trading_pair,
+            ),
+            limit=100,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_non_linear_private_bucket_100_limit_id)],
+        ),
+        RateLimit(
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.CANCEL_CONDITIONAL_ORDER_PATH_URL[CONSTANTS.NON_LINEAR_MARKET],
+                trading_pair=trading_pair,
+            ),
+            limit=100,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_non_linear_private_bucket_100_limit_id)],
+        ),
+        RateLimit(
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.QUERY_CONDITIONAL_ORDER_PATH_URL[CONSTANTS.NON_LINEAR_MARKET],
+                trading_pair=trading_pair,
+            ),
+            limit=600,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.GET_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_non_linear_private_bucket_600_limit_id)],
+        ),
         RateLimit(
             limit_id=get_pair_specific_limit_id(
                 base_limit_id=CONSTANTS.USER_TRADE_RECORDS_PATH_URL[CONSTANTS.NON_LINEAR_MARKET],
@@ -419,6 +449,33 @@ def _build_private_pair_specific_linear_rate_limits(trading_pair: str) -> List[R
             linked_limits=[LinkedLimitWeightPair(CONSTANTS.GET_LIMIT_ID),
                            LinkedLimitWeightPair(pair_specific_linear_private_bucket_600_limit_id)],
         ),
+        RateLimit(
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.PLACE_CONDITIONAL_ORDER_PATH_URL[CONSTANTS.LINEAR_MARKET], trading_pair=trading_pair
+            ),
+            limit=100,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_linear_private_bucket_100_limit_id)],
+        ),
+        RateLimit(
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.CANCEL_CONDITIONAL_ORDER_PATH_URL[CONSTANTS.LINEAR_MARKET], trading_pair=trading_pair
+            ),
+            limit=100,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_linear_private_bucket_100_limit_id)],
+        ),
+        RateLimit(
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.QUERY_CONDITIONAL_ORDER_PATH_URL[CONSTANTS.LINEAR_MARKET], trading_pair=trading_pair
+            ),
+            limit=600,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.GET_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_linear_private_bucket_600_limit_id)],
+        ),
         RateLimit(
             limit_id=get_pair_specific_limit_id(
                 base_limit_id=CONSTANTS.USER_TRADE_RECORDS_PATH_URL[CONSTANTS.LINEAR_MARKET], trading_pair=trading_pair
@@ -2,6 +2,7 @@ from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string
 from libcpp.unordered_map cimport unordered_map
 from libcpp.utility cimport pair
+from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.LimitOrder cimport LimitOrder as CPPLimitOrder
 from hummingbot.core.data_type.OrderExpirationEntry cimport OrderExpirationEntry as CPPOrderExpirationEntry
@@ -40,6 +41,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
         str _exchange_name
+        bint _has_new_limit_orders
+        bint _queue_position_matching
+        dict _queue_ahead
+        dict _filled_amounts
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -61,20 +66,36 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=*)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef c_fill_crossed_limit_orders_from_depth(self,
+                                                bint is_buy,
+                                                LimitOrders *limit_orders_map_ptr,
+                                                LimitOrdersIterator *map_it_ptr,
+                                                vector[SingleTradingPairLimitOrdersIterator] process_order_its)
+    cdef c_match_trade_to_limit_orders_by_queue(self,
+                                                bint is_maker_buy,
+                                                LimitOrders *limit_orders_map_ptr,
+                                                LimitOrdersIterator *map_it_ptr,
+                                                object trade_price,
+                                                object trade_quantity)
+    cdef object c_get_remaining_amount(self, const CPPLimitOrder *cpp_limit_order_ptr)
+    cdef object c_get_level_amount(self, str trading_pair, bint is_bid, object price)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
@@ -50,6 +50,7 @@ if TYPE_CHECKING:
 
 ptm_logger = None
 s_decimal_0 = Decimal(0)
+NaN = float("nan")
 
 
 cdef class QuantizationParams:
@@ -168,6 +169,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._queued_orders = deque()
+        self._has_new_limit_orders = False
+        self._queue_position_matching = client_config_map.paper_trade.paper_trade_queue_position_matching
+        self._queue_ahead = {}
+        self._filled_amounts = {}
         self._quantization_params = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
@@ -238,6 +243,18 @@ cdef class PaperTradeExchange(ExchangeBase):
         else:
             return False
 
+    @property
+    def queue_position_matching(self) -> bool:
+        """
+        When enabled limit orders are only filled by public trades after the volume estimated ahead of them at their
+        price level has traded, and fills are partial and limited by the traded amount or the crossed depth.
+        """
+        return self._queue_position_matching
+
+    @queue_position_matching.setter
+    def queue_position_matching(self, value: bool):
+        self._queue_position_matching = value
+
     @property
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
@@ -278,17 +295,19 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            quantity = limit_order.quantity - self._filled_amounts.get(limit_order.client_order_id, s_decimal_0)
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += quantity
         return _on_hold_balances
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
         _available_balances = self._account_balances.copy()
+        on_hold_balances = self.on_hold_balances
         for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
+            _available_balances[trading_pair_str] -= on_hold_balances[trading_pair_str]
         return _available_balances
 
     # </editor-fold>
@@ -319,6 +338,15 @@ cdef class PaperTradeExchange(ExchangeBase):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
         self.c_process_crossed_limit_orders()
+        self._has_new_limit_orders = False
+
+    def next_event_timestamp(self) -> float:
+        # New limit orders may already cross the book, queued market orders execute after the execution delay
+        if self._has_new_limit_orders:
+            return self._current_timestamp
+        if len(self._queued_orders) > 0:
+            return self._queued_orders[0].timestamp + self.TRADE_EXECUTION_DELAY
+        return NaN
 
     cdef str c_buy(self,
                    str trading_pair_str,
@@ -370,6 +398,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self._has_new_limit_orders = True
+            if self._queue_position_matching:
+                self._queue_ahead[order_id] = self.c_get_level_amount(trading_pair_str, True, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -430,6 +461,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self._has_new_limit_orders = True
+            if self._queue_position_matching:
+                self._queue_ahead[order_id] = self.c_get_level_amount(trading_pair_str, False, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -628,7 +662,10 @@ cdef class PaperTradeExchange(ExchangeBase):
                               const SingleTradingPairLimitOrdersIterator orders_it):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            str order_id = deref(orders_it).getClientOrderID().decode("utf8")
         try:
+            self._queue_ahead.pop(order_id, None)
+            self._filled_amounts.pop(order_id, None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -640,7 +677,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -649,15 +687,21 @@ cdef class PaperTradeExchange(ExchangeBase):
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object amount = <object> cpp_limit_order_ptr.getQuantity()
             object price = <object> cpp_limit_order_ptr.getPrice()
+            object remaining_amount = self.c_get_remaining_amount(cpp_limit_order_ptr)
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            bint is_completed
+
+        if fill_amount is None or fill_amount > remaining_amount:
+            fill_amount = remaining_amount
+        is_completed = fill_amount == remaining_amount
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
             is_maker=True,
             order_type=OrderType.LIMIT,
             order_side=TradeType.BUY,
-            amount=amount,
+            amount=fill_amount,
             price=price,
             from_total_balances=True
         )
@@ -700,7 +744,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             price=Decimal("0"),
         )
 
-        # Emit the trade and order completed events.
+        # Emit the trade event, and the order completed event once the order is fully filled.
         self.c_trigger_event(
             self.ORDER_FILLED_EVENT_TAG,
             OrderFilledEvent(
@@ -709,12 +753,31 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                fill_amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if not is_completed:
+            self._filled_amounts[order_id] = amount - remaining_amount + fill_amount
+            return
+
+        if remaining_amount < amount:
+            # The completed event reports the whole order, including the earlier partial fills
+            order_candidate = OrderCandidate(
+                trading_pair=trading_pair_str,
+                is_maker=True,
+                order_type=OrderType.LIMIT,
+                order_side=TradeType.BUY,
+                amount=amount,
+                price=price,
+                from_total_balances=True
+            )
+            adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+            paid_amount = adjusted_order_candidate.order_collateral.amount
+            acquired_amount = adjusted_order_candidate.potential_returns.amount
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -731,7 +794,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -740,8 +804,14 @@ cdef class PaperTradeExchange(ExchangeBase):
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object amount = <object> cpp_limit_order_ptr.getQuantity()
             object price = <object> cpp_limit_order_ptr.getPrice()
+            object remaining_amount = self.c_get_remaining_amount(cpp_limit_order_ptr)
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            bint is_completed
+
+        if fill_amount is None or fill_amount > remaining_amount:
+            fill_amount = remaining_amount
+        is_completed = fill_amount == remaining_amount
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -749,7 +819,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             is_maker=True,
             order_type=OrderType.LIMIT,
             order_side=TradeType.SELL,
-            amount=amount,
+            amount=fill_amount,
             price=price,
             from_total_balances=True
         )
@@ -791,7 +861,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             price=Decimal("0"),
         )
 
-        # Emit the trade and order completed events.
+        # Emit the trade event, and the order completed event once the order is fully filled.
         self.c_trigger_event(
             self.ORDER_FILLED_EVENT_TAG,
             OrderFilledEvent(
@@ -800,12 +870,31 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                fill_amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if not is_completed:
+            self._filled_amounts[order_id] = amount - remaining_amount + fill_amount
+            return
+
+        if remaining_amount < amount:
+            # The completed event reports the whole order, including the earlier partial fills
+            order_candidate = OrderCandidate(
+                trading_pair=trading_pair_str,
+                is_maker=True,
+                order_type=OrderType.LIMIT,
+                order_side=TradeType.SELL,
+                amount=amount,
+                price=price,
+                from_total_balances=True
+            )
+            adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+            sold_amount = adjusted_order_candidate.order_collateral.amount
+            acquired_amount = adjusted_order_candidate.potential_returns.amount
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -823,12 +912,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -869,9 +959,82 @@ cdef class PaperTradeExchange(ExchangeBase):
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
+        if self._queue_position_matching:
+            self.c_fill_crossed_limit_orders_from_depth(is_buy, limit_orders_map_ptr, map_it_ptr, process_order_its)
+            return
+
         for orders_it in process_order_its:
             self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
+    cdef c_fill_crossed_limit_orders_from_depth(self,
+                                                bint is_buy,
+                                                LimitOrders *limit_orders_map_ptr,
+                                                LimitOrdersIterator *map_it_ptr,
+                                                vector[SingleTradingPairLimitOrdersIterator] process_order_its):
+        """
+        Fill crossed limit orders, best price first, only up to the opposite side depth available at their prices.
+        The consumed depth is recorded in the composite order book, so it is not used again until the book is updated.
+
+        :param is_buy: are the limit orders on the bid side?
+        :param limit_orders_map_ptr: pointer to the limit orders map
+        :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
+        :param process_order_its: the crossed limit orders, best price first
+        """
+        cdef:
+            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
+            object order_book = self.c_get_order_book(trading_pair)
+            SingleTradingPairLimitOrdersIterator orders_it
+            vector[SingleTradingPairLimitOrdersIterator] fill_order_its
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            list levels = []
+            list consumed_levels = []
+            list fill_amounts = []
+            int level_index = 0
+            size_t i
+
+        if process_order_its.empty():
+            return
+
+        best_price = <object> address(deref(process_order_its[0])).getPrice()
+        for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+            level_price = Decimal(str(row.price))
+            if (is_buy and level_price > best_price) or (not is_buy and level_price < best_price):
+                break
+            levels.append([row.price, level_price, Decimal(str(row.amount))])
+
+        for orders_it in process_order_its:
+            cpp_limit_order_ptr = address(deref(orders_it))
+            price = <object> cpp_limit_order_ptr.getPrice()
+            remaining_amount = self.c_get_remaining_amount(cpp_limit_order_ptr)
+            fill_amount = s_decimal_0
+            while fill_amount < remaining_amount and level_index < len(levels):
+                level = levels[level_index]
+                if (is_buy and level[1] > price) or (not is_buy and level[1] < price):
+                    break
+                taken_amount = min(level[2], remaining_amount - fill_amount)
+                fill_amount += taken_amount
+                level[2] -= taken_amount
+                consumed_levels.append((level[0], taken_amount))
+                if level[2] <= s_decimal_0:
+                    level_index += 1
+            if fill_amount > s_decimal_0:
+                fill_order_its.push_back(orders_it)
+                fill_amounts.append(fill_amount)
+
+        for level_price, taken_amount in consumed_levels:
+            order_book.record_filled_order(OrderFilledEvent(
+                self._current_timestamp,
+                "",
+                trading_pair,
+                TradeType.BUY if is_buy else TradeType.SELL,
+                OrderType.LIMIT,
+                level_price,
+                taken_amount,
+                None))
+
+        for i in range(fill_order_its.size()):
+            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, fill_order_its[i], fill_amounts[i])
+
     cdef c_process_crossed_limit_orders(self):
         cdef:
             LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
@@ -915,6 +1078,14 @@ cdef class PaperTradeExchange(ExchangeBase):
         if map_it == limit_orders_map_ptr.end():
             return
 
+        if self._queue_position_matching:
+            self.c_match_trade_to_limit_orders_by_queue(is_maker_buy,
+                                                        limit_orders_map_ptr,
+                                                        address(map_it),
+                                                        Decimal(str(trade_price)),
+                                                        Decimal(str(trade_quantity)))
+            return
+
         orders_collection_ptr = address(deref(map_it).second)
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
@@ -937,6 +1108,89 @@ cdef class PaperTradeExchange(ExchangeBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+    cdef c_match_trade_to_limit_orders_by_queue(self,
+                                                bint is_maker_buy,
+                                                LimitOrders *limit_orders_map_ptr,
+                                                LimitOrdersIterator *map_it_ptr,
+                                                object trade_price,
+                                                object trade_quantity):
+        """
+        Fill limit orders from a public trade, best price first. Orders priced better than the trade are filled
+        directly, orders at the trade price only with the traded amount left after the volume estimated ahead of them.
+        Every fill is taken from the trade amount, so a trade never fills more than its own size.
+
+        :param is_maker_buy: are the limit orders on the bid side?
+        :param limit_orders_map_ptr: pointer to the limit orders map
+        :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
+        :param trade_price: the public trade price
+        :param trade_quantity: the public trade amount
+        """
+        cdef:
+            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            SingleTradingPairLimitOrdersIterator orders_it
+            SingleTradingPairLimitOrdersRIterator orders_rit
+            vector[SingleTradingPairLimitOrdersIterator] touched_order_its
+            vector[SingleTradingPairLimitOrdersIterator] fill_order_its
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            list fill_amounts = []
+            object remaining_trade_amount = trade_quantity
+            object level_amount = None
+            object level_filled_amount = s_decimal_0
+            size_t i
+
+        if is_maker_buy:
+            orders_rit = orders_collection_ptr.rbegin()
+            while orders_rit != orders_collection_ptr.rend():
+                if <object>address(deref(orders_rit)).getPrice() < trade_price:
+                    break
+                touched_order_its.push_back(getIteratorFromReverseIterator(
+                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                inc(orders_rit)
+        else:
+            orders_it = orders_collection_ptr.begin()
+            while orders_it != orders_collection_ptr.end():
+                if <object>address(deref(orders_it)).getPrice() > trade_price:
+                    break
+                touched_order_its.push_back(orders_it)
+                inc(orders_it)
+
+        for orders_it in touched_order_its:
+            if remaining_trade_amount <= s_decimal_0:
+                break
+            cpp_limit_order_ptr = address(deref(orders_it))
+            order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            remaining_amount = self.c_get_remaining_amount(cpp_limit_order_ptr)
+            if <object>cpp_limit_order_ptr.getPrice() == trade_price:
+                # The trade reaches this level with the amount left by the better priced orders. The volume queued
+                # ahead can only have shrunk since the order was placed, if the book shows less at that level.
+                if level_amount is None:
+                    level_amount = self.c_get_level_amount(trading_pair, is_maker_buy, trade_price)
+                queue_ahead = min(self._queue_ahead.get(order_id, level_amount), level_amount)
+                self._queue_ahead[order_id] = max(queue_ahead - remaining_trade_amount, s_decimal_0)
+                fill_amount = min(remaining_amount,
+                                  max(remaining_trade_amount - queue_ahead - level_filled_amount, s_decimal_0))
+                level_filled_amount += fill_amount
+            else:
+                fill_amount = min(remaining_amount, remaining_trade_amount)
+                remaining_trade_amount -= fill_amount
+            if fill_amount > s_decimal_0:
+                fill_order_its.push_back(orders_it)
+                fill_amounts.append(fill_amount)
+
+        for i in range(fill_order_its.size()):
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, map_it_ptr, fill_order_its[i],
+                                       fill_amounts[i])
+
+    cdef object c_get_remaining_amount(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        return (<object> cpp_limit_order_ptr.getQuantity() -
+                self._filled_amounts.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"), s_decimal_0))
+
+    cdef object c_get_level_amount(self, str trading_pair, bint is_bid, object price):
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+        return Decimal(str(order_book.c_get_amount_at_price(is_bid, float(price))))
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
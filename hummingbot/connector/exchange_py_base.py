@@ -269,8 +269,9 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         :param trading_pair: the token pair to operate with
         :param amount: the order amount
-        :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
+        :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER, STOP_MARKET, TAKE_PROFIT_MARKET)
         :param price: the order price
+        :param trigger_price: (trigger order types only) pass it as keyword argument
 
         :return: the id assigned by the connector to the order (the client id)
         """
@@ -300,8 +301,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         Creates a promise to create a sell order using the parameters.
         :param trading_pair: the token pair to operate with
         :param amount: the order amount
-        :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
+        :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER, STOP_MARKET, TAKE_PROFIT_MARKET)
         :param price: the order price
+        :param trigger_price: (trigger order types only) pass it as keyword argument
         :return: the id assigned by the connector to the order (the client id)
         """
         order_id = get_new_client_order_id(
@@ -396,6 +398,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                             amount: Decimal,
                             order_type: OrderType,
                             price: Optional[Decimal] = None,
+                            trigger_price: Optional[Decimal] = None,
                             **kwargs):
         """
         Creates an order in the exchange using the parameters to configure it
@@ -404,13 +407,18 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_id: the id that should be assigned to the order (the client id)
         :param trading_pair: the token pair to operate with
         :param amount: the order amount
-        :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
+        :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER, STOP_MARKET, TAKE_PROFIT_MARKET)
         :param price: the order price
+        :param trigger_price: the price that triggers the order (only for STOP_MARKET and TAKE_PROFIT_MARKET orders)
         """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
             price = self.quantize_order_price(trading_pair, price)
+        if order_type.is_trigger_type() and trigger_price is not None and not trigger_price.is_nan():
+            trigger_price = self.quantize_order_price(trading_pair, trigger_price)
+        else:
+            trigger_price = None
         quantized_amount = self.quantize_order_amount(trading_pair=trading_pair, amount=amount)
 
         self.start_tracking_order(
@@ -421,10 +429,13 @@ class ExchangePyBase(ExchangeBase, ABC):
             trade_type=trade_type,
             price=price,
             amount=quantized_amount,
+            trigger_price=trigger_price,
             **kwargs,
         )
         order = self._order_tracker.active_orders[order_id]
-        if not price or price.is_nan() or price == s_decimal_0:
+        if trigger_price is not None:
+            notional_size = trigger_price * quantized_amount
+        elif not price or price.is_nan() or price == s_decimal_0:
             current_price: Decimal = self.get_price(trading_pair, False)
             notional_size = current_price * quantized_amount
         else:
@@ -435,6 +446,11 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
             return
 
+        elif order_type.is_trigger_type() and trigger_price is None:
+            self.logger().error(f"{order_type} orders require a trigger price")
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            return
+
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
@@ -466,6 +482,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
+        if order.trigger_price is not None:
+            kwargs["trigger_price"] = order.trigger_price
         exchange_order_id, update_timestamp = await self._place_order(
             order_id=order.client_order_id,
             trading_pair=order.trading_pair,
@@ -586,6 +604,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                              price: Decimal,
                              amount: Decimal,
                              order_type: OrderType,
+                             trigger_price: Optional[Decimal] = None,
                              **kwargs):
         """
         Starts tracking an order by adding it to the order tracker.
@@ -596,7 +615,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param trade_type: the type of order (buy or sell)
         :param price: the price for the order
         :param amount: the amount for the order
-        :param order_type: type of execution for the order (MARKET, LIMIT, LIMIT_MAKER)
+        :param order_type: type of execution for the order (MARKET, LIMIT, LIMIT_MAKER, STOP_MARKET, TAKE_PROFIT_MARKET)
+        :param trigger_price: the price that triggers the order, for trigger order types
         """
         self._order_tracker.start_tracking_order(
             InFlightOrder(
@@ -607,7 +627,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 trade_type=trade_type,
                 amount=amount,
                 price=price,
-                creation_timestamp=self.current_timestamp
+                creation_timestamp=self.current_timestamp,
+                trigger_price=trigger_price,
             )
         )
 
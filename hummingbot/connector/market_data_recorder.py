@@ -0,0 +1,228 @@
+import asyncio
+import functools
+import glob
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.logger import HummingbotLogger
+
+TRADE_RECORD_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("price", np.float64),
+    ("amount", np.float64),
+    ("is_buy", np.bool_),
+])
+
+
+def snapshot_record_dtype(depth: int) -> np.dtype:
+    return np.dtype([
+        ("timestamp", np.float64),
+        ("bid_price", np.float64, (depth,)),
+        ("bid_amount", np.float64, (depth,)),
+        ("ask_price", np.float64, (depth,)),
+        ("ask_amount", np.float64, (depth,)),
+    ])
+
+
+def market_data_dir() -> str:
+    return os.path.join(data_path(), "market_data")
+
+
+def _day_of(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y%m%d")
+
+
+def _pair_dir(data_dir: str, exchange: str, trading_pair: str) -> str:
+    return os.path.join(data_dir, exchange, trading_pair)
+
+
+def _snapshots_file_name(day: str, depth: int) -> str:
+    return f"{day}_depth_{depth}.bin"
+
+
+def _trades_file_name(day: str) -> str:
+    return f"{day}_trades.bin"
+
+
+class MarketDataRecorder:
+    """
+    Records top-N order book snapshots and public trades into append-only binary files of fixed size NumPy
+    records, one file per exchange, trading pair, record type and UTC day:
+
+        <data_dir>/<exchange>/<trading_pair>/<YYYYMMDD>_depth_<N>.bin
+        <data_dir>/<exchange>/<trading_pair>/<YYYYMMDD>_trades.bin
+
+    Records are buffered in memory and written from an executor thread when `flush` is awaited, so the event
+    loop never blocks on disk I/O. Use `read_order_book_snapshots` and `read_public_trades` to load them back.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 markets: List[ConnectorBase],
+                 depth: int,
+                 data_dir: Optional[str] = None):
+        self._markets: List[ConnectorBase] = markets
+        self._depth: int = depth
+        self._data_dir: str = data_dir or market_data_dir()
+        self._snapshot_dtype: np.dtype = snapshot_record_dtype(depth)
+        self._snapshots: Dict[Tuple[str, str], List[tuple]] = defaultdict(list)
+        self._trades: Dict[Tuple[str, str], List[tuple]] = defaultdict(list)
+        self._trade_forwarders: Dict[str, EventForwarder] = {}
+        self._subscribed_order_books: Dict[Tuple[str, str], OrderBook] = {}
+
+    @property
+    def data_dir(self) -> str:
+        return self._data_dir
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def record_snapshots(self, timestamp: float):
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                order_book = market.get_order_book(trading_pair)
+                self._subscribe_to_trades(exchange, trading_pair, order_book)
+                self._snapshots[(exchange, trading_pair)].append(self._snapshot_record(timestamp, order_book))
+
+    def stop(self):
+        """
+        Stops recording the public trades and writes the records buffered since the last flush. The records are
+        written synchronously, so nothing is lost when the application shuts down.
+        """
+        for (exchange, trading_pair), order_book in self._subscribed_order_books.items():
+            order_book.remove_listener(OrderBookEvent.TradeEvent, self._trade_forwarders[exchange])
+        self._subscribed_order_books.clear()
+        snapshots, trades = self._take_buffered_records()
+        if len(snapshots) > 0 or len(trades) > 0:
+            self._write(snapshots, trades)
+
+    async def flush(self):
+        snapshots, trades = self._take_buffered_records()
+        if len(snapshots) == 0 and len(trades) == 0:
+            return
+        await asyncio.get_event_loop().run_in_executor(None, self._write, snapshots, trades)
+
+    def _take_buffered_records(self) -> Tuple[Dict[Tuple[str, str], List[tuple]], Dict[Tuple[str, str], List[tuple]]]:
+        snapshots, self._snapshots = self._snapshots, defaultdict(list)
+        trades, self._trades = self._trades, defaultdict(list)
+        return snapshots, trades
+
+    def _snapshot_record(self, timestamp: float, order_book: OrderBook) -> tuple:
+        bid_price = np.full(self._depth, np.nan)
+        bid_amount = np.full(self._depth, np.nan)
+        ask_price = np.full(self._depth, np.nan)
+        ask_amount = np.full(self._depth, np.nan)
+        for i, row in enumerate(islice(order_book.bid_entries(), self._depth)):
+            bid_price[i] = row.price
+            bid_amount[i] = row.amount
+        for i, row in enumerate(islice(order_book.ask_entries(), self._depth)):
+            ask_price[i] = row.price
+            ask_amount[i] = row.amount
+        return timestamp, bid_price, bid_amount, ask_price, ask_amount
+
+    def _subscribe_to_trades(self, exchange: str, trading_pair: str, order_book: OrderBook):
+        if self._subscribed_order_books.get((exchange, trading_pair)) is order_book:
+            return
+        if exchange not in self._trade_forwarders:
+            self._trade_forwarders[exchange] = EventForwarder(functools.partial(self._did_trade, exchange))
+        order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_forwarders[exchange])
+        self._subscribed_order_books[(exchange, trading_pair)] = order_book
+
+    def _did_trade(self, exchange: str, event: OrderBookTradeEvent):
+        self._trades[(exchange, event.trading_pair)].append(
+            (event.timestamp, float(event.price), float(event.amount), event.type == TradeType.BUY))
+
+    def _write(self, snapshots: Dict[Tuple[str, str], List[tuple]], trades: Dict[Tuple[str, str], List[tuple]]):
+        try:
+            for (exchange, trading_pair), records in snapshots.items():
+                self._append_by_day(exchange, trading_pair, records, self._snapshot_dtype,
+                                    functools.partial(_snapshots_file_name, depth=self._depth))
+            for (exchange, trading_pair), records in trades.items():
+                self._append_by_day(exchange, trading_pair, records, TRADE_RECORD_DTYPE, _trades_file_name)
+        except Exception:
+            self.logger().error("Unexpected error while writing market data files.", exc_info=True)
+
+    def _append_by_day(self, exchange: str, trading_pair: str, records: List[tuple], dtype: np.dtype, file_name):
+        array = np.array(records, dtype=dtype)
+        days = np.array([_day_of(ts) for ts in array["timestamp"]])
+        pair_dir = _pair_dir(self._data_dir, exchange, trading_pair)
+        os.makedirs(pair_dir, exist_ok=True)
+        for day in np.unique(days):
+            with open(os.path.join(pair_dir, file_name(day)), "ab") as f:
+                array[days == day].tofile(f)
+
+
+def _read_records(paths: List[str],
+                  dtype: np.dtype,
+                  start: Optional[float],
+                  end: Optional[float]) -> Dict[str, np.ndarray]:
+    if len(paths) > 0:
+        records = np.concatenate([np.fromfile(path, dtype=dtype) for path in sorted(paths)])
+    else:
+        records = np.empty(0, dtype=dtype)
+    mask = np.ones(len(records), dtype=bool)
+    if start is not None:
+        mask &= records["timestamp"] >= start
+    if end is not None:
+        mask &= records["timestamp"] <= end
+    records = records[mask]
+    return {name: np.ascontiguousarray(records[name]) for name in dtype.names}
+
+
+def _paths_in_range(pair_dir: str, pattern: str, start: Optional[float], end: Optional[float]) -> List[str]:
+    first_day = _day_of(start) if start is not None else None
+    last_day = _day_of(end) if end is not None else None
+    paths = []
+    for path in glob.glob(os.path.join(pair_dir, pattern)):
+        day = os.path.basename(path)[:8]
+        if (first_day is None or day >= first_day) and (last_day is None or day <= last_day):
+            paths.append(path)
+    return paths
+
+
+def read_order_book_snapshots(exchange: str,
+                              trading_pair: str,
+                              depth: int,
+                              start: Optional[float] = None,
+                              end: Optional[float] = None,
+                              data_dir: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Returns the recorded snapshots as columns: timestamp (n,), bid_price, bid_amount, ask_price and
+    ask_amount (n, depth). Missing levels are NaN.
+    """
+    pair_dir = _pair_dir(data_dir or market_data_dir(), exchange, trading_pair)
+    paths = _paths_in_range(pair_dir, _snapshots_file_name("*", depth), start, end)
+    return _read_records(paths, snapshot_record_dtype(depth), start, end)
+
+
+def read_public_trades(exchange: str,
+                       trading_pair: str,
+                       start: Optional[float] = None,
+                       end: Optional[float] = None,
+                       data_dir: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Returns the recorded public trades as columns: timestamp, price, amount and is_buy.
+    """
+    pair_dir = _pair_dir(data_dir or market_data_dir(), exchange, trading_pair)
+    paths = _paths_in_range(pair_dir, _trades_file_name("*"), start, end)
+    return _read_records(paths, TRADE_RECORD_DTYPE, start, end)
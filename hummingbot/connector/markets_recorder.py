@@ -5,8 +5,9 @@ import os.path
 import threading
 import time
 from decimal import Decimal
+from itertools import islice
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -14,6 +15,7 @@ from sqlalchemy.orm import Query, Session
 from hummingbot import data_path
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.market_data_recorder import MarketDataRecorder
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -39,6 +41,7 @@ from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_order_state import MarketOrderState
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
@@ -46,6 +49,7 @@ from hummingbot.model.range_position_collected_fees import RangePositionCollecte
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_performance import TradePerformance
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
@@ -57,6 +61,10 @@ class MarketsRecorder:
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
+    # Market states changes within this delay (in seconds) are saved together
+    MARKET_STATES_SAVE_DELAY = 0.5
+    # Maximum number of values in an IN clause, SQLite limits the number of bound variables of a statement
+    SQL_IN_CLAUSE_MAX_SIZE = 500
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -86,6 +94,16 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_recorder: Optional[MarketDataRecorder] = None
+        # Tracking states of each config file and market as they are saved in the database
+        self._saved_tracking_states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._pending_market_states: Dict[str, ConnectorBase] = {}
+        self._save_market_states_handle: Optional[asyncio.TimerHandle] = None
+        if market_data_collection.market_data_collection_columnar:
+            self._market_data_recorder = MarketDataRecorder(
+                markets=markets,
+                depth=market_data_collection.market_data_collection_depth,
+            )
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -132,7 +150,11 @@ class MarketsRecorder:
     async def _record_market_data(self):
         while True:
             try:
-                if all(ex.ready for ex in self._markets):
+                if self._market_data_recorder is not None:
+                    if all(ex.ready for ex in self._markets):
+                        self._market_data_recorder.record_snapshots(time.time())
+                        await self._market_data_recorder.flush()
+                elif all(ex.ready for ex in self._markets):
                     with self._sql_manager.get_new_session() as session:
                         with session.begin():
                             for market in self._markets:
@@ -151,8 +173,8 @@ class MarketsRecorder:
                                         best_bid=best_bid,
                                         best_ask=best_ask,
                                         order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
+                                            "bid": list(islice(order_book.bid_entries(), depth)),
+                                            "ask": list(islice(order_book.ask_entries(), depth))}
                                     )
                                     session.add(market_data)
             except asyncio.CancelledError:
@@ -191,6 +213,11 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.stop()
+        if self._save_market_states_handle is not None:
+            self._save_market_states_handle.cancel()
+            self._save_pending_market_states()
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -257,25 +284,124 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
-
-        if market_states is not None:
-            market_states.saved_state = market.tracking_states
-            market_states.timestamp = timestamp
-        else:
-            market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
-                                        timestamp=timestamp,
-                                        saved_state=market.tracking_states)
-            session.add(market_states)
+        """
+        Saves the tracking states of the market as one row per order. Only the orders whose state changed since the
+        last save are written, and the rows of the orders that are not tracked anymore are deleted.
+        """
+        key: Tuple[str, str] = (config_file_path, market.display_name)
+        saved_states: Optional[Dict[str, Any]] = self._saved_tracking_states.get(key)
+        if saved_states is None:
+            saved_states = {}
+            for order_state in self.get_market_order_states(config_file_path, market, session=session):
+                if order_state.saved_state is None:
+                    # Tombstone left by a previous version
+                    session.delete(order_state)
+                else:
+                    saved_states[order_state.order_id] = order_state.saved_state
+            # The orders are not saved in the market state anymore
+            market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+            if market_states is not None:
+                session.delete(market_states)
+
+        tracking_states: Dict[str, Any] = market.tracking_states
+        changed_states: Dict[str, Any] = {order_id: state for order_id, state in tracking_states.items()
+                                          if saved_states.get(order_id) != state}
+        removed_order_ids: List[str] = [order_id for order_id in saved_states if order_id not in tracking_states]
+
+        if len(changed_states) > 0:
+            timestamp: int = self.db_timestamp
+            order_states: Dict[str, MarketOrderState] = {
+                order_state.order_id: order_state
+                for order_state in self.get_market_order_states(
+                    config_file_path,
+                    market,
+                    session=session,
+                    order_ids=[order_id for order_id in changed_states if order_id in saved_states])
+            }
+            for order_id, state in changed_states.items():
+                order_state: Optional[MarketOrderState] = order_states.get(order_id)
+                if order_state is not None:
+                    order_state.saved_state = state
+                    order_state.timestamp = timestamp
+                else:
+                    session.add(MarketOrderState(config_file_path=config_file_path,
+                                                 market=market.display_name,
+                                                 order_id=order_id,
+                                                 timestamp=timestamp,
+                                                 saved_state=state))
+        for i in range(0, len(removed_order_ids), self.SQL_IN_CLAUSE_MAX_SIZE):
+            (session
+             .query(MarketOrderState)
+             .filter(MarketOrderState.config_file_path == config_file_path,
+                     MarketOrderState.market == market.display_name,
+                     MarketOrderState.order_id.in_(removed_order_ids[i:i + self.SQL_IN_CLAUSE_MAX_SIZE]))
+             .delete(synchronize_session=False))
+
+        self._saved_tracking_states[key] = tracking_states
+
+    def _schedule_market_states_save(self, market: ConnectorBase):
+        self._pending_market_states[market.display_name] = market
+        if self._save_market_states_handle is None:
+            self._save_market_states_handle = self._ev_loop.call_later(self.MARKET_STATES_SAVE_DELAY,
+                                                                       self._save_pending_market_states)
+
+    def _save_pending_market_states(self):
+        self._save_market_states_handle = None
+        markets: List[ConnectorBase] = list(self._pending_market_states.values())
+        self._pending_market_states.clear()
+        if len(markets) == 0:
+            return
+        try:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    for market in markets:
+                        self.save_market_states(self._config_file_path, market, session=session)
+        except Exception:
+            # The saved states are unknown after a failed transaction, they are read again on the next save
+            for market in markets:
+                self._saved_tracking_states.pop((self._config_file_path, market.display_name), None)
+            self.logger().error("Unexpected error while saving the market states.", exc_info=True)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         with self._sql_manager.get_new_session() as session:
-            market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-
-            if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+            with session.begin():
+                order_states: List[MarketOrderState] = self.get_market_order_states(config_file_path,
+                                                                                    market,
+                                                                                    session=session)
+                if len(order_states) > 0:
+                    saved_states: Optional[Dict[str, Any]] = {}
+                    for order_state in order_states:
+                        if order_state.saved_state is None:
+                            session.delete(order_state)
+                        else:
+                            saved_states[order_state.order_id] = order_state.saved_state
+                    self._saved_tracking_states[(config_file_path, market.display_name)] = dict(saved_states)
+                else:
+                    market_states: Optional[MarketState] = self.get_market_states(config_file_path,
+                                                                                  market,
+                                                                                  session=session)
+                    saved_states = market_states.saved_state if market_states is not None else None
+
+            if saved_states is not None:
+                market.restore_tracking_states(saved_states)
+
+    def get_market_order_states(self,
+                                config_file_path: str,
+                                market: ConnectorBase,
+                                session: Session,
+                                order_ids: Optional[List[str]] = None) -> List[MarketOrderState]:
+        filters = [MarketOrderState.config_file_path == config_file_path,
+                   MarketOrderState.market == market.display_name]
+        if order_ids is None:
+            return session.query(MarketOrderState).filter(*filters).all()
+        # Queried in chunks to stay under the SQLite limit of bound variables
+        order_states: List[MarketOrderState] = []
+        for i in range(0, len(order_ids), self.SQL_IN_CLAUSE_MAX_SIZE):
+            chunk: List[str] = order_ids[i:i + self.SQL_IN_CLAUSE_MAX_SIZE]
+            order_states.extend(session.query(MarketOrderState)
+                                .filter(*filters, MarketOrderState.order_id.in_(chunk))
+                                .all())
+        return order_states
 
     def get_market_states(self,
                           config_file_path: str,
@@ -324,7 +450,7 @@ class MarketsRecorder:
                 session.add(order_record)
                 session.add(order_status)
                 market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+                self._schedule_market_states_save(market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -384,7 +510,8 @@ class MarketsRecorder:
                 )
                 session.add(order_status)
                 session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
+                TradePerformance.add_trade_fill(session, trade_fill_record)
+                self._schedule_market_states_save(market)
 
                 market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
                                                                                    trade_fill_record.exchange_trade_id,
@@ -470,7 +597,7 @@ class MarketsRecorder:
                                                             timestamp=timestamp,
                                                             status=event_type.name)
                     session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+                    self._schedule_market_states_save(market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -514,7 +641,7 @@ class MarketsRecorder:
                                                                      token_id=evt.token_id,
                                                                      trade_fee=evt.trade_fee.to_json())
                 session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+                self._schedule_market_states_save(connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -534,7 +661,7 @@ class MarketsRecorder:
                                                                                  claimed_fee_0=Decimal(evt.claimed_fee_0),
                                                                                  claimed_fee_1=Decimal(evt.claimed_fee_1))
                 session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+                self._schedule_market_states_save(connector)
 
     @staticmethod
     async def _sleep(delay):
@@ -129,6 +129,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         amount: Decimal,
         order_type: OrderType,
         position_action: PositionAction = PositionAction.NIL,
+        trigger_price: Optional[Decimal] = None,
         **kwargs,
     ):
         """
@@ -140,8 +141,9 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         :param trade_type: the type of order (buy or sell)
         :param price: the price for the order
         :param amount: the amount for the order
-        :param order_type: type of execution for the order (MARKET, LIMIT, LIMIT_MAKER)
+        :param order_type: type of execution for the order (MARKET, LIMIT, LIMIT_MAKER, STOP_MARKET, TAKE_PROFIT_MARKET)
         :param position_action: is the order opening or closing a position
+        :param trigger_price: the price that triggers the order, for trigger order types
         """
         leverage = self.get_leverage(trading_pair=trading_pair)
         self._order_tracker.start_tracking_order(
@@ -156,6 +158,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
                 creation_timestamp=self.current_timestamp,
                 leverage=leverage,
                 position=position_action,
+                trigger_price=trigger_price,
             )
         )
 
@@ -1,5 +1,21 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
+cdef class IteratorTickStats:
+    cdef:
+        readonly str name
+        readonly int64_t count
+        readonly int64_t total_ns
+        readonly int64_t max_ns
+        readonly int64_t last_ns
+        readonly int64_t slow_count
+        # TICK_HISTOGRAM_SIZE buckets, see clock.pyx
+        int64_t _histogram[22]
+
+    cdef c_record(self, int64_t duration_ns, int64_t slow_threshold_ns)
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +26,17 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _tick_timing_enabled
+        int64_t _slow_iterator_threshold_ns
+        int64_t _tick_overrun_threshold_ns
+        dict _iterator_tick_stats
+        int64_t _tick_count
+        int64_t _tick_total_ns
+        int64_t _tick_max_ns
+        int64_t _tick_overrun_count
+        double _last_overrun_log_timestamp
+
+    cdef double c_tick_at_or_after(self, double timestamp)
+    cdef double c_next_event_tick(self, double timestamp)
+    cdef c_record_iterator_tick(self, object iterator, int64_t duration_ns)
+    cdef c_record_tick(self, int64_t duration_ns)
@@ -3,7 +3,11 @@
 import asyncio
 import logging
 import time
-from typing import List
+from operator import attrgetter
+from typing import Any, Dict, List
+
+from libc.math cimport ceil, isnan
+from libc.stdint cimport int64_t
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
@@ -11,6 +15,77 @@ from hummingbot.core.clock_mode import ClockMode
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+NaN = float("nan")
+perf_counter_ns = time.perf_counter_ns
+# Minimum interval between two tick overrun warnings, in seconds
+TICK_OVERRUN_LOG_INTERVAL = 60.0
+# Number of buckets of the tick duration histograms, the size of IteratorTickStats._histogram
+TICK_HISTOGRAM_SIZE = 22
+cdef int c_histogram_size = TICK_HISTOGRAM_SIZE
+
+
+cdef class IteratorTickStats:
+    """
+    Tick durations of a time iterator. The histogram bucket i counts the ticks that took less than 2^i microseconds
+    (and at least 2^(i-1) microseconds), the last bucket counts all the longer ticks.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.last_ns = 0
+        self.slow_count = 0
+        for i in range(c_histogram_size):
+            self._histogram[i] = 0
+
+    cdef c_record(self, int64_t duration_ns, int64_t slow_threshold_ns):
+        cdef:
+            int64_t duration_us = duration_ns // 1000
+            int bucket = 0
+
+        while duration_us > 0 and bucket < c_histogram_size - 1:
+            duration_us >>= 1
+            bucket += 1
+        self._histogram[bucket] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        self.last_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        if 0 < slow_threshold_ns < duration_ns:
+            self.slow_count += 1
+
+    @property
+    def histogram(self) -> List[int]:
+        return [self._histogram[i] for i in range(c_histogram_size)]
+
+    def percentile_us(self, percentile: float) -> float:
+        """
+        Upper bound, in microseconds, of the histogram bucket that contains the percentile (0 to 100).
+        """
+        cdef:
+            int64_t cumulative = 0
+            int i
+
+        if self.count == 0:
+            return 0.0
+        for i in range(c_histogram_size - 1):
+            cumulative += self._histogram[i]
+            if cumulative * 100 >= percentile * self.count:
+                return float(1 << i)
+        return self.max_ns / 1e3
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "avg_us": self.total_ns / self.count / 1e3 if self.count > 0 else 0.0,
+            "p50_us": self.percentile_us(50),
+            "p99_us": self.percentile_us(99),
+            "max_us": self.max_ns / 1e3,
+            "slow_count": self.slow_count,
+        }
 
 
 cdef class Clock:
@@ -21,21 +96,40 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 tick_timing_enabled: bool = False,
+                 slow_iterator_threshold: float = 0.0,
+                 tick_overrun_threshold: float = 0.0):
         """
-        :param clock_mode: either real time mode or back testing mode
+        :param clock_mode: either real time mode or back testing mode. In fast forward back testing mode the clock
+        skips the ticks where no child iterator has anything scheduled (see `TimeIterator.next_event_timestamp`)
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param tick_timing_enabled: (real time mode only) keeps the tick durations of every child iterator
+        :param slow_iterator_threshold: child iterator tick duration (in seconds) over which the tick is counted as
+        slow, 0 to not count slow ticks
+        :param tick_overrun_threshold: clock tick duration (in seconds) over which the tick is reported as an overrun,
+        0 to use the tick size
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
         self._start_time = start_time
         self._end_time = end_time
-        self._current_tick = start_time if clock_mode is ClockMode.BACKTEST else (time.time() // tick_size) * tick_size
+        self._current_tick = start_time if clock_mode is not ClockMode.REALTIME else (time.time() // tick_size) * tick_size
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_timing_enabled = tick_timing_enabled
+        self._slow_iterator_threshold_ns = int(slow_iterator_threshold * 1e9)
+        self._tick_overrun_threshold_ns = int((tick_overrun_threshold or tick_size) * 1e9)
+        self._iterator_tick_stats = {}
+        self._last_overrun_log_timestamp = 0
+        self.reset_tick_stats()
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +151,36 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_timing_enabled(self) -> bool:
+        return self._tick_timing_enabled
+
+    @tick_timing_enabled.setter
+    def tick_timing_enabled(self, value: bool):
+        self._tick_timing_enabled = value
+
+    def get_tick_stats(self) -> Dict[str, Any]:
+        """
+        Returns the clock tick durations and the tick durations of each child iterator, slowest iterators first.
+        """
+        iterator_stats = sorted(self._iterator_tick_stats.values(), key=attrgetter("total_ns"), reverse=True)
+        return {
+            "tick_count": self._tick_count,
+            "avg_tick_ms": self._tick_total_ns / self._tick_count / 1e6 if self._tick_count > 0 else 0.0,
+            "max_tick_ms": self._tick_max_ns / 1e6,
+            "overrun_count": self._tick_overrun_count,
+            "overrun_threshold_ms": self._tick_overrun_threshold_ns / 1e6,
+            "slow_iterator_threshold_ms": self._slow_iterator_threshold_ns / 1e6,
+            "iterators": [stats.to_json() for stats in iterator_stats],
+        }
+
+    def reset_tick_stats(self):
+        self._iterator_tick_stats.clear()
+        self._tick_count = 0
+        self._tick_total_ns = 0
+        self._tick_max_ns = 0
+        self._tick_overrun_count = 0
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +205,7 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._iterator_tick_stats.pop(id(iterator), None)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +215,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            bint tick_timing_enabled
+            int64_t tick_start_ns = 0
+            int64_t iterator_start_ns = 0
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -113,8 +241,13 @@ cdef class Clock:
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
+                tick_timing_enabled = self._tick_timing_enabled
+                if tick_timing_enabled:
+                    tick_start_ns = perf_counter_ns()
                 for ci in self._current_context:
                     child_iterator = ci
+                    if tick_timing_enabled:
+                        iterator_start_ns = perf_counter_ns()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +255,76 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if tick_timing_enabled:
+                        self.c_record_iterator_tick(child_iterator, perf_counter_ns() - iterator_start_ns)
+                if tick_timing_enabled:
+                    self.c_record_tick(perf_counter_ns() - tick_start_ns)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef c_record_iterator_tick(self, object iterator, int64_t duration_ns):
+        cdef:
+            IteratorTickStats stats = self._iterator_tick_stats.get(id(iterator))
+
+        if stats is None:
+            name = type(iterator).__name__
+            display_name = getattr(iterator, "display_name", None)
+            if isinstance(display_name, str) and display_name != "":
+                name = f"{name} ({display_name})"
+            stats = IteratorTickStats(name)
+            self._iterator_tick_stats[id(iterator)] = stats
+        stats.c_record(duration_ns, self._slow_iterator_threshold_ns)
+
+    cdef c_record_tick(self, int64_t duration_ns):
+        cdef:
+            double now
+
+        self._tick_count += 1
+        self._tick_total_ns += duration_ns
+        if duration_ns > self._tick_max_ns:
+            self._tick_max_ns = duration_ns
+        if duration_ns > self._tick_overrun_threshold_ns:
+            self._tick_overrun_count += 1
+            now = time.time()
+            if now - self._last_overrun_log_timestamp >= TICK_OVERRUN_LOG_INTERVAL:
+                self._last_overrun_log_timestamp = now
+                slowest = sorted(self._iterator_tick_stats.values(), key=attrgetter("last_ns"), reverse=True)[:3]
+                self.logger().warning(
+                    f"Clock tick took {duration_ns / 1e6:.1f} ms, over the "
+                    f"{self._tick_overrun_threshold_ns / 1e6:.1f} ms threshold "
+                    f"({self._tick_overrun_count} overruns so far). Slowest iterators: "
+                    + ", ".join([f"{stats.name} {stats.last_ns / 1e6:.1f} ms" for stats in slowest])
+                )
+
+    cdef double c_tick_at_or_after(self, double timestamp):
+        return self._start_time + ceil((timestamp - self._start_time) / self._tick_size) * self._tick_size
+
+    cdef double c_next_event_tick(self, double timestamp):
+        """
+        Returns the next tick where at least one child iterator has a scheduled event, bounded by the tick the regular
+        back testing mode would end at. Returns NaN when there are no events left and no bound.
+        """
+        cdef:
+            double next_event = NaN
+            double event_timestamp
+            double last_tick = self.c_tick_at_or_after(timestamp)
+
+        for ci in self._child_iterators:
+            event_timestamp = ci.next_event_timestamp()
+            if not isnan(event_timestamp) and (isnan(next_event) or event_timestamp < next_event):
+                next_event = event_timestamp
+        if isnan(next_event):
+            return last_tick
+        next_event = max(self._current_tick + self._tick_size, self.c_tick_at_or_after(next_event))
+        return next_event if isnan(last_tick) else min(next_event, last_tick)
+
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double next_tick
+            bint fast_forward = self._clock_mode is ClockMode.BACKTEST_FAST_FORWARD
 
         if not self._started:
             for ci in self._child_iterators:
@@ -138,7 +334,13 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+                if fast_forward:
+                    next_tick = self.c_next_event_tick(timestamp)
+                    if isnan(next_tick):
+                        return
+                    self._current_tick = next_tick
+                else:
+                    self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
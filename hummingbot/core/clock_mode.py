@@ -6,3 +6,4 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+    BACKTEST_FAST_FORWARD = 3
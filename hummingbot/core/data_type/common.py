@@ -7,10 +7,18 @@ class OrderType(Enum):
     MARKET = 1
     LIMIT = 2
     LIMIT_MAKER = 3
+    STOP_MARKET = 4
+    TAKE_PROFIT_MARKET = 5
 
     def is_limit_type(self):
         return self in (OrderType.LIMIT, OrderType.LIMIT_MAKER)
 
+    def is_trigger_type(self):
+        """
+        Trigger orders rest on the exchange and are executed as market orders once the price reaches their trigger price
+        """
+        return self in (OrderType.STOP_MARKET, OrderType.TAKE_PROFIT_MARKET)
+
 
 class OpenOrder(NamedTuple):
     client_order_id: str
@@ -28,6 +28,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._update_version += 1
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +72,8 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        # The entries of this book are adjusted with the traded ones
+        self._update_version += 1
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
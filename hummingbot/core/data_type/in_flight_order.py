@@ -100,6 +100,7 @@ class InFlightOrder:
             initial_state: OrderState = OrderState.PENDING_CREATE,
             leverage: int = 1,
             position: PositionAction = PositionAction.NIL,
+            trigger_price: Optional[Decimal] = None,
     ) -> None:
         self.client_order_id = client_order_id
         self.creation_timestamp = creation_timestamp
@@ -112,6 +113,7 @@ class InFlightOrder:
         self.current_state = initial_state
         self.leverage = leverage
         self.position = position
+        self.trigger_price = trigger_price
 
         self.executed_amount_base = s_decimal_0
         self.executed_amount_quote = s_decimal_0
@@ -141,6 +143,7 @@ class InFlightOrder:
                 self.current_state,
                 self.leverage,
                 self.position,
+                self.trigger_price,
                 self.executed_amount_base,
                 self.executed_amount_quote,
                 self.creation_timestamp,
@@ -230,7 +233,8 @@ class InFlightOrder:
             initial_state=OrderState(int(data["last_state"])),
             leverage=int(data["leverage"]),
             position=PositionAction(data["position"]),
-            creation_timestamp=data.get("creation_timestamp", -1)
+            creation_timestamp=data.get("creation_timestamp", -1),
+            trigger_price=Decimal(data["trigger_price"]) if data.get("trigger_price") is not None else None,
         )
         order.executed_amount_base = Decimal(data["executed_amount_base"])
         order.executed_amount_quote = Decimal(data["executed_amount_quote"])
@@ -249,7 +253,7 @@ class InFlightOrder:
         Returns this InFlightOrder as a JSON object.
         :return: JSON object
         """
-        return {
+        json_dict = {
             "client_order_id": self.client_order_id,
             "exchange_order_id": self.exchange_order_id,
             "trading_pair": self.trading_pair,
@@ -266,6 +270,9 @@ class InFlightOrder:
             "last_update_timestamp": self.last_update_timestamp,
             "order_fills": {key: fill.to_json() for key, fill in self.order_fills.items()}
         }
+        if self.trigger_price is not None:
+            json_dict["trigger_price"] = str(self.trigger_price)
+        return json_dict
 
     def to_limit_order(self) -> LimitOrder:
         """
@@ -27,6 +27,7 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookChangedEvent,
     OrderBookTradeEvent
 )
 
@@ -36,8 +37,14 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline bint price_changed(double previous_price, double price):
+    # NaN is used when there is no price
+    return not (price == previous_price or (price != price and previous_price != previous_price))
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -51,6 +58,8 @@ cdef class OrderBook(PubSub):
         self._snapshot_uid = 0
         self._last_diff_uid = 0
         self._best_bid = self._best_ask = float("NaN")
+        self._top_of_book_version = 0
+        self._update_version = 0
         self._last_trade_price = float("NaN")
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
@@ -65,6 +74,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double best_bid_price = self._best_bid
+            double best_ask_price = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -88,10 +99,11 @@ cdef class OrderBook(PubSub):
         ask_iterator = self._ask_book.begin()
         if bid_iterator != self._bid_book.rend():
             top_bid = deref(bid_iterator)
-            self._best_bid = top_bid.getPrice()
+            best_bid_price = top_bid.getPrice()
         if ask_iterator != self._ask_book.end():
             top_ask = deref(ask_iterator)
-            self._best_ask = top_ask.getPrice()
+            best_ask_price = top_ask.getPrice()
+        self.c_set_top_of_book(best_bid_price, best_ask_price)
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
@@ -130,14 +142,36 @@ cdef class OrderBook(PubSub):
                 best_ask_price = top_ask.getPrice()
 
         # Record the current best prices, for faster c_get_price() calls.
-        self._best_bid = best_bid_price
-        self._best_ask = best_ask_price
+        self.c_set_top_of_book(best_bid_price, best_ask_price)
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+    cdef c_set_top_of_book(self, double best_bid, double best_ask):
+        """
+        Records the best prices and increases the update version, since it is called at the end of every diff and
+        snapshot. When the best prices changed, the top of book version is increased and, if there are listeners, one
+        top of book changed event is emitted for the whole diff or snapshot.
+        """
+        cdef:
+            bint bid_changed = price_changed(self._best_bid, best_bid)
+            bint ask_changed = price_changed(self._best_ask, best_ask)
+
+        self._update_version += 1
+        self._best_bid = best_bid
+        self._best_ask = best_ask
+        if bid_changed or ask_changed:
+            self._top_of_book_version += 1
+            if len(self.c_get_dispatch_list(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG)) > 0:
+                self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                     OrderBookTopOfBookChangedEvent(timestamp=time.time(),
+                                                                    best_bid=best_bid,
+                                                                    best_ask=best_ask,
+                                                                    version=self._top_of_book_version))
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
+        self._update_version += 1
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
@@ -148,6 +182,7 @@ cdef class OrderBook(PubSub):
     @last_trade_price.setter
     def last_trade_price(self, value: float):
         self._last_trade_price = value
+        self._update_version += 1
 
     @property
     def last_applied_trade(self) -> float:
@@ -161,6 +196,22 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def top_of_book_version(self) -> int:
+        """
+        Increases every time the best bid or best ask price changes. Strategies can compare it with the version they
+        last used to skip recomputing prices when the top of the book did not move.
+        """
+        return self._top_of_book_version
+
+    @property
+    def update_version(self) -> int:
+        """
+        Increases with every diff, snapshot and trade applied to the order book, and when the last trade price is set.
+        Values computed from the book, like VWAPs or the price for a volume, are still valid while it doesn't change.
+        """
+        return self._update_version
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -208,16 +259,17 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        All columns are of double type. The update id of the diff is the highest of the rows when not given.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -225,26 +277,23 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(self.c_add_numpy_entries(bids_array, ref(cpp_bids)),
+                             self.c_add_numpy_entries(asks_array, ref(cpp_asks)))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        All columns are of double type. The update id of the snapshot is the highest of the rows when not given.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -252,15 +301,31 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
+            int64_t last_update_id
+
+        last_update_id = max(self.c_add_numpy_entries(bids_array, ref(cpp_bids)),
+                             self.c_add_numpy_entries(asks_array, ref(cpp_asks)))
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    cdef int64_t c_add_numpy_entries(self,
+                                     np.ndarray[np.float64_t, ndim=2] array,
+                                     vector[OrderBookEntry] *entries):
+        """
+        Adds the [price, amount, update_id] rows of the array to the entries, reading the array buffer directly.
+        Returns the highest update id of the rows.
+        """
+        cdef:
+            Py_ssize_t i
+            int64_t row_update_id
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        deref(entries).reserve(array.shape[0])
+        for i in range(array.shape[0]):
+            row_update_id = <int64_t>array[i, 2]
+            deref(entries).push_back(OrderBookEntry(array[i, 0], array[i, 1], row_update_id))
+            if row_update_id > last_update_id:
+                last_update_id = row_update_id
+        return last_update_id
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -437,6 +502,15 @@ cdef class OrderBook(PubSub):
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef double c_get_amount_at_price(self, bint is_bid, double price):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = book.find(OrderBookEntry(price, 0, 0))
+
+        if it == book.end():
+            return 0
+        return deref(it).getAmount()
+
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
             double cumulative_volume = 0
@@ -472,12 +546,18 @@ cdef class OrderBook(PubSub):
     def get_volume_for_price(self, bint is_buy, double price) -> OrderBookQueryResult:
         return self.c_get_volume_for_price(is_buy, price)
 
+    def get_amount_at_price(self, is_bid: bool, price: float) -> float:
+        """
+        Amount resting at exactly the given price level, 0 if the level is not in the book.
+        """
+        return self.c_get_amount_at_price(is_bid, price)
+
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_numpy_diffs(diff.bids_array, diff.asks_array, diff.update_id)
@@ -1,11 +1,32 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
+def order_book_rows_array(rows: Any, update_id: int) -> np.ndarray:
+    """
+    Parses [price, amount, ...] order book levels, as decoded from the exchange messages, into a float64 array of
+    [price, amount, update_id] rows that `OrderBook.apply_numpy_diffs` and `OrderBook.apply_numpy_snapshot` accept,
+    without creating an `OrderBookRow` per level.
+    """
+    array = np.empty((len(rows), 3), dtype=np.float64)
+    if len(rows) > 0:
+        try:
+            array[:, :2] = np.asarray(rows, dtype=np.float64)[:, :2]
+        except (IndexError, TypeError, ValueError):
+            # Levels with non numeric extra fields
+            for i, (price, amount, *trash) in enumerate(rows):
+                array[i, 0] = float(price)
+                array[i, 1] = float(amount)
+    array[:, 2] = update_id
+    return array
+
+
 class OrderBookMessageType(Enum):
     SNAPSHOT = 1
     DIFF = 2
@@ -64,6 +85,14 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def asks_array(self) -> np.ndarray:
+        return order_book_rows_array(self.content["asks"], self.update_id)
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return order_book_rows_array(self.content["bids"], self.update_id)
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
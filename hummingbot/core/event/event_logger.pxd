@@ -7,6 +7,9 @@ cdef class EventLogger(EventListener):
         object _logged_events
         object _generic_logged_events
         object _order_filled_logged_events
+        object _max_order_filled_age
+        dict _order_filled_summaries
         dict _waiting
         dict _wait_returns
     cdef c_call(self, object event_object)
+    cdef c_log_order_filled_event(self, object order_filled_event)
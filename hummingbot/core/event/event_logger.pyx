@@ -1,23 +1,98 @@
 import asyncio
 from collections import deque
+from decimal import Decimal
 
 from async_timeout import timeout
 from typing import (
+    Dict,
     List,
     Optional,
+    Tuple,
 )
 
+from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
 
+s_decimal_0 = Decimal("0")
+
+
+class OrderFilledSummary:
+    """
+    Aggregates of the order fills of one trading pair and side, updated as the fills are logged. Fees are kept per
+    token: flat fees in their own token, percentage fees in their percent token, or in the quote asset when there is
+    none. A percentage fee in a third token is converted with the rate oracle, and kept in the quote asset when the
+    oracle has no rate for it.
+    """
+    __slots__ = ("trading_pair", "trade_type", "fill_count", "volume", "notional", "fees")
+
+    def __init__(self, trading_pair: str, trade_type: TradeType):
+        self.trading_pair: str = trading_pair
+        self.trade_type: TradeType = trade_type
+        self.fill_count: int = 0
+        self.volume: Decimal = s_decimal_0
+        self.notional: Decimal = s_decimal_0
+        self.fees: Dict[str, Decimal] = {}
+
+    @property
+    def average_price(self) -> Decimal:
+        return self.notional / self.volume if self.volume > s_decimal_0 else s_decimal_0
+
+    def add(self, order_filled_event: OrderFilledEvent):
+        price = Decimal(str(order_filled_event.price))
+        amount = Decimal(str(order_filled_event.amount))
+        trade_fee = order_filled_event.trade_fee
+
+        self.fill_count += 1
+        self.volume += amount
+        self.notional += price * amount
+        if trade_fee is not None:
+            if trade_fee.percent != s_decimal_0:
+                fee_token, fee_amount = self._percent_fee(trade_fee, price, amount)
+                self.fees[fee_token] = self.fees.get(fee_token, s_decimal_0) + fee_amount
+            for flat_fee in trade_fee.flat_fees:
+                self.fees[flat_fee.token] = self.fees.get(flat_fee.token, s_decimal_0) + flat_fee.amount
+
+    def _percent_fee(self, trade_fee: TradeFeeBase, price: Decimal, amount: Decimal) -> Tuple[str, Decimal]:
+        base, quote = split_hb_trading_pair(self.trading_pair)
+        fee_token = trade_fee.percent_token or quote
+        fee_in_quote = price * amount * trade_fee.percent
+        if fee_token == quote:
+            return quote, fee_in_quote
+        if fee_token == base:
+            return base, amount * trade_fee.percent
+        try:
+            rate = TradeFeeBase._get_exchange_rate(combine_to_hb_trading_pair(fee_token, quote))
+        except ValueError:
+            return quote, fee_in_quote
+        return fee_token, fee_in_quote / rate
+
+    def __repr__(self) -> str:
+        return (f"OrderFilledSummary(trading_pair='{self.trading_pair}', trade_type={self.trade_type}, "
+                f"fill_count={self.fill_count}, volume={self.volume}, notional={self.notional}, fees={self.fees})")
+
+
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    """
+    Keeps the most recent events received. Order fill events are kept for the whole session unless a retention by
+    count or by age (in seconds, relative to the newest fill) is given, and they are aggregated per trading pair and
+    side in `OrderFilledSummary` objects, which cover every fill logged since the last `clear` regardless of the
+    retention.
+    """
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_order_filled_events: Optional[int] = None,
+                 max_order_filled_age: Optional[float] = None):
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # Order fill events are all kept by default, because they are required for PnL calculation
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
+        self._order_filled_logged_events = deque(maxlen=max_order_filled_events)
+        self._max_order_filled_age = max_order_filled_age
+        self._order_filled_summaries = {}
         self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
         self._waiting = {}
         self._wait_returns = {}
@@ -26,6 +101,17 @@ cdef class EventLogger(EventListener):
     def event_log(self) -> List[any]:
         return list(self._generic_logged_events) + list(self._order_filled_logged_events)
 
+    @property
+    def order_filled_events(self) -> List[OrderFilledEvent]:
+        return list(self._order_filled_logged_events)
+
+    @property
+    def order_filled_summaries(self) -> Dict[Tuple[str, TradeType], OrderFilledSummary]:
+        return self._order_filled_summaries
+
+    def order_filled_summary(self, trading_pair: str, trade_type: TradeType) -> Optional[OrderFilledSummary]:
+        return self._order_filled_summaries.get((trading_pair, trade_type))
+
     @property
     def event_source(self) -> str:
         return self._event_source
@@ -33,6 +119,7 @@ cdef class EventLogger(EventListener):
     def clear(self):
         self._generic_logged_events.clear()
         self._order_filled_logged_events.clear()
+        self._order_filled_summaries.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -53,6 +140,8 @@ cdef class EventLogger(EventListener):
     cdef c_call(self, object event_object):
         self._logged_events.get(type(event_object), self._generic_logged_events).append(event_object)
         event_object_type = type(event_object)
+        if event_object_type is OrderFilledEvent:
+            self.c_log_order_filled_event(event_object)
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
@@ -61,3 +150,19 @@ cdef class EventLogger(EventListener):
                 self._wait_returns[notifier] = event_object
         for notifier in should_notify:
             notifier.set()
+
+    cdef c_log_order_filled_event(self, object order_filled_event):
+        cdef:
+            tuple key = (order_filled_event.trading_pair, order_filled_event.trade_type)
+            object summary = self._order_filled_summaries.get(key)
+            object oldest_timestamp
+
+        if summary is None:
+            summary = OrderFilledSummary(order_filled_event.trading_pair, order_filled_event.trade_type)
+            self._order_filled_summaries[key] = summary
+        summary.add(order_filled_event)
+
+        if self._max_order_filled_age is not None:
+            oldest_timestamp = order_filled_event.timestamp - self._max_order_filled_age
+            while self._order_filled_logged_events[0].timestamp < oldest_timestamp:
+                self._order_filled_logged_events.popleft()
@@ -37,10 +37,14 @@ cdef class PubSub:
     1. c_add_listener():
        Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
        make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    2. c_remove_listener() and c_get_listeners():
+       Every time. This assumes both are called infrequently.
+    3. c_trigger_event():
+       Only when a dead listener is found while dispatching the event.
+
+    Events are dispatched from a per event tag tuple of listener weak references, which is rebuilt only after the
+    listeners of that event tag change. Listeners can add or remove listeners while an event is being dispatched
+    without affecting the current dispatch.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,6 +56,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        # Subclasses don't always call PubSub.__init__()
+        self._dispatch_lists = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -83,6 +91,7 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._dispatch_lists.pop(event_tag, None)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +109,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._dispatch_lists.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -118,6 +128,8 @@ cdef class PubSub:
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
                 lit_to_remove.push_back(lit)
             inc(lit)
+        if lit_to_remove.size() > 0:
+            self._dispatch_lists.pop(event_tag, None)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
@@ -143,23 +155,36 @@ cdef class PubSub:
             retval.append(typed_listener)
         return retval
 
-    cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+    cdef tuple c_get_dispatch_list(self, int64_t event_tag):
+        cdef:
+            EventsIterator it
+            tuple dispatch_list = self._dispatch_lists.get(event_tag)
+            list listener_weakrefs = []
+        if dispatch_list is not None:
+            return dispatch_list
 
+        it = self._events.find(event_tag)
+        if it != self._events.end():
+            for pyref in deref(it).second:
+                listener_weakrefs.append(<object>pyref.get())
+        dispatch_list = tuple(listener_weakrefs)
+        self._dispatch_lists[event_tag] = dispatch_list
+        return dispatch_list
+
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple dispatch_list = self.c_get_dispatch_list(event_tag)
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+            bint has_dead_listeners = False
+
+        # The dispatch list is immutable, so listeners are allowed to call c_remove_listener() during the dispatch.
+        for listener_weakref in dispatch_list:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                has_dead_listeners = True
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +192,6 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+        if has_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
@@ -25,6 +25,14 @@ cdef class TimeIterator(PubSub):
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    def next_event_timestamp(self) -> float:
+        """
+        Timestamp of the next event this iterator needs to be ticked for, used by the fast forward back testing clock.
+        Iterators only reacting to other iterators' events return NaN, iterators that need every tick return their
+        current timestamp.
+        """
+        return NaN
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
@@ -68,7 +68,7 @@ def build_perpetual_trade_fee(
     """
     trade_fee_schema = TradeFeeSchemaLoader.configured_schema_for_exchange(exchange_name=exchange)
     percent = trade_fee_schema.maker_percent_fee_decimal if is_maker else trade_fee_schema.taker_percent_fee_decimal
-    fixed_fees = trade_fee_schema.maker_fixed_fees if is_maker else trade_fee_schema.taker_fixed_fees
+    fixed_fees = list(trade_fee_schema.maker_fixed_fees if is_maker else trade_fee_schema.taker_fixed_fees)
     trade_fee = TradeFeeBase.new_perpetual_fee(
         fee_schema=trade_fee_schema,
         position_action=position_action,
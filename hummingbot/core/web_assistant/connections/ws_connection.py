@@ -1,9 +1,9 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
+import ujson
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 
@@ -131,8 +131,8 @@ class WSConnection:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = msg.json(loads=ujson.loads)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
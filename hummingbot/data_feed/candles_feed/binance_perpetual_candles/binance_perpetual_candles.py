@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -52,6 +52,14 @@ class BinancePerpetualCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
+    @property
+    def supports_shared_websocket(self) -> bool:
+        return True
+
+    @property
+    def max_ws_channels_per_connection(self) -> int:
+        return CONSTANTS.MAX_WS_CHANNELS_PER_CONNECTION
+
     async def check_network(self) -> NetworkStatus:
         rest_assistant = await self._api_factory.get_rest_assistant()
         await rest_assistant.execute_request(url=self.health_check_url,
@@ -110,13 +118,7 @@ class BinancePerpetualCandles(CandlesBase):
         :param ws: the websocket assistant used to connect to the exchange
         """
         try:
-            candle_params = []
-            candle_params.append(f"{self._ex_trading_pair.lower()}@kline_{self.interval}")
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": candle_params,
-                "id": 1
-            }
+            payload = self.ws_subscription_payload(self.ws_subscription_channels())
             subscribe_candles_request: WSJSONRequest = WSJSONRequest(payload=payload)
 
             await ws.send(subscribe_candles_request)
@@ -133,29 +135,46 @@ class BinancePerpetualCandles(CandlesBase):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
-            if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
-                timestamp = data["k"]["t"]
-                open = data["k"]["o"]
-                low = data["k"]["l"]
-                high = data["k"]["h"]
-                close = data["k"]["c"]
-                volume = data["k"]["v"]
-                quote_asset_volume = data["k"]["q"]
-                n_trades = data["k"]["n"]
-                taker_buy_base_volume = data["k"]["V"]
-                taker_buy_quote_volume = data["k"]["Q"]
-                if len(self._candles) == 0:
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                    safe_ensure_future(self.fill_historical_candles())
-                elif timestamp > int(self._candles[-1][0]):
-                    # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+            if data is not None:  # data will be None when the websocket is disconnected
+                self._process_websocket_message(data)
+
+    def ws_subscription_channels(self) -> List[str]:
+        return [f"{self._ex_trading_pair.lower()}@kline_{self.interval}"]
+
+    def ws_subscription_payload(self, channels: List[str]) -> Dict[str, Any]:
+        return {
+            "method": "SUBSCRIBE",
+            "params": channels,
+            "id": 1
+        }
+
+    def get_ws_message_exchange_trading_pair(self, data: Dict[str, Any]) -> Optional[str]:
+        return data.get("s") if data.get("e") == "kline" else None
+
+    def _process_websocket_message(self, data: Dict[str, Any]):
+        if data.get("e") == "kline":
+            timestamp = data["k"]["t"]
+            open = data["k"]["o"]
+            low = data["k"]["l"]
+            high = data["k"]["h"]
+            close = data["k"]["c"]
+            volume = data["k"]["v"]
+            quote_asset_volume = data["k"]["q"]
+            n_trades = data["k"]["n"]
+            taker_buy_base_volume = data["k"]["V"]
+            taker_buy_quote_volume = data["k"]["Q"]
+            if len(self._candles) == 0:
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
+                safe_ensure_future(self.fill_historical_candles())
+            elif timestamp > int(self._candles[-1][0]):
+                # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
+            elif timestamp == int(self._candles[-1][0]):
+                self._candles.pop()
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
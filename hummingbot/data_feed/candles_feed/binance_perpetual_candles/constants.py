@@ -7,6 +7,7 @@ HEALTH_CHECK_ENDPOINT = "/fapi/v1/ping"
 CANDLES_ENDPOINT = "/fapi/v1/klines"
 
 WSS_URL = "wss://fstream.binance.com/ws"
+MAX_WS_CHANNELS_PER_CONNECTION = 200
 
 INTERVALS = bidict({
     "1m": 60,
@@ -7,6 +7,7 @@ HEALTH_CHECK_ENDPOINT = "/api/v3/ping"
 CANDLES_ENDPOINT = "/api/v3/klines"
 
 WSS_URL = "wss://stream.binance.com:9443/ws"
+MAX_WS_CHANNELS_PER_CONNECTION = 1024
 
 INTERVALS = bidict({
     "1s": "1s",
@@ -1,7 +1,7 @@
 import asyncio
 import os
 from collections import deque
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -82,6 +82,14 @@ class CandlesBase(NetworkBase):
         """
         return len(self._candles) == self._candles.maxlen
 
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def exchange_trading_pair(self) -> str:
+        return self._ex_trading_pair
+
     @property
     def name(self):
         raise NotImplementedError
@@ -110,6 +118,22 @@ class CandlesBase(NetworkBase):
     def intervals(self):
         raise NotImplementedError
 
+    @property
+    def supports_shared_websocket(self) -> bool:
+        """
+        Whether the candles of several trading pairs can be received through one websocket connection, used by the
+        CandlesManager. Feeds supporting it implement ws_subscription_channels, ws_subscription_payload,
+        get_ws_message_exchange_trading_pair and _process_websocket_message.
+        """
+        return False
+
+    @property
+    def max_ws_channels_per_connection(self) -> int:
+        """
+        The maximum number of channels the exchange allows to subscribe in one websocket connection.
+        """
+        raise NotImplementedError
+
     async def check_network(self) -> NetworkStatus:
         raise NotImplementedError
 
@@ -123,6 +147,13 @@ class CandlesBase(NetworkBase):
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
 
+    def use_api_factory(self, api_factory: WebAssistantsFactory):
+        """
+        Makes the feed do its requests with the given factory, so feeds of the same exchange share its throttler.
+        :param api_factory: the web assistants factory to use
+        """
+        self._api_factory = api_factory
+
     def load_candles_from_csv(self, data_path: str):
         """
         This method loads the candles from a CSV file.
@@ -213,6 +244,34 @@ class CandlesBase(NetworkBase):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         raise NotImplementedError
 
+    def ws_subscription_channels(self) -> List[str]:
+        """
+        Returns the websocket channels of the candles of the trading pair.
+        """
+        raise NotImplementedError
+
+    def ws_subscription_payload(self, channels: List[str]) -> Dict[str, Any]:
+        """
+        Returns the payload of the websocket request subscribing to the channels, which can belong to other feeds of
+        the same exchange and interval.
+        :param channels: the channels to subscribe to
+        """
+        raise NotImplementedError
+
+    def get_ws_message_exchange_trading_pair(self, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Returns the exchange trading pair of the candle in a websocket message, or None if the message is not a candle.
+        :param data: the websocket message
+        """
+        raise NotImplementedError
+
+    def _process_websocket_message(self, data: Dict[str, Any]):
+        """
+        Updates the candles with a websocket message of the trading pair.
+        :param data: the websocket message
+        """
+        raise NotImplementedError
+
     async def _sleep(self, delay):
         """
         Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
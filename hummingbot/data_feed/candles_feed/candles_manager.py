@@ -0,0 +1,223 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.network_base import NetworkBase
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.logger import HummingbotLogger
+
+
+class CandlesManager(NetworkBase):
+    """
+    Keeps the candles of many trading pairs of one connector and interval, e.g. for screeners monitoring hundreds of
+    pairs.
+
+    All the feeds do their requests through one throttler, so the historical candles of every pair are fetched
+    concurrently within the rate limits of the exchange instead of each feed assuming it has them for itself. When the
+    exchange supports it, the candles of all the pairs are received through shared websocket connections, as few as
+    the channels limit per connection allows, and routed to their feeds. Otherwise every feed keeps its own websocket.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connector: str, trading_pairs: List[str], interval: str = "1m", max_records: int = 150):
+        super().__init__()
+        if len(trading_pairs) == 0:
+            raise ValueError("At least one trading pair is required.")
+        self._connector = connector
+        self._interval = interval
+        self._max_records = max_records
+        self._feeds: Dict[str, CandlesBase] = {
+            trading_pair: CandlesFactory.get_candle(CandlesConfig(connector=connector,
+                                                                  trading_pair=trading_pair,
+                                                                  interval=interval,
+                                                                  max_records=max_records))
+            for trading_pair in trading_pairs
+        }
+        self._main_feed = next(iter(self._feeds.values()))
+        self._api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=self._main_feed.rate_limits))
+        for feed in self._feeds.values():
+            feed.use_api_factory(self._api_factory)
+        self._listen_candles_tasks: List[asyncio.Task] = []
+
+    @property
+    def connector(self) -> str:
+        return self._connector
+
+    @property
+    def interval(self) -> str:
+        return self._interval
+
+    @property
+    def max_records(self) -> int:
+        return self._max_records
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._feeds)
+
+    @property
+    def feeds(self) -> Dict[str, CandlesBase]:
+        return self._feeds
+
+    @property
+    def ready(self) -> bool:
+        return all(feed.ready for feed in self._feeds.values())
+
+    @property
+    def missing_records(self) -> Dict[str, int]:
+        """
+        Number of candles missing for each trading pair that is not ready yet.
+        """
+        return {trading_pair: feed.max_records - len(feed._candles)
+                for trading_pair, feed in self._feeds.items() if not feed.ready}
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        """
+        The candles of all the trading pairs stacked in one DataFrame, with a trading_pair column before the candle
+        columns, for cross-sectional computations.
+        """
+        trading_pairs = []
+        arrays = []
+        for trading_pair, feed in self._feeds.items():
+            if len(feed._candles) > 0:
+                trading_pairs.append(trading_pair)
+                arrays.append(np.array(feed._candles, dtype=float))
+        columns = self._main_feed.columns
+        if len(arrays) == 0:
+            return pd.DataFrame(columns=["trading_pair"] + columns)
+        df = pd.DataFrame(np.concatenate(arrays), columns=columns)
+        df.insert(0, "trading_pair", np.repeat(trading_pairs, [len(array) for array in arrays]))
+        return df
+
+    def get_candles_df(self, trading_pair: str) -> pd.DataFrame:
+        """
+        Returns the candles of one trading pair.
+        :param trading_pair: str
+        """
+        return self._feeds[trading_pair].candles_df
+
+    def get_column_df(self, column: str) -> pd.DataFrame:
+        """
+        Returns one column of the candles, e.g. the close price, with a row per timestamp and a column per trading pair.
+        :param column: the candle column
+        """
+        return self.candles_df.pivot(index="timestamp", columns="trading_pair", values=column)
+
+    async def check_network(self) -> NetworkStatus:
+        return await self._main_feed.check_network()
+
+    async def start_network(self):
+        await self.stop_network()
+        if self._main_feed.supports_shared_websocket:
+            for feeds in self._get_connections_feeds():
+                self._listen_candles_tasks.append(safe_ensure_future(self.listen_for_subscriptions(feeds)))
+        else:
+            for feed in self._feeds.values():
+                await feed.start_network()
+
+    async def stop_network(self):
+        for task in self._listen_candles_tasks:
+            task.cancel()
+        self._listen_candles_tasks.clear()
+        if not self._main_feed.supports_shared_websocket:
+            for feed in self._feeds.values():
+                await feed.stop_network()
+
+    def _get_connections_feeds(self) -> List[List[CandlesBase]]:
+        """
+        Splits the feeds in groups whose channels fit in one websocket connection.
+        """
+        max_channels = self._main_feed.max_ws_channels_per_connection
+        connections_feeds = [[]]
+        channels_count = 0
+        for feed in self._feeds.values():
+            feed_channels_count = len(feed.ws_subscription_channels())
+            if connections_feeds[-1] and channels_count + feed_channels_count > max_channels:
+                connections_feeds.append([])
+                channels_count = 0
+            connections_feeds[-1].append(feed)
+            channels_count += feed_channels_count
+        return connections_feeds
+
+    async def listen_for_subscriptions(self, feeds: List[CandlesBase]):
+        """
+        Connects to the candlestick websocket endpoint, subscribes to the channels of all the feeds and routes the
+        messages to the feed of their trading pair.
+        :param feeds: the feeds sharing the connection
+        """
+        feeds_by_exchange_trading_pair = {feed.exchange_trading_pair: feed for feed in feeds}
+        ws: Optional[WSAssistant] = None
+        while True:
+            try:
+                ws = await self._connected_websocket_assistant()
+                await self._subscribe_channels(ws, feeds)
+                async for ws_response in ws.iter_messages():
+                    data = ws_response.data
+                    if data is None:  # data will be None when the websocket is disconnected
+                        continue
+                    exchange_trading_pair = self._main_feed.get_ws_message_exchange_trading_pair(data)
+                    feed = feeds_by_exchange_trading_pair.get(exchange_trading_pair)
+                    if feed is not None:
+                        feed._process_websocket_message(data)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                ws and await ws.disconnect()
+                ws = None
+                for feed in feeds:
+                    await feed._on_order_stream_interruption()
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        await ws.connect(ws_url=self._main_feed.wss_url, ping_timeout=30)
+        return ws
+
+    async def _subscribe_channels(self, ws: WSAssistant, feeds: List[CandlesBase]):
+        """
+        Subscribes to the candles channels of the feeds through the provided websocket connection.
+        :param ws: the websocket assistant used to connect to the exchange
+        :param feeds: the feeds sharing the connection
+        """
+        try:
+            channels = [channel for feed in feeds for channel in feed.ws_subscription_channels()]
+            await ws.send(WSJSONRequest(payload=self._main_feed.ws_subscription_payload(channels)))
+            self.logger().info(f"Subscribed to public klines of {len(feeds)} trading pairs...")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                "Unexpected error occurred subscribing to public klines...",
+                exc_info=True
+            )
+            raise
+
+    async def _sleep(self, delay):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
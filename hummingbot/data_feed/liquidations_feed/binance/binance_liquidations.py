@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Iterable, Optional, Set
 
 from bidict import bidict
 
@@ -22,8 +22,11 @@ class BinancePerpetualLiquidations(LiquidationsBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, trading_pairs: Set[str], max_retention_seconds: int):
-        super().__init__(trading_pairs=trading_pairs, max_retention_seconds=max_retention_seconds)
+    def __init__(self, trading_pairs: Set[str], max_retention_seconds: int,
+                 aggregation_windows: Optional[Iterable[int]] = None):
+        super().__init__(trading_pairs=trading_pairs,
+                         max_retention_seconds=max_retention_seconds,
+                         aggregation_windows=aggregation_windows)
 
     @property
     def name(self):
@@ -161,10 +164,7 @@ class BinancePerpetualLiquidations(LiquidationsBase):
                 # SELL-Side means here, that a long position was forcefully liquidated and the other way round
                 liquidation_side = LiquidationSide.LONG if side == "SELL" else LiquidationSide.SHORT
 
-                if trading_pair not in self._liquidations:
-                    self._liquidations[trading_pair] = []
-
-                self._liquidations[trading_pair].append(Liquidation(
+                self._add_liquidation(Liquidation(
                     timestamp=timestamp,
                     trading_pair=trading_pair,
                     quantity=quantity,
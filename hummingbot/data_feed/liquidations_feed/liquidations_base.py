@@ -1,8 +1,8 @@
 import asyncio
 import time
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, fields, replace
 from enum import Enum
-from typing import Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
 from bidict import bidict
@@ -36,20 +36,156 @@ class Liquidation:
     side: LiquidationSide
 
 
+@dataclass
+class LiquidationsAggregate:
+    """
+    Number and notional (quantity * price) by side of the liquidations of a trading pair within a window of time
+    """
+    window_seconds: int
+    count: int = 0
+    long_notional: float = 0.0
+    short_notional: float = 0.0
+
+
+class LiquidationsStore:
+    """
+    Stores the liquidations of a single trading pair in time order, with one list per column. Expired liquidations are
+    dropped by moving the head of the lists, which are compacted only once the expired part is larger than the rest.
+
+    For every aggregation window a rolling aggregate is kept with its own head, updated when a liquidation is added
+    and when it leaves the window. The DataFrame view is built once and cached until the stored liquidations change,
+    which is tracked by a version number incremented on every change.
+    """
+    columns = [f.name for f in fields(Liquidation)]
+
+    def __init__(self, trading_pair: str, max_retention_seconds: int, aggregation_windows: Iterable[int] = ()):
+        self._trading_pair = trading_pair
+        self._max_retention_ms = max_retention_seconds * 1000
+        self._timestamps: List[int] = []
+        self._quantities: List[float] = []
+        self._prices: List[float] = []
+        self._sides: List[LiquidationSide] = []
+        self._head = 0
+        self._aggregates: Dict[int, LiquidationsAggregate] = {
+            window: LiquidationsAggregate(window_seconds=window) for window in aggregation_windows}
+        self._aggregate_heads: Dict[int, int] = {window: 0 for window in aggregation_windows}
+        self._df: Optional[DataFrame] = None
+        self._version = 0
+
+    def __len__(self):
+        return len(self._timestamps) - self._head
+
+    def add(self, liquidation: Liquidation):
+        self._timestamps.append(liquidation.timestamp)
+        self._quantities.append(liquidation.quantity)
+        self._prices.append(liquidation.price)
+        self._sides.append(liquidation.side)
+        notional = liquidation.quantity * liquidation.price
+        for aggregate in self._aggregates.values():
+            self._update_aggregate(aggregate, liquidation.side, notional, 1)
+        self._df = None
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Number of changes of the stored liquidations.
+        """
+        return self._version
+
+    def expire(self, timestamp_ms: int):
+        """
+        Drops the liquidations older than the retention time and updates the aggregates with the ones that left their
+        window.
+
+        :param timestamp_ms: the current time in milliseconds
+        """
+        timestamps = self._timestamps
+        end = len(timestamps)
+        head = self._head
+        retention_cutoff = timestamp_ms - self._max_retention_ms
+        while head < end and timestamps[head] <= retention_cutoff:
+            head += 1
+
+        for window, aggregate in self._aggregates.items():
+            window_head = self._aggregate_heads[window]
+            window_cutoff = timestamp_ms - window * 1000
+            while window_head < end and (window_head < head or timestamps[window_head] <= window_cutoff):
+                self._update_aggregate(aggregate,
+                                       self._sides[window_head],
+                                       self._quantities[window_head] * self._prices[window_head],
+                                       -1)
+                window_head += 1
+            self._aggregate_heads[window] = window_head
+
+        if head != self._head:
+            self._head = head
+            self._df = None
+            self._version += 1
+            if head > end // 2:
+                self._compact()
+
+    def get_aggregate(self, window_seconds: int) -> LiquidationsAggregate:
+        if window_seconds not in self._aggregates:
+            raise ValueError(f"Liquidations are not aggregated over {window_seconds}s windows.")
+        return replace(self._aggregates[window_seconds])
+
+    def to_df(self) -> DataFrame:
+        """
+        Returns the stored liquidations as a DataFrame. The same DataFrame is returned until the liquidations change, so
+        it should not be modified.
+        """
+        if self._df is None:
+            head = self._head
+            self._df = pd.DataFrame({
+                "timestamp": self._timestamps[head:],
+                "trading_pair": [self._trading_pair] * len(self),
+                "quantity": self._quantities[head:],
+                "price": self._prices[head:],
+                "side": self._sides[head:],
+            }, columns=self.columns)
+        return self._df
+
+    def _compact(self):
+        head = self._head
+        for column in (self._timestamps, self._quantities, self._prices, self._sides):
+            del column[:head]
+        for window in self._aggregate_heads:
+            self._aggregate_heads[window] -= head
+        self._head = 0
+
+    @staticmethod
+    def _update_aggregate(aggregate: LiquidationsAggregate, side: LiquidationSide, notional: float, sign: int):
+        aggregate.count += sign
+        if aggregate.count == 0:
+            # Reset the sums so rounding errors don't accumulate
+            aggregate.long_notional = 0.0
+            aggregate.short_notional = 0.0
+        elif side == LiquidationSide.LONG:
+            aggregate.long_notional += sign * notional
+        else:
+            aggregate.short_notional += sign * notional
+
+
 class LiquidationsBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing liquidation data from crypto exchanges. The storage
     is done in a time based manner - meaning an aggregation happens and you can decide how much history you wanto to keep.
     The class uses the WS Assistants for all the IO operations,
+    Subclasses store the liquidations received with _add_liquidation.
     """
 
-    def __init__(self, trading_pairs: Set[str], max_retention_seconds: int):
+    def __init__(self, trading_pairs: Set[str], max_retention_seconds: int,
+                 aggregation_windows: Optional[Iterable[int]] = None):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self._max_retention_seconds = max_retention_seconds
+        self._aggregation_windows: Tuple[int, ...] = tuple(aggregation_windows or ())
         self._trading_pairs = trading_pairs
-        self._liquidations = {}
+        self._liquidations: Dict[str, LiquidationsStore] = {}
+        self._liquidations_df: Optional[DataFrame] = None
+        self._liquidations_df_versions: Tuple[Tuple[str, int], ...] = ()
         self._listen_liquidations_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._subscribed_to_channels = False
@@ -117,46 +253,61 @@ class LiquidationsBase(NetworkBase):
     def _cleanup_old_liquidations(self):
         try:
             current_time_ms = int(time.time() * 1000)
-            if self._liquidations:
-                for trading_pair, liquidations in list(self._liquidations.items()):
-                    self._liquidations[trading_pair] = [
-                        liq for liq in liquidations if
-                        current_time_ms - liq.timestamp < self._max_retention_seconds * 1000
-                    ]
+            for liquidations in self._liquidations.values():
+                liquidations.expire(current_time_ms)
         except Exception:
             self.logger().exception(
                 "Unexpected error occurred when cleaning up outdated liquidations. Retrying in 1 seconds...",
             )
 
+    def _add_liquidation(self, liquidation: Liquidation):
+        """
+        Stores a liquidation received from the exchange.
+        """
+        liquidations = self._liquidations.get(liquidation.trading_pair)
+        if liquidations is None:
+            liquidations = LiquidationsStore(trading_pair=liquidation.trading_pair,
+                                             max_retention_seconds=self._max_retention_seconds,
+                                             aggregation_windows=self._aggregation_windows)
+            self._liquidations[liquidation.trading_pair] = liquidations
+        liquidations.add(liquidation)
+
     def liquidations_df(self, trading_pair=None) -> DataFrame:
         """
         This method returns the liquidations stored as a Pandas DataFrame.
         If no trading_pair is specified, all liquidations are returned in a single DataFrame.
         If the specified trading_pair has no data, an empty DataFrame is returned.
+        The DataFrames are cached until the liquidations change and a copy is returned, so it can be modified.
         """
-        # Dynamically retrieve column names from the Liquidation dataclass
-        column_names = [f.name for f in fields(Liquidation)]
-
-        # Check if a specific trading pair is requested
         if trading_pair:
-            # Retrieve the list of Liquidation objects for the specified trading pair
             liquidations = self._liquidations.get(trading_pair)
-            # If no liquidations are found for the trading pair, return an empty DataFrame
             if not liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of dataclass instances to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in liquidations])
+                return pd.DataFrame(columns=LiquidationsStore.columns)
+            return liquidations.to_df().copy()
         else:
             # No specific trading pair is requested, combine all pairs
-            all_liquidations = []
-            # Iterate over all trading pairs and collect their liquidations
-            for pair_liquidations in self._liquidations.values():
-                all_liquidations.extend(pair_liquidations)
-            # If no liquidations are collected, return an empty DataFrame
-            if not all_liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of all liquidations to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in all_liquidations])
+            stores = [(pair, liquidations) for pair, liquidations in self._liquidations.items() if liquidations]
+            if not stores:
+                return pd.DataFrame(columns=LiquidationsStore.columns)
+            versions = tuple((pair, liquidations.version) for pair, liquidations in stores)
+            if self._liquidations_df is None or versions != self._liquidations_df_versions:
+                self._liquidations_df = pd.concat([liquidations.to_df() for _, liquidations in stores],
+                                                  ignore_index=True)
+                self._liquidations_df_versions = versions
+            return self._liquidations_df.copy()
+
+    def liquidations_aggregate(self, trading_pair: str, window_seconds: int) -> LiquidationsAggregate:
+        """
+        This method returns the number and notional by side of the liquidations of the trading pair in the last
+        window_seconds. The window has to be one of the aggregation windows of the feed.
+        """
+        if window_seconds not in self._aggregation_windows:
+            raise ValueError(f"Liquidations are not aggregated over {window_seconds}s windows.")
+        liquidations = self._liquidations.get(trading_pair)
+        if liquidations is None:
+            return LiquidationsAggregate(window_seconds=window_seconds)
+        liquidations.expire(int(time.time() * 1000))
+        return liquidations.get_aggregate(window_seconds)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -1,24 +1,33 @@
 import time
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.trades_feed import TradesAggregate, TradesFeed
 
 
 class MarketDataProvider:
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self.trades_feeds: Dict[str, TradesFeed] = {}  # Stores instances of trades feeds
         self.connectors = connectors  # Stores instances of connectors
+        # Results of the order book queries, with the order book and its update version when they were computed
+        self._price_snapshot: Dict[Tuple, Tuple[OrderBook, int, Any]] = {}
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
             candle_feed.stop()
         self.candles_feeds.clear()
+        for trades_feed in self.trades_feeds.values():
+            trades_feed.stop()
+        self.trades_feeds.clear()
 
     @property
     def ready(self) -> bool:
@@ -30,6 +39,41 @@ class MarketDataProvider:
     def time(self):
         return time.time()
 
+    def clear_price_snapshot(self):
+        """
+        Discards the results of the order book queries. It is called at the beginning of every tick, so the snapshot
+        only keeps the queries of the current one.
+        """
+        self._price_snapshot.clear()
+
+    def _get_snapshot_order_book(self, connector_name: str, trading_pair: str) -> Optional[OrderBook]:
+        """
+        Returns the order book whose update version invalidates the queries of the trading pair, or None if the
+        connector doesn't keep one (e.g. AMM connectors), in which case the queries are not memoized.
+        """
+        connector = self.get_connector(connector_name)
+        if isinstance(connector, ExchangeBase):
+            return connector.order_books.get(trading_pair)
+        return None
+
+    def _get_snapshot_value(self, connector_name: str, trading_pair: str, query: str, args: Tuple,
+                            compute: Callable[[], Any]):
+        """
+        Returns the result of an order book query, computing it only if the same query wasn't made in this tick or
+        the order book was updated since then. Controllers asking for the same prices share one computation.
+        """
+        order_book = self._get_snapshot_order_book(connector_name, trading_pair)
+        if order_book is None:
+            return compute()
+        key = (connector_name, trading_pair, query, args)
+        version = order_book.update_version
+        cached = self._price_snapshot.get(key)
+        if cached is not None and cached[0] is order_book and cached[1] == version:
+            return cached[2]
+        value = compute()
+        self._price_snapshot[key] = (order_book, version, value)
+        return value
+
     def initialize_candles_feed(self, config: CandlesConfig):
         """
         Initializes a candle feed based on the given configuration.
@@ -48,7 +92,8 @@ class MarketDataProvider:
     def get_candles_feed(self, config: CandlesConfig):
         """
         Retrieves or creates and starts a candle feed based on the given configuration.
-        If an existing feed has a higher or equal max_records, it is reused.
+        If an existing feed has a higher or equal max_records, it is reused. Otherwise it is replaced by a bigger one
+        keeping its trades and windows.
         :param config: CandlesConfig
         :return: Candle feed instance.
         """
@@ -86,6 +131,71 @@ class MarketDataProvider:
             candle_feed.stop()
             del self.candles_feeds[key]
 
+    def get_trades_feed(self, connector_name: str, trading_pair: str, max_records: int = 10000) -> TradesFeed:
+        """
+        Retrieves or creates and starts a feed of the public trades received by the order book of the trading pair.
+        If an existing feed has a higher or equal max_records, it is reused. Otherwise it is replaced by a bigger one
+        keeping its trades and windows.
+        :param connector_name: str
+        :param trading_pair: str
+        :param max_records: Number of trades kept.
+        :return: Trades feed instance.
+        """
+        key = f"{connector_name}_{trading_pair}"
+        existing_feed = self.trades_feeds.get(key)
+
+        if existing_feed and existing_feed.max_records >= max_records:
+            return existing_feed
+        else:
+            trades_feed = TradesFeed(order_book=self.get_order_book(connector_name, trading_pair),
+                                     trading_pair=trading_pair,
+                                     max_records=max_records)
+            if existing_feed:
+                existing_feed.stop()
+                trades_feed.add_trades_from(existing_feed)
+                for window in existing_feed.windows:
+                    trades_feed.add_window(window)
+            self.trades_feeds[key] = trades_feed
+            trades_feed.start()
+            return trades_feed
+
+    def initialize_trades_feed(self, connector_name: str, trading_pair: str, windows: List[float],
+                               max_records: int = 10000):
+        """
+        Initializes a trades feed keeping the aggregates of the given windows.
+        :param connector_name: str
+        :param trading_pair: str
+        :param windows: Windows in seconds.
+        :param max_records: Number of trades kept.
+        """
+        trades_feed = self.get_trades_feed(connector_name, trading_pair, max_records)
+        for window in windows:
+            trades_feed.add_window(window)
+
+    def get_trades_aggregate(self, connector_name: str, trading_pair: str, window_seconds: float) -> TradesAggregate:
+        """
+        Gets the count, volume by side, VWAP, imbalance and intensity of the public trades of the last window_seconds.
+        The aggregates are updated with every trade, the first call for a window starts keeping it.
+        :param connector_name: str
+        :param trading_pair: str
+        :param window_seconds: float
+        :return: TradesAggregate
+        """
+        trades_feed = self.trades_feeds.get(f"{connector_name}_{trading_pair}")
+        if trades_feed is None:
+            trades_feed = self.get_trades_feed(connector_name, trading_pair)
+        return trades_feed.get_aggregate(window_seconds, self.time())
+
+    def stop_trades_feed(self, connector_name: str, trading_pair: str):
+        """
+        Stops the trades feed of the trading pair.
+        :param connector_name: str
+        :param trading_pair: str
+        """
+        trades_feed = self.trades_feeds.pop(f"{connector_name}_{trading_pair}", None)
+        if trades_feed:
+            trades_feed.stop()
+
     def get_connector(self, connector_name: str) -> ConnectorBase:
         """
         Retrieves a connector instance based on the given name.
@@ -116,7 +226,8 @@ class MarketDataProvider:
         :return: Price instance.
         """
         connector = self.get_connector(connector_name)
-        return connector.get_price_by_type(trading_pair, price_type)
+        return self._get_snapshot_value(connector_name, trading_pair, "price_by_type", (price_type,),
+                                        lambda: connector.get_price_by_type(trading_pair, price_type))
 
     def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
         """
@@ -157,7 +268,8 @@ class MarketDataProvider:
         """
 
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.get_price_for_volume(is_buy, volume)
+        return self._get_snapshot_value(connector_name, trading_pair, "price_for_volume", (is_buy, volume),
+                                        lambda: order_book.get_price_for_volume(is_buy, volume))
 
     def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
@@ -181,7 +293,8 @@ class MarketDataProvider:
         :return: OrderBookQueryResult containing the result of the query.
         """
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.get_price_for_quote_volume(is_buy, quote_volume)
+        return self._get_snapshot_value(connector_name, trading_pair, "price_for_quote_volume", (is_buy, quote_volume),
+                                        lambda: order_book.get_price_for_quote_volume(is_buy, quote_volume))
 
     def get_volume_for_price(self, connector_name: str, trading_pair: str, price: float, is_buy: bool) -> OrderBookQueryResult:
         """
@@ -194,7 +307,8 @@ class MarketDataProvider:
         :return: OrderBookQueryResult containing the result of the query.
         """
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.get_volume_for_price(is_buy, price)
+        return self._get_snapshot_value(connector_name, trading_pair, "volume_for_price", (is_buy, price),
+                                        lambda: order_book.get_volume_for_price(is_buy, price))
 
     def get_quote_volume_for_price(self, connector_name: str, trading_pair: str, price: float, is_buy: bool) -> OrderBookQueryResult:
         """
@@ -207,7 +321,8 @@ class MarketDataProvider:
         :return: OrderBookQueryResult containing the result of the query.
         """
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.get_quote_volume_for_price(is_buy, price)
+        return self._get_snapshot_value(connector_name, trading_pair, "quote_volume_for_price", (is_buy, price),
+                                        lambda: order_book.get_quote_volume_for_price(is_buy, price))
 
     def get_vwap_for_volume(self, connector_name: str, trading_pair: str, volume: float,
                             is_buy: bool) -> OrderBookQueryResult:
@@ -221,4 +336,5 @@ class MarketDataProvider:
         :return: OrderBookQueryResult containing the result of the query.
         """
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.get_vwap_for_volume(is_buy, volume)
+        return self._get_snapshot_value(connector_name, trading_pair, "vwap_for_volume", (is_buy, volume),
+                                        lambda: order_book.get_vwap_for_volume(is_buy, volume))
@@ -0,0 +1,200 @@
+import math
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+
+
+@dataclass
+class TradesAggregate:
+    """
+    Public trades of a trading pair within a window of time. Buys and sells are taken from the taker side.
+    """
+    window_seconds: float
+    trades_count: int = 0
+    buy_volume: float = 0.0
+    sell_volume: float = 0.0
+    buy_quote_volume: float = 0.0
+    sell_quote_volume: float = 0.0
+
+    @property
+    def volume(self) -> float:
+        return self.buy_volume + self.sell_volume
+
+    @property
+    def quote_volume(self) -> float:
+        return self.buy_quote_volume + self.sell_quote_volume
+
+    @property
+    def vwap(self) -> float:
+        """
+        Volume weighted average price of the trades, NaN if there are no trades in the window.
+        """
+        volume = self.volume
+        return self.quote_volume / volume if volume > 0 else math.nan
+
+    @property
+    def imbalance(self) -> float:
+        """
+        Difference between the buy and the sell volume over the total volume, from -1 (only sells) to 1 (only buys).
+        """
+        volume = self.volume
+        return (self.buy_volume - self.sell_volume) / volume if volume > 0 else 0.0
+
+    @property
+    def intensity(self) -> float:
+        """
+        Number of trades per second.
+        """
+        return self.trades_count / self.window_seconds
+
+
+class TradesFeed:
+    """
+    Keeps the last public trades of an order book in a ring buffer of max_records, one list per column.
+
+    A rolling aggregate is kept for every window added to the feed, with the position of its oldest trade in the
+    buffer. Trades are added to the aggregates as they arrive and removed when they leave the window or are overwritten
+    in the buffer, so getting an aggregate only costs the trades that expired since the last query.
+    """
+
+    def __init__(self, order_book: OrderBook, trading_pair: str, max_records: int = 10000):
+        self._order_book = order_book
+        self._trading_pair = trading_pair
+        self._max_records = max_records
+        self._timestamps: List[float] = [0.0] * max_records
+        self._prices: List[float] = [0.0] * max_records
+        self._amounts: List[float] = [0.0] * max_records
+        self._is_buy: List[bool] = [False] * max_records
+        # Number of trades added, and position of the next one
+        self._trades_added = 0
+        self._aggregates: Dict[float, TradesAggregate] = {}
+        self._aggregate_starts: Dict[float, int] = {}
+        self._trade_forwarder = EventForwarder(self._process_trade_event)
+        self._started = False
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def max_records(self) -> int:
+        return self._max_records
+
+    @property
+    def windows(self) -> List[float]:
+        return list(self._aggregates)
+
+    @property
+    def trades_count(self) -> int:
+        return min(self._trades_added, self._max_records)
+
+    @property
+    def last_trade_price(self) -> Optional[float]:
+        if self._trades_added == 0:
+            return None
+        return self._prices[(self._trades_added - 1) % self._max_records]
+
+    def start(self):
+        if not self._started:
+            self._order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
+            self._started = True
+
+    def stop(self):
+        if self._started:
+            self._order_book.remove_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
+            self._started = False
+
+    def add_window(self, window_seconds: float):
+        """
+        Starts keeping the aggregate of a new window, initialized with the trades already in the buffer.
+        """
+        if window_seconds in self._aggregates:
+            return
+        aggregate = TradesAggregate(window_seconds=window_seconds)
+        start = self._oldest_position()
+        for position in range(start, self._trades_added):
+            self._update_aggregate(aggregate, position % self._max_records, 1)
+        self._aggregates[window_seconds] = aggregate
+        self._aggregate_starts[window_seconds] = start
+
+    def add_trade(self, timestamp: float, price: float, amount: float, is_buy: bool):
+        position = self._trades_added
+        index = position % self._max_records
+        if position >= self._max_records:
+            overwritten_position = position - self._max_records
+            for window, aggregate in self._aggregates.items():
+                if self._aggregate_starts[window] <= overwritten_position:
+                    self._update_aggregate(aggregate, index, -1)
+                    self._aggregate_starts[window] = overwritten_position + 1
+        self._timestamps[index] = timestamp
+        self._prices[index] = price
+        self._amounts[index] = amount
+        self._is_buy[index] = is_buy
+        self._trades_added += 1
+        for aggregate in self._aggregates.values():
+            self._update_aggregate(aggregate, index, 1)
+
+    def add_trades_from(self, trades_feed: "TradesFeed"):
+        """
+        Adds the trades kept by another feed, oldest first, e.g. when this feed replaces a smaller one.
+        """
+        for position in range(trades_feed._oldest_position(), trades_feed._trades_added):
+            index = position % trades_feed._max_records
+            self.add_trade(trades_feed._timestamps[index],
+                           trades_feed._prices[index],
+                           trades_feed._amounts[index],
+                           trades_feed._is_buy[index])
+
+    def expire(self, timestamp: float):
+        """
+        Removes from the aggregates the trades that left their window.
+
+        :param timestamp: the current time in seconds
+        """
+        for window, aggregate in self._aggregates.items():
+            start = self._aggregate_starts[window]
+            cutoff = timestamp - window
+            while start < self._trades_added and self._timestamps[start % self._max_records] <= cutoff:
+                self._update_aggregate(aggregate, start % self._max_records, -1)
+                start += 1
+            self._aggregate_starts[window] = start
+
+    def get_aggregate(self, window_seconds: float, timestamp: float) -> TradesAggregate:
+        """
+        Returns the aggregate of the trades in the window ending at the given timestamp.
+
+        :param window_seconds: the window, added to the feed if it wasn't yet
+        :param timestamp: the current time in seconds
+        """
+        self.add_window(window_seconds)
+        self.expire(timestamp)
+        return replace(self._aggregates[window_seconds])
+
+    def _oldest_position(self) -> int:
+        return max(self._trades_added - self._max_records, 0)
+
+    def _update_aggregate(self, aggregate: TradesAggregate, index: int, sign: int):
+        aggregate.trades_count += sign
+        if aggregate.trades_count == 0:
+            # Reset the sums so rounding errors don't accumulate
+            aggregate.buy_volume = aggregate.sell_volume = 0.0
+            aggregate.buy_quote_volume = aggregate.sell_quote_volume = 0.0
+            return
+        amount = self._amounts[index]
+        quote_amount = amount * self._prices[index]
+        if self._is_buy[index]:
+            aggregate.buy_volume += sign * amount
+            aggregate.buy_quote_volume += sign * quote_amount
+        else:
+            aggregate.sell_volume += sign * amount
+            aggregate.sell_quote_volume += sign * quote_amount
+
+    def _process_trade_event(self, event: OrderBookTradeEvent):
+        self.add_trade(timestamp=event.timestamp,
+                       price=float(event.price),
+                       amount=float(event.amount),
+                       is_buy=event.type == TradeType.BUY)
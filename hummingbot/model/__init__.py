@@ -4,6 +4,7 @@ HummingbotBase = declarative_base()
 
 
 def get_declarative_base():
+    from .market_order_state import MarketOrderState  # noqa: F401
     from .market_state import MarketState  # noqa: F401
     from .metadata import Metadata  # noqa: F401
     from .order import Order  # noqa: F401
@@ -11,4 +12,5 @@ def get_declarative_base():
     from .range_position_collected_fees import RangePositionCollectedFees  # noqa: F401
     from .range_position_update import RangePositionUpdate  # noqa: F401
     from .trade_fill import TradeFill  # noqa: F401
+    from .trade_performance import TradePerformance  # noqa: F401
     return HummingbotBase
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text, UniqueConstraint
+
+from . import HummingbotBase
+
+
+class MarketOrderState(HummingbotBase):
+    """
+    Saved state of one tracked order of a market.
+    """
+    __tablename__ = "MarketOrderState"
+    __table_args__ = (UniqueConstraint("config_file_path", "market", "order_id"),
+                      Index("mos_config_market_index",
+                            "config_file_path", "market"))
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    order_id = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    saved_state = Column(JSON, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"MarketOrderState(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', order_id='{self.order_id}', timestamp={self.timestamp}, " \
+            f"saved_state={self.saved_state})"
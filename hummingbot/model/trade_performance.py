@@ -0,0 +1,283 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text, UniqueConstraint, func
+from sqlalchemy.orm import Session
+
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+
+def _add_trade_fill(totals: Any, trade_fill: TradeFill):
+    """
+    Accumulates a trade fill into either a `TradePerformance` row or a `TradePerformanceTotals`, following the same
+    rules `PerformanceMetrics` applies to the list of trade fills.
+    """
+    price = Decimal(str(trade_fill.price))
+    amount = Decimal(str(trade_fill.amount))
+    trade_fee = trade_fill.trade_fee or {}
+    fees = {token: Decimal(str(fee)) for token, fee in (totals.fees or {}).items()}
+
+    if totals.first_timestamp is None or trade_fill.timestamp < totals.first_timestamp:
+        totals.first_timestamp = trade_fill.timestamp
+        totals.first_price = price
+    if totals.last_timestamp is None or trade_fill.timestamp >= totals.last_timestamp:
+        totals.last_timestamp = trade_fill.timestamp
+        totals.last_price = price
+
+    if trade_fill.trade_type.upper() == TradeType.BUY.name:
+        totals.num_buys = (totals.num_buys or 0) + 1
+        totals.b_vol_base = (totals.b_vol_base or s_decimal_0) + amount
+        totals.b_vol_quote = (totals.b_vol_quote or s_decimal_0) - amount * price
+    elif trade_fill.trade_type.upper() == TradeType.SELL.name:
+        totals.num_sells = (totals.num_sells or 0) + 1
+        totals.s_vol_base = (totals.s_vol_base or s_decimal_0) - amount
+        totals.s_vol_quote = (totals.s_vol_quote or s_decimal_0) + amount * price
+    if trade_fill.position not in (None, PositionAction.NIL.value):
+        totals.num_position_fills = (totals.num_position_fills or 0) + 1
+
+    if trade_fee.get("percent") is not None:
+        fee_percent = Decimal(str(trade_fee["percent"]))
+        fees[trade_fill.quote_asset] = fees.get(trade_fill.quote_asset, s_decimal_0) + price * amount * fee_percent
+        if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+            totals.deducted_fee_impact = (totals.deducted_fee_impact or s_decimal_0) - amount * price * fee_percent
+    for flat_fee in trade_fee.get("flat_fees", []):
+        fees[flat_fee["token"]] = fees.get(flat_fee["token"], s_decimal_0) + Decimal(str(flat_fee["amount"]))
+    totals.fees = {token: str(fee) for token, fee in fees.items()}
+
+
+@dataclass
+class TradePerformanceTotals:
+    """
+    Trade fill aggregates of a market and trading pair over a time range, built from the `TradePerformance` buckets.
+    """
+    market: str
+    symbol: str
+    quote_asset: str
+    first_timestamp: Optional[int] = None
+    last_timestamp: Optional[int] = None
+    first_price: Decimal = s_decimal_0
+    last_price: Decimal = s_decimal_0
+    num_buys: int = 0
+    num_sells: int = 0
+    num_position_fills: int = 0
+    b_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+    deducted_fee_impact: Decimal = s_decimal_0
+    fees: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def fee_amounts(self) -> Dict[str, Decimal]:
+        return {token: Decimal(fee) for token, fee in self.fees.items()}
+
+    def add_trade_fill(self, trade_fill: TradeFill):
+        _add_trade_fill(self, trade_fill)
+
+    def add_bucket(self, bucket: "TradePerformance"):
+        if self.first_timestamp is None or bucket.first_timestamp < self.first_timestamp:
+            self.first_timestamp = bucket.first_timestamp
+            self.first_price = bucket.first_price
+        if self.last_timestamp is None or bucket.last_timestamp >= self.last_timestamp:
+            self.last_timestamp = bucket.last_timestamp
+            self.last_price = bucket.last_price
+        self.num_buys += bucket.num_buys
+        self.num_sells += bucket.num_sells
+        self.num_position_fills += bucket.num_position_fills
+        self.b_vol_base += bucket.b_vol_base
+        self.b_vol_quote += bucket.b_vol_quote
+        self.s_vol_base += bucket.s_vol_base
+        self.s_vol_quote += bucket.s_vol_quote
+        self.deducted_fee_impact += bucket.deducted_fee_impact
+        fees = self.fee_amounts
+        for token, fee in bucket.fees.items():
+            fees[token] = fees.get(token, s_decimal_0) + Decimal(fee)
+        self.fees = {token: str(fee) for token, fee in fees.items()}
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "market": self.market,
+            "symbol": self.symbol,
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+            "first_price": str(self.first_price),
+            "last_price": str(self.last_price),
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_base": str(self.s_vol_base),
+            "s_vol_quote": str(self.s_vol_quote + self.deducted_fee_impact),
+            "fees": dict(self.fees),
+        }
+
+
+class TradePerformance(HummingbotBase):
+    """
+    Performance ledger of the trade fills of a strategy config file, kept per market, trading pair and fixed size
+    time bucket. The buckets are updated together with every recorded trade fill, so the performance over a time
+    range is read from a few indexed rows instead of being recomputed from all the fills.
+    """
+    __tablename__ = "TradePerformance"
+    __table_args__ = (UniqueConstraint("config_file_path", "market", "symbol", "bucket_timestamp"),
+                      Index("tp_config_timestamp_index",
+                            "config_file_path", "bucket_timestamp"))
+
+    BUCKET_SIZE_MS = 60 * 1000
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    quote_asset = Column(Text, nullable=False)
+    bucket_timestamp = Column(BigInteger, nullable=False)
+    first_timestamp = Column(BigInteger, nullable=False)
+    last_timestamp = Column(BigInteger, nullable=False)
+    first_price = Column(SqliteDecimal(6), nullable=False)
+    last_price = Column(SqliteDecimal(6), nullable=False)
+    num_buys = Column(Integer, nullable=False, default=0)
+    num_sells = Column(Integer, nullable=False, default=0)
+    num_position_fills = Column(Integer, nullable=False, default=0)
+    b_vol_base = Column(SqliteDecimal(6), nullable=False, default=0)
+    b_vol_quote = Column(SqliteDecimal(6), nullable=False, default=0)
+    s_vol_base = Column(SqliteDecimal(6), nullable=False, default=0)
+    s_vol_quote = Column(SqliteDecimal(6), nullable=False, default=0)
+    deducted_fee_impact = Column(SqliteDecimal(6), nullable=False, default=0)
+    fees = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TradePerformance(config_file_path='{self.config_file_path}', market='{self.market}', " \
+               f"symbol='{self.symbol}', bucket_timestamp={self.bucket_timestamp}, num_buys={self.num_buys}, " \
+               f"num_sells={self.num_sells}, b_vol_base={self.b_vol_base}, s_vol_base={self.s_vol_base}, " \
+               f"fees={self.fees})"
+
+    @classmethod
+    def bucket_of(cls, timestamp: int) -> int:
+        return timestamp - timestamp % cls.BUCKET_SIZE_MS
+
+    @classmethod
+    def add_trade_fill(cls, sql_session: Session, trade_fill: TradeFill):
+        """
+        Adds the trade fill to its bucket. It should be called in the same transaction that records the fill.
+        """
+        bucket_timestamp = cls.bucket_of(trade_fill.timestamp)
+        bucket: Optional[TradePerformance] = (sql_session
+                                              .query(cls)
+                                              .filter(cls.config_file_path == trade_fill.config_file_path,
+                                                      cls.market == trade_fill.market,
+                                                      cls.symbol == trade_fill.symbol,
+                                                      cls.bucket_timestamp == bucket_timestamp)
+                                              .one_or_none())
+        if bucket is None:
+            bucket = cls.new_bucket(trade_fill)
+            sql_session.add(bucket)
+        _add_trade_fill(bucket, trade_fill)
+
+    @classmethod
+    def new_bucket(cls, trade_fill: TradeFill) -> "TradePerformance":
+        return cls(config_file_path=trade_fill.config_file_path,
+                   market=trade_fill.market,
+                   symbol=trade_fill.symbol,
+                   quote_asset=trade_fill.quote_asset,
+                   bucket_timestamp=cls.bucket_of(trade_fill.timestamp),
+                   num_buys=0,
+                   num_sells=0,
+                   num_position_fills=0,
+                   b_vol_base=s_decimal_0,
+                   b_vol_quote=s_decimal_0,
+                   s_vol_base=s_decimal_0,
+                   s_vol_quote=s_decimal_0,
+                   deducted_fee_impact=s_decimal_0,
+                   fees={})
+
+    @classmethod
+    def rebuild(cls, sql_session: Session, config_file_path: str):
+        """
+        Recreates the buckets of the config file from its recorded trade fills, for fills recorded before the ledger
+        existed.
+        """
+        sql_session.query(cls).filter(cls.config_file_path == config_file_path).delete()
+        buckets: Dict[Tuple[str, str, int], TradePerformance] = {}
+        trade_fills: Iterable[TradeFill] = (sql_session
+                                            .query(TradeFill)
+                                            .filter(TradeFill.config_file_path == config_file_path)
+                                            .order_by(TradeFill.timestamp)
+                                            .yield_per(1000))
+        for trade_fill in trade_fills:
+            key = (trade_fill.market, trade_fill.symbol, cls.bucket_of(trade_fill.timestamp))
+            if key not in buckets:
+                buckets[key] = cls.new_bucket(trade_fill)
+            _add_trade_fill(buckets[key], trade_fill)
+        sql_session.add_all(buckets.values())
+
+    @classmethod
+    def is_consistent(cls, sql_session: Session, config_file_path: str) -> bool:
+        """
+        Checks that every trade fill of the config file is accounted for in the ledger.
+        """
+        ledger_fills = (sql_session
+                        .query(func.sum(cls.num_buys + cls.num_sells))
+                        .filter(cls.config_file_path == config_file_path)
+                        .scalar()) or 0
+        recorded_fills = (sql_session
+                          .query(func.count(TradeFill.exchange_trade_id))
+                          .filter(TradeFill.config_file_path == config_file_path,
+                                  TradeFill.trade_type.in_([TradeType.BUY.name, TradeType.SELL.name]))
+                          .scalar()) or 0
+        return ledger_fills == recorded_fills
+
+    @classmethod
+    def get_totals(cls,
+                   sql_session: Session,
+                   config_file_path: str,
+                   start_time: int,
+                   end_time: Optional[int] = None) -> List[TradePerformanceTotals]:
+        """
+        Returns the trade fill aggregates per market and trading pair for fills with start_time <= timestamp <
+        end_time (in milliseconds). Whole buckets are read from the ledger, the fills of the buckets cut by the range
+        limits are read from the trade fills.
+        """
+        first_whole_bucket = cls.bucket_of(start_time + cls.BUCKET_SIZE_MS - 1)
+        end_of_whole_buckets = cls.bucket_of(end_time) if end_time is not None else None
+        totals: Dict[Tuple[str, str], TradePerformanceTotals] = {}
+
+        def totals_for(market: str, symbol: str, quote_asset: str) -> TradePerformanceTotals:
+            if (market, symbol) not in totals:
+                totals[(market, symbol)] = TradePerformanceTotals(market, symbol, quote_asset)
+            return totals[(market, symbol)]
+
+        if end_of_whole_buckets is not None and end_of_whole_buckets <= first_whole_bucket:
+            edge_ranges = [(start_time, end_time)]
+        else:
+            edge_ranges = [(start_time, first_whole_bucket)]
+            if end_of_whole_buckets is not None:
+                edge_ranges.append((end_of_whole_buckets, end_time))
+            filters = [cls.config_file_path == config_file_path, cls.bucket_timestamp >= first_whole_bucket]
+            if end_of_whole_buckets is not None:
+                filters.append(cls.bucket_timestamp < end_of_whole_buckets)
+            for bucket in sql_session.query(cls).filter(*filters):
+                totals_for(bucket.market, bucket.symbol, bucket.quote_asset).add_bucket(bucket)
+
+        for range_start, range_end in edge_ranges:
+            if range_start >= range_end:
+                continue
+            trade_fills = (sql_session
+                           .query(TradeFill)
+                           .filter(TradeFill.config_file_path == config_file_path,
+                                   TradeFill.timestamp >= range_start,
+                                   TradeFill.timestamp < range_end))
+            for trade_fill in trade_fills:
+                totals_for(trade_fill.market, trade_fill.symbol, trade_fill.quote_asset).add_trade_fill(trade_fill)
+
+        return [total for total in totals.values() if total.num_trades > 0]
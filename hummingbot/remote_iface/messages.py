@@ -26,6 +26,18 @@ class InternalEventMessage(PubSubMessage):
     data: Optional[dict] = {}
 
 
+class InternalEventBatchMessage(PubSubMessage):
+    timestamp: Optional[int] = -1
+    type: Optional[str] = 'ievent_batch'
+    events: Optional[List[Dict[str, Any]]] = []
+
+
+class MarketDataMessage(PubSubMessage):
+    timestamp: Optional[int] = -1
+    type: Optional[str] = 'market_data'
+    data: Optional[List[Dict[str, Any]]] = []
+
+
 class LogMessage(PubSubMessage):
     timestamp: float = 0.0
     msg: str = ''
@@ -104,17 +116,31 @@ class StatusCommandMessage(RPCMessage):
         data: Optional[Any] = ''
 
 
+class TickStatsCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        reset: Optional[bool] = False
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        data: Optional[Dict[str, Any]] = {}
+
+
 class HistoryCommandMessage(RPCMessage):
     class Request(RPCMessage.Request):
         days: Optional[float] = 0
         verbose: Optional[bool] = False
         precision: Optional[int] = None
         async_backend: Optional[bool] = True
+        summary: Optional[bool] = False
+        start_time: Optional[float] = None
+        end_time: Optional[float] = None
 
     class Response(RPCMessage.Response):
         status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
         msg: Optional[str] = ''
         trades: Optional[List[Any]] = []
+        performance: Optional[List[Any]] = []
 
 
 class BalanceLimitCommandMessage(RPCMessage):
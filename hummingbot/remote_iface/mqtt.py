@@ -39,13 +39,16 @@ from hummingbot.remote_iface.messages import (
     ExternalEventMessage,
     HistoryCommandMessage,
     ImportCommandMessage,
+    InternalEventBatchMessage,
     InternalEventMessage,
     LogMessage,
+    MarketDataMessage,
     NotifyMessage,
     StartCommandMessage,
     StatusCommandMessage,
     StatusUpdateMessage,
     StopCommandMessage,
+    TickStatsCommandMessage,
 )
 
 mqtts_logger: HummingbotLogger = None
@@ -61,6 +64,7 @@ class CommandTopicSpecs:
     BALANCE_LIMIT: str = '/balance/limit'
     BALANCE_PAPER: str = '/balance/paper'
     COMMAND_SHORTCUT: str = '/command_shortcuts'
+    TICK_STATS: str = '/tick_stats'
 
 
 class TopicSpecs:
@@ -68,6 +72,8 @@ class TopicSpecs:
     COMMANDS: CommandTopicSpecs = CommandTopicSpecs()
     LOGS: str = '/log'
     INTERNAL_EVENTS: str = '/events'
+    INTERNAL_EVENTS_BATCH: str = '/events/batch'
+    MARKET_DATA: str = '/market_data'
     NOTIFICATIONS: str = '/notify'
     STATUS_UPDATES: str = '/status_updates'
     HEARTBEATS: str = '/hb'
@@ -100,6 +106,7 @@ class MQTTCommands:
         self._balance_limit_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_LIMIT}'
         self._balance_paper_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_PAPER}'
         self._shortcuts_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.COMMAND_SHORTCUT}'
+        self._tick_stats_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.TICK_STATS}'
 
         self._init_commands()
 
@@ -149,6 +156,11 @@ class MQTTCommands:
             msg_type=CommandShortcutMessage,
             on_request=self._on_cmd_command_shortcut
         )
+        self._node.create_rpc(
+            rpc_name=self._tick_stats_uri,
+            msg_type=TickStatsCommandMessage,
+            on_request=self._on_cmd_tick_stats
+        )
 
     def _on_cmd_start(self, msg: StartCommandMessage.Request):
         response = StartCommandMessage.Response()
@@ -314,6 +326,10 @@ class MQTTCommands:
         try:
             if msg.async_backend:
                 self._hb_app.history(msg.days, msg.verbose, msg.precision)
+            elif msg.summary:
+                performance = self._hb_app.get_history_performance_json(msg.days, msg.start_time, msg.end_time)
+                if performance:
+                    response.performance = performance
             else:
                 trades = self._hb_app.get_history_trades_json(msg.days)
                 if trades:
@@ -359,8 +375,41 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    def _on_cmd_tick_stats(self, msg: TickStatsCommandMessage.Request):
+        response = TickStatsCommandMessage.Response()
+        try:
+            if self._hb_app.clock is None:
+                response.status = MQTT_STATUS_CODE.ERROR
+                response.msg = 'No strategy is currently running!'
+                return response
+            response.data = self._hb_app.get_tick_stats_json()
+            if msg.reset:
+                self._ev_loop.call_soon_threadsafe(self._hb_app.clock.reset_tick_stats)
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
 
 class MQTTMarketEventForwarder:
+    EVENT_TYPES: Dict[int, str] = {
+        events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
+        events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
+        events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
+        events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
+        events.MarketEvent.OrderFilled.value: "OrderFilled",
+        events.MarketEvent.OrderCancelled.value: "OrderCancelled",
+        events.MarketEvent.OrderExpired.value: "OrderExpired",
+        events.MarketEvent.OrderFailure.value: "OrderFailure",
+        events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
+        events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
+        events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
+        events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
+        events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
+        events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
+        events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
+    }
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -409,6 +458,19 @@ class MQTTMarketEventForwarder:
         self.event_fw_pub = self._node.create_publisher(
             topic=self._topic, msg_type=InternalEventMessage
         )
+
+        # Events are conflated into a single batch message per window when a
+        # batch interval is configured, otherwise every event is published as is.
+        self._batch_interval: float = float(
+            self._hb_app.client_config_map.mqtt_bridge.mqtt_events_batch_interval)
+        self._pending_events: List[Dict[str, Any]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.event_batch_pub = None
+        if self._batch_interval > 0:
+            self.event_batch_pub = self._node.create_publisher(
+                topic=f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS_BATCH}',
+                msg_type=InternalEventBatchMessage
+            )
         self._start_event_listeners()
 
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
@@ -420,27 +482,7 @@ class MQTTMarketEventForwarder:
                 event
             )
             return
-        try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-                events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
-                events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
+        event_type = self.EVENT_TYPES.get(event_tag, "Unknown")
 
         if is_dataclass(event):
             event_data = asdict(event)
@@ -459,6 +501,16 @@ class MQTTMarketEventForwarder:
 
         event_data = self._make_event_payload(event_data)
 
+        if self.event_batch_pub is not None:
+            self._pending_events.append({
+                "timestamp": int(timestamp),
+                "type": event_type,
+                "data": event_data,
+            })
+            if self._flush_handle is None:
+                self._flush_handle = self._ev_loop.call_later(self._batch_interval, self._flush_events)
+            return
+
         self.event_fw_pub.publish(
             InternalEventMessage(
                 timestamp=int(timestamp),
@@ -467,6 +519,18 @@ class MQTTMarketEventForwarder:
             )
         )
 
+    def _flush_events(self):
+        self._flush_handle = None
+        if len(self._pending_events) == 0:
+            return
+        pending_events, self._pending_events = self._pending_events, []
+        self.event_batch_pub.publish(
+            InternalEventBatchMessage(
+                timestamp=int(time.time() * 1e3),
+                events=pending_events
+            )
+        )
+
     def _make_event_payload(self, event_data):
         if 'type' in event_data:
             event_data['type'] = str(event_data['type'])
@@ -500,6 +564,98 @@ class MQTTMarketEventForwarder:
         for market in self._markets:
             for event_pair in self._market_event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self.event_batch_pub is not None:
+            self._flush_events()
+
+
+class MQTTMarketDataPublisher:
+    """
+    Publishes a throttled top of book and inventory snapshot for every
+    connector and trading pair. Only the entries that changed since the last
+    publication are included, so idle markets do not produce any traffic.
+    """
+    def __init__(self,
+                 hb_app: "HummingbotApplication",
+                 node: Node):
+        self._hb_app = hb_app
+        self._node = node
+        self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
+        self._interval: float = float(self._hb_app.client_config_map.mqtt_bridge.mqtt_market_data_interval)
+        self._last_snapshot: Dict[Tuple[str, str], Tuple[float, ...]] = {}
+        self._publish_task: Optional[asyncio.Task] = None
+
+        topic_prefix = TopicSpecs.PREFIX.format(
+            namespace=self._node.namespace,
+            instance_id=self._hb_app.instance_id
+        )
+        self._topic = f'{topic_prefix}{TopicSpecs.MARKET_DATA}'
+        self.market_data_pub = self._node.create_publisher(
+            topic=self._topic,
+            msg_type=MarketDataMessage
+        )
+
+    def start(self):
+        if self._publish_task is None:
+            self._publish_task = safe_ensure_future(self._publish_loop(), loop=self._ev_loop)
+
+    def stop(self):
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            self._publish_task = None
+        self._last_snapshot.clear()
+
+    async def _publish_loop(self):
+        while True:
+            try:
+                self.publish_market_data()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                MQTTMarketEventForwarder.logger().error(
+                    "Unexpected error publishing MQTT market data.", exc_info=True)
+            await asyncio.sleep(self._interval)
+
+    def publish_market_data(self):
+        data = self._collect_changed_market_data()
+        if len(data) > 0:
+            self.market_data_pub.publish(
+                MarketDataMessage(
+                    timestamp=int(time.time() * 1e3),
+                    data=data
+                )
+            )
+
+    def _collect_changed_market_data(self) -> List[Dict[str, Any]]:
+        data = []
+        for connector_name, market in self._hb_app.markets.items():
+            for trading_pair, order_book in market.order_books.items():
+                try:
+                    best_bid = order_book.get_price(False)
+                    best_ask = order_book.get_price(True)
+                except EnvironmentError:
+                    continue
+                base, quote = trading_pair.split("-")
+                base_balance = float(market.get_balance(base))
+                quote_balance = float(market.get_balance(quote))
+                snapshot = (best_bid, best_ask, base_balance, quote_balance)
+                key = (connector_name, trading_pair)
+                if self._last_snapshot.get(key) == snapshot:
+                    continue
+                self._last_snapshot[key] = snapshot
+                data.append({
+                    "connector": connector_name,
+                    "trading_pair": trading_pair,
+                    "best_bid": best_bid,
+                    "best_ask": best_ask,
+                    "mid_price": (best_bid + best_ask) / 2,
+                    "spread": best_ask - best_bid,
+                    "base_balance": base_balance,
+                    "quote_balance": quote_balance,
+                })
+        return data
 
 
 class MQTTNotifier(NotifierBase):
@@ -601,6 +757,7 @@ class MQTTGateway(Node):
         self._notifier: MQTTNotifier = None
         self._status_updates: MQTTStatusUpdates = None
         self._market_events: MQTTMarketEventForwarder = None
+        self._market_data: MQTTMarketDataPublisher = None
         self._commands: MQTTCommands = None
         self._logh: MQTTLogHandler = None
         self._external_events: MQTTExternalEvents = None
@@ -725,10 +882,20 @@ class MQTTGateway(Node):
             self._market_events = MQTTMarketEventForwarder(self._hb_app, self)
             if self.state == NodeState.RUNNING:
                 self._market_events.event_fw_pub.run()
+                if self._market_events.event_batch_pub is not None:
+                    self._market_events.event_batch_pub.run()
+        if self._hb_app.client_config_map.mqtt_bridge.mqtt_market_data:
+            self._market_data = MQTTMarketDataPublisher(self._hb_app, self)
+            if self.state == NodeState.RUNNING:
+                self._market_data.market_data_pub.run()
+            self._market_data.start()
 
     def _remove_market_event_listeners(self):
         if self._market_events is not None:
             self._market_events._stop_event_listeners()
+        if self._market_data is not None:
+            self._market_data.stop()
+            self._market_data = None
 
     def _init_external_events(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_external_events:
@@ -1,11 +1,22 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Keeps the last `length` values added.
+
+    Every value is written twice, at `i` and `i + length` of a buffer of `2 * length`, so the values in insertion
+    order are always a contiguous slice of the buffer and can be returned as a NumPy view without any copy.
+
+    The sum of the values, and once the buffer is full the sum of squared deviations from the mean, are updated with
+    every new value, which makes mean, variance and standard deviation O(1). Both are recomputed from the values once
+    every `length` additions so rounding errors don't accumulate.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -14,67 +25,106 @@ cdef class RingBuffer:
         return pmm_logger
 
     def __cinit__(self, int length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(length)
 
     def __dealloc__(self):
         self._buffer = None
 
+    cdef void c_reset(self, int64_t length):
+        self._length = length
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
+        self._delimiter = 0
+        self._is_full = False
+        self._sum = 0
+        self._sum_of_squared_deviations = 0
+        self._additions_since_recompute = 0
+
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double new_value = val
+            double old_value
+            double old_mean
+            double new_mean
+            bint was_full = self._is_full
+
+        if was_full:
+            old_value = self._buffer[self._delimiter]
+            old_mean = self._sum / self._length
+            self._sum += new_value - old_value
+            new_mean = self._sum / self._length
+            self._sum_of_squared_deviations += (new_value - old_value) * (new_value - new_mean + old_value - old_mean)
+        else:
+            self._sum += new_value
+        self._buffer[self._delimiter] = new_value
+        self._buffer[self._delimiter + self._length] = new_value
         self.c_increment_delimiter()
 
+        self._additions_since_recompute += 1
+        if self._is_full and (not was_full or self._additions_since_recompute >= self._length):
+            self.c_recompute_statistics()
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_recompute_statistics(self):
+        cdef np.ndarray[np.double_t, ndim=1] values
+        values = self.c_get_as_numpy_view()
+        self._sum = np.sum(values)
+        self._sum_of_squared_deviations = np.sum(np.square(values - np.mean(values))) if self._is_full else 0
+        self._additions_since_recompute = 0
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[self._delimiter - 1 + self._length]
 
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum_value(self):
+        return self._sum
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._sum / self._length
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = max(self._sum_of_squared_deviations, 0) / self._length
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_view(self):
+        cdef np.ndarray[np.double_t, ndim=1] view
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+            view = np.asarray(self._buffer)[:self._delimiter]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            view = np.asarray(self._buffer)[self._delimiter:self._delimiter + self._length]
+        view.flags.writeable = False
+        return view
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_as_numpy_view().copy()
 
     def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(length)
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +132,12 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        Read only view of the values in insertion order. It is only valid until the next value is added.
+        """
+        return self.c_get_as_numpy_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +145,14 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum_value(self):
+        return self.c_sum_value()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -109,10 +173,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
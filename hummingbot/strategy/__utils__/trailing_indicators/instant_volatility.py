@@ -1,19 +1,44 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Squared differences between consecutive samples of the sampling buffer, their running sum makes each
+        # volatility calculation O(1)
+        self._squared_diffs_buffer = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        previous_value = self._sampling_buffer.get_last_value()
+        self._sampling_buffer.add_value(value)
+        if not np.isnan(previous_value):
+            diff = self._sampling_buffer.get_last_value() - previous_value
+            self._squared_diffs_buffer.add_value(diff * diff)
+        self._processing_buffer.add_value(self._indicator_calculation())
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        samples_count = self._sampling_buffer.size
+        if samples_count < 2:
+            return 0.0
+        vol = np.sqrt(max(self._squared_diffs_buffer.sum_value, 0) / samples_count)
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._squared_diffs_buffer = RingBuffer(max(value - 1, 1))
+        for squared_diff in np.square(np.diff(self._sampling_buffer.get_as_numpy_view())):
+            self._squared_diffs_buffer.add_value(squared_diff)
@@ -13,6 +13,12 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _sample_timestamps
+        dict _amounts_by_price_level
+        dict _trades_by_price_level
+        bint _samples_changed
+        bint _background_estimation
+        object _estimation_task
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
@@ -23,7 +29,10 @@ cdef class TradingIntensityIndicator:
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_to_sample(self, object sample_timestamp, dict trade)
+    cdef c_remove_sample(self, object sample_timestamp)
     cdef c_estimate_intensity(self)
+    cdef c_set_intensity(self, object params)
 
 cdef class TradesForwarder(EventListener):
     cdef:
@@ -1,9 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+import asyncio
+import heapq
 import warnings
-from decimal import Decimal
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -15,8 +16,31 @@ from hummingbot.core.data_type.common import (
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+
+def fit_intensity(price_levels: np.ndarray,
+                  lambdas: np.ndarray,
+                  alpha: float,
+                  kappa: float) -> Optional[Tuple[float, float]]:
+    """
+    Fits lambda = alpha * exp(-kappa * price_level), warm started from the previous parameters.
+    Returns None if the fit doesn't converge.
+    """
+    # Adjust to be able to calculate log
+    lambdas_adj = np.where(lambdas == 0, 10**-10, lambdas)
+    try:
+        params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+                           price_levels,
+                           lambdas_adj,
+                           p0=(alpha, kappa),
+                           method='dogbox',
+                           bounds=([0, 0], [np.inf, np.inf]))
+    except (RuntimeError, ValueError):
+        return None
+    return float(params[0][0]), float(params[0][1])
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,11 +50,30 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the alpha and kappa parameters of the trading intensity lambda = alpha * exp(-kappa * price_level), from
+    the amounts traded at each distance from the mid price over the last `sampling_length` samples.
+
+    The traded amount per price level is updated as samples enter and leave the buffer, so an estimation only sorts
+    the price levels and runs a fit warm started from the previous parameters, and only when the samples changed.
+    With `background_estimation` the fit runs in the default executor and the parameters are updated when it
+    finishes, so it never blocks the clock tick.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 background_estimation: bool = False):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
+        self._sample_timestamps = []
+        self._amounts_by_price_level = {}
+        self._trades_by_price_level = {}
+        self._samples_changed = False
+        self._background_estimation = background_estimation
+        self._estimation_task = None
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -64,6 +107,14 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def background_estimation(self) -> bool:
+        return self._background_estimation
+
+    @background_estimation.setter
+    def background_estimation(self, value: bool):
+        self._background_estimation = value
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
@@ -90,11 +141,7 @@ cdef class TradingIntensityIndicator:
                     if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
                         latest_processed_quote_idx = i
                     trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    self.c_add_trade_to_sample(quote["timestamp"] + 1, trade)
                     break
 
         # THere are no trades left to process
@@ -103,19 +150,34 @@ cdef class TradingIntensityIndicator:
         if latest_processed_quote_idx is not None:
             self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        while len(self._trade_samples) > self._sampling_length:
+            self.c_remove_sample(heapq.heappop(self._sample_timestamps))
 
-        if self.is_sampling_buffer_full:
+        if self.is_sampling_buffer_full and self._samples_changed:
             self.c_estimate_intensity()
 
+    cdef c_add_trade_to_sample(self, object sample_timestamp, dict trade):
+        if sample_timestamp not in self._trade_samples:
+            self._trade_samples[sample_timestamp] = []
+            heapq.heappush(self._sample_timestamps, sample_timestamp)
+        self._trade_samples[sample_timestamp].append(trade)
+
+        price_level = trade["price_level"]
+        self._amounts_by_price_level[price_level] = self._amounts_by_price_level.get(price_level, 0) + trade["amount"]
+        self._trades_by_price_level[price_level] = self._trades_by_price_level.get(price_level, 0) + 1
+        self._samples_changed = True
+
+    cdef c_remove_sample(self, object sample_timestamp):
+        for trade in self._trade_samples.pop(sample_timestamp):
+            price_level = trade["price_level"]
+            self._trades_by_price_level[price_level] -= 1
+            if self._trades_by_price_level[price_level] == 0:
+                del self._trades_by_price_level[price_level]
+                del self._amounts_by_price_level[price_level]
+            else:
+                self._amounts_by_price_level[price_level] -= trade["amount"]
+        self._samples_changed = True
+
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
         self.c_register_trade(trade)
@@ -125,42 +187,31 @@ cdef class TradingIntensityIndicator:
 
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
             list price_levels
+            object lambdas
+
+        if self._estimation_task is not None and not self._estimation_task.done():
+            # The samples are still flagged as changed, so the estimation is retried on the next calculation
+            return
 
         # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
-
-        # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
-
-        # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+        price_levels = sorted(self._amounts_by_price_level.keys(), reverse=True)
+        lambdas = np.array([self._amounts_by_price_level[price_level] for price_level in price_levels], dtype=float)
+        self._samples_changed = False
+
+        if self._background_estimation:
+            self._estimation_task = safe_ensure_future(
+                self._estimate_intensity_in_background(np.array(price_levels, dtype=float), lambdas)
+            )
+        else:
+            self.c_set_intensity(fit_intensity(np.array(price_levels, dtype=float), lambdas, self._alpha, self._kappa))
+
+    async def _estimate_intensity_in_background(self, price_levels: np.ndarray, lambdas: np.ndarray):
+        params = await asyncio.get_event_loop().run_in_executor(
+            None, fit_intensity, price_levels, lambdas, self._alpha, self._kappa
+        )
+        self.c_set_intensity(params)
+
+    cdef c_set_intensity(self, object params):
+        if params is not None:
+            self._alpha, self._kappa = params
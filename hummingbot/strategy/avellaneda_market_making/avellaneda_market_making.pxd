@@ -53,6 +53,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         object _avg_vol
         TradingIntensityIndicator _trading_intensity
         bint _should_wait_order_cancel_confirmation
+        set _kept_order_ids
 
     cdef object c_get_mid_price(self)
     cdef _create_proposal_based_on_order_levels(self)
@@ -67,6 +68,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     cdef c_apply_add_transaction_costs(self, object proposal)
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
     cdef c_cancel_active_orders(self, object proposal)
+    cdef c_refresh_orders_incrementally(self, list active_orders, object proposal)
     cdef c_cancel_active_orders_on_max_age_limit(self)
     cdef bint c_to_create_orders(self, object proposal)
     cdef c_execute_orders_proposal(self, object proposal)
@@ -46,6 +46,7 @@ from hummingbot.strategy.hanging_orders_tracker import (
 )
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
+from hummingbot.strategy.order_refresh_planner import plan_order_refresh
 from hummingbot.strategy.order_tracker cimport OrderTracker
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.utils import order_age
@@ -91,6 +92,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
         self._cancel_timestamp = 0
         self._create_timestamp = 0
+        self._kept_order_ids = set()
         self._limit_order_type = self._market_info.market.get_maker_order_type()
         self._all_markets_ready = False
         self._filled_buys_balance = 0
@@ -424,12 +426,16 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             if self._trading_intensity is not None:
                 self._trading_intensity.sampling_length = trading_intensity_buffer_size
 
+        background_estimation = self._config_map.trading_intensity_background_estimation
         if self._trading_intensity is None and self.market_info.market.ready:
             self._trading_intensity = TradingIntensityIndicator(
                 order_book=self.market_info.order_book,
                 price_delegate=self._price_delegate,
                 sampling_length=self._trading_intensity_buffer_size,
+                background_estimation=background_estimation,
             )
+        elif self._trading_intensity is not None:
+            self._trading_intensity.background_estimation = background_estimation
 
         self._ticks_to_be_ready += (ticks_to_be_ready_after - ticks_to_be_ready_before)
         if self._ticks_to_be_ready < 0:
@@ -590,6 +596,13 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         self._hanging_orders_tracker.unregister_events(self.active_markets)
         StrategyBase.c_stop(self, clock)
 
+    def next_event_timestamp(self) -> float:
+        """
+        The volatility and trading intensity are sampled on every tick, so the strategy is ticked on every tick, also
+        in fast forward backtests, to keep the same estimates as a regular backtest.
+        """
+        return self._current_timestamp
+
     cdef c_tick(self, double timestamp):
         StrategyBase.c_tick(self, timestamp)
         cdef:
@@ -1223,6 +1236,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 self.c_cancel_order(self._market_info, order.client_order_id)
 
     cdef c_cancel_active_orders(self, object proposal):
+        self._kept_order_ids = set()
         if self._cancel_timestamp > self._current_timestamp:
             return
 
@@ -1233,6 +1247,11 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
         if len(self.active_non_hanging_orders) == 0:
             return
+        if proposal is not None and \
+                self._config_map.incremental_order_refresh and \
+                not self._hanging_orders_enabled:
+            self.c_refresh_orders_incrementally(self.active_non_hanging_orders, proposal)
+            return
         if proposal is not None:
             active_buy_prices = [Decimal(str(o.price)) for o in self.active_non_hanging_orders if o.is_buy]
             active_sell_prices = [Decimal(str(o.price)) for o in self.active_non_hanging_orders if not o.is_buy]
@@ -1255,9 +1274,28 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     def cancel_active_orders(self, proposal: Proposal = None):
         return self.c_cancel_active_orders(proposal)
 
+    cdef c_refresh_orders_incrementally(self, list active_orders, object proposal):
+        """
+        Keeps the active orders within tolerance of a proposal level and cancels the others. The proposal is reduced to
+        the levels without an order, so only those are created and the kept orders don't lose their queue priority.
+        """
+        active_orders = [o for o in active_orders
+                         if o.client_order_id not in self._sb_order_tracker.in_flight_cancels]
+        plan = plan_order_refresh(active_orders, proposal, self.order_refresh_tolerance)
+        if plan.is_empty:
+            self.c_set_timers()
+            return
+        for order in plan.orders_to_cancel:
+            self.c_cancel_order(self._market_info, order.client_order_id)
+        self._kept_order_ids = {o.client_order_id for o in plan.orders_to_keep}
+        proposal.buys = plan.buys_to_create
+        proposal.sells = plan.sells_to_create
+
     cdef bint c_to_create_orders(self, object proposal):
+        # Orders kept by an incremental refresh stay active, the proposal only has the levels to create
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
-                                            self._hanging_orders_tracker.is_potential_hanging_order(o)]
+                                            self._hanging_orders_tracker.is_potential_hanging_order(o)
+                                            and o.client_order_id not in self._kept_order_ids]
 
         return (self._create_timestamp < self._current_timestamp
                 and (not self._config_map.should_wait_order_cancel_confirmation or
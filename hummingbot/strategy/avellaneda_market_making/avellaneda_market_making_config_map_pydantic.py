@@ -265,6 +265,18 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             )
         ),
     )
+    incremental_order_refresh: bool = Field(
+        default=False,
+        description=(
+            "If activated, only the orders beyond the refresh tolerance of a proposal level are cancelled and"
+            " re-submitted, the others are kept."
+        ),
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "Do you want to keep the orders within the refresh tolerance and replace only the others? (Yes/No)"
+            ),
+        ),
+    )
     filled_order_delay: float = Field(
         default=60.,
         description="The delay before placing a new order after an order fill.",
@@ -311,6 +323,16 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    trading_intensity_background_estimation: bool = Field(
+        default=False,
+        description=(
+            "If activated, the order book liquidity is estimated in the background and the estimated values are"
+            " updated when it finishes, instead of during the clock tick."
+        ),
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Do you want to estimate order book liquidity in the background? (Yes/No)",
+        ),
+    )
     order_levels_mode: Union[SingleOrderLevelModel, MultiOrderLevelModel] = Field(
         default=SingleOrderLevelModel.construct(),
         description="Allows activating multi-order levels.",
@@ -420,6 +442,8 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
         "order_optimization_enabled",
         "add_transaction_costs",
         "should_wait_order_cancel_confirmation",
+        "incremental_order_refresh",
+        "trading_intensity_background_estimation",
         pre=True,
     )
     def validate_bool(cls, v: str):
@@ -1,10 +1,11 @@
+import asyncio
 import logging
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Optional, Set, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -25,7 +26,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -113,11 +114,13 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         # Holds ongoing hedging orders mapped to their respective maker fill trades
         self._ongoing_hedging = bidict()
+        # Index of the ongoing hedging orders by maker fill trade id
+        self._ongoing_hedging_trade_ids: Dict[str, Set[str]] = {}
 
         self._logging_options = logging_options
 
-        self._last_taker_buy_price = None
-        self._last_taker_sell_price = None
+        # Last buy and sell quotes of the gateway taker markets
+        self._taker_quotes: Dict[MakerTakerMarketPair, Tuple[Optional[Decimal], Optional[Decimal]]] = {}
 
         self._main_task = None
         self._gateway_quotes_task = None
@@ -313,10 +316,11 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             else:
                 markets_df = self.market_status_data_frame([market_pair.maker])
                 # Market status for gateway
-                bid_price = "" if self._last_taker_buy_price is None else self._last_taker_buy_price
-                ask_price = "" if self._last_taker_sell_price is None else self._last_taker_sell_price
-                if self._last_taker_buy_price is not None and self._last_taker_sell_price is not None:
-                    mid_price = (self._last_taker_buy_price + self._last_taker_sell_price) / 2
+                taker_buy_price, taker_sell_price = self._taker_quotes.get(market_pair, (None, None))
+                bid_price = "" if taker_buy_price is None else taker_buy_price
+                ask_price = "" if taker_sell_price is None else taker_sell_price
+                if taker_buy_price is not None and taker_sell_price is not None:
+                    mid_price = (taker_buy_price + taker_sell_price) / 2
                 else:
                     mid_price = ""
                 taker_data = {
@@ -439,9 +443,22 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                         limit_order.client_order_id in self._maker_to_taker_order_ids.keys():
                     market_pair_to_active_orders[market_pair].append(limit_order)
 
-            # Process each market pair independently.
-            for market_pair in self._market_pairs.values():
-                await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+            # Process the market pairs concurrently, so a slow taker market only delays its own pair.
+            market_pairs = list(self._market_pairs.values())
+            results = await safe_gather(
+                *[self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+                  for market_pair in market_pairs],
+                return_exceptions=True
+            )
+            for market_pair, result in zip(market_pairs, results):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, Exception):
+                    self.log_with_clock(
+                        logging.ERROR,
+                        f"({market_pair.maker.trading_pair}) Unexpected error while processing the market pair.",
+                        exc_info=result
+                    )
 
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < timestamp:
@@ -451,22 +468,33 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self._last_timestamp = timestamp
 
     async def get_gateway_quotes(self):
-        for market_pair in self._market_pairs.values():
-            if self.is_gateway_market(market_pair.taker):
-                _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
-                order_amount = self._config_map.order_amount * base_rate
-                order_price = await market_pair.taker.market.get_order_price(
-                    market_pair.taker.trading_pair,
-                    True,
-                    order_amount
-                )
-                self._last_taker_buy_price = order_price
-                order_price = await market_pair.taker.market.get_order_price(
-                    market_pair.taker.trading_pair,
-                    False,
-                    order_amount
-                )
-                self._last_taker_sell_price = order_price
+        await safe_gather(*[
+            self.get_gateway_quote(market_pair)
+            for market_pair in self._market_pairs.values()
+            if self.is_gateway_market(market_pair.taker)
+        ])
+
+    async def get_gateway_quote(self, market_pair: MakerTakerMarketPair):
+        """
+        Fetches the buy and sell quotes of a gateway taker market concurrently. Failures are logged and leave the
+        last quotes of the market pair in place.
+        """
+        try:
+            _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
+            order_amount = self._config_map.order_amount * base_rate
+            buy_price, sell_price = await safe_gather(
+                market_pair.taker.market.get_order_price(market_pair.taker.trading_pair, True, order_amount),
+                market_pair.taker.market.get_order_price(market_pair.taker.trading_pair, False, order_amount),
+            )
+            self._taker_quotes[market_pair] = (buy_price, sell_price)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().warning(
+                f"Error fetching the {market_pair.taker.market.display_name} quotes of "
+                f"{market_pair.taker.trading_pair}.",
+                exc_info=True
+            )
 
     def ready_for_new_trades(self) -> bool:
         """
@@ -650,12 +678,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             # Maker order filled
             # Check if this fill was already processed or not
             if maker_order_id not in self._maker_to_hedging_trades.keys():
-                self._maker_to_hedging_trades[maker_order_id] = []
+                self._maker_to_hedging_trades[maker_order_id] = set()
             if exchange_trade_id not in self._maker_to_hedging_trades[maker_order_id]:
                 # This maker fill has not been processed yet, submit Taker hedge order
                 # Values have to be unique in a bidict
 
-                self._maker_to_hedging_trades[maker_order_id] += [exchange_trade_id]
+                self._maker_to_hedging_trades[maker_order_id].add(exchange_trade_id)
 
                 self.hedge_tasks_cleanup()
                 self._hedge_maker_order_task = safe_ensure_future(
@@ -714,8 +742,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 # Remove the completed taker order
                 del self._taker_to_maker_order_ids[order_id]
                 # Get all active taker order ids for the maker order id
-                active_taker_ids = set(self._taker_to_maker_order_ids.keys()).intersection(set(
-                    self._maker_to_taker_order_ids[maker_order_id]))
+                active_taker_ids = [taker_order_id for taker_order_id in self._maker_to_taker_order_ids[maker_order_id]
+                                    if taker_order_id in self._taker_to_maker_order_ids]
                 if len(active_taker_ids) == 0:
                     # Was maker order fully filled?
                     maker_order_ids = list(order_id for market, limit_order, order_id in self.active_maker_limit_orders)
@@ -781,8 +809,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 # Remove the completed taker order
                 del self._taker_to_maker_order_ids[order_id]
                 # Get all active taker order ids for the maker order id
-                active_taker_ids = set(self._taker_to_maker_order_ids.keys()).intersection(set(
-                    self._maker_to_taker_order_ids[maker_order_id]))
+                active_taker_ids = [taker_order_id for taker_order_id in self._maker_to_taker_order_ids[maker_order_id]
+                                    if taker_order_id in self._taker_to_maker_order_ids]
                 if len(active_taker_ids) == 0:
                     # Was maker order fully filled?
                     maker_order_ids = list(order_id for market, limit_order, order_id in self.active_maker_limit_orders)
@@ -1808,17 +1836,20 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         ]
 
     def is_fill_event_in_ongoing_hedging(self, fill_event: OrderFilledEvent) -> bool:
-        trade_id = fill_event[1].exchange_trade_id
-        for maker_exchange_trade_ids in self._ongoing_hedging:
-            for id in maker_exchange_trade_ids:
-                if trade_id is id:
-                    return True
-        return False
+        return fill_event[1].exchange_trade_id in self._ongoing_hedging_trade_ids
 
     def set_ongoing_hedging(self, fill_records: List[OrderFilledEvent], order_id: str):
         maker_exchange_trade_ids = tuple(r.exchange_trade_id for _, r in fill_records)
         self._ongoing_hedging[maker_exchange_trade_ids] = order_id
+        for trade_id in maker_exchange_trade_ids:
+            self._ongoing_hedging_trade_ids.setdefault(trade_id, set()).add(order_id)
 
     def del_order_from_ongoing_hedging(self, taker_order_id: str):
         maker_exchange_trade_ids = self._ongoing_hedging.inverse[taker_order_id]
         del self._ongoing_hedging[maker_exchange_trade_ids]
+        for trade_id in maker_exchange_trade_ids:
+            taker_order_ids = self._ongoing_hedging_trade_ids.get(trade_id)
+            if taker_order_ids is not None:
+                taker_order_ids.discard(taker_order_id)
+                if len(taker_order_ids) == 0:
+                    del self._ongoing_hedging_trade_ids[trade_id]
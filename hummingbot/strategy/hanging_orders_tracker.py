@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -61,10 +61,22 @@ class HangingOrdersTracker:
         self.orders_being_renewed: Set[HangingOrder] = set()
         self.orders_being_cancelled: Set[str] = set()
         self.current_created_pairs_of_orders: List[CreatedPairOfOrders] = list()
-        self.original_orders: Set[LimitOrder] = orders or set()
+        self.original_orders: Set[LimitOrder] = set()
         self.strategy_current_hanging_orders: Set[HangingOrder] = set()
         self.completed_hanging_orders: Set[HangingOrder] = set()
 
+        # Indexes of the sets above, maintained with every change so the lookups done on every tick and event don't
+        # scan the orders. The equivalent orders are cached until the original orders change, and the orders to create
+        # and cancel are only computed again when the equivalent or the current hanging orders change.
+        self._original_orders_by_id: Dict[str, LimitOrder] = {}
+        self._hanging_orders_by_id: Dict[str, HangingOrder] = {}
+        self._completed_hanging_order_ids: Set[str] = set()
+        self._equivalent_orders: Optional[FrozenSet[HangingOrder]] = None
+        self._hanging_orders_changed: bool = True
+
+        for order in orders or set():
+            self.add_order(order)
+
         self._cancel_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
         self._complete_buy_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
             self._did_complete_buy_order)
@@ -103,14 +115,12 @@ class HangingOrdersTracker:
         self._process_cancel_as_part_of_renew(event)
 
         self.orders_being_cancelled.discard(event.order_id)
-        order_to_be_removed = next((order for order in self.strategy_current_hanging_orders
-                                    if order.order_id == event.order_id), None)
+        order_to_be_removed = self._hanging_orders_by_id.get(event.order_id)
         if order_to_be_removed:
-            self.strategy_current_hanging_orders.remove(order_to_be_removed)
+            self._remove_current_hanging_order(order_to_be_removed)
             self.logger().notify(f"({self.trading_pair}) Hanging order {event.order_id} canceled.")
 
-        limit_order_to_be_removed = next((order for order in self.original_orders
-                                          if order.client_order_id == event.order_id), None)
+        limit_order_to_be_removed = self._original_orders_by_id.get(event.order_id)
         if limit_order_to_be_removed:
             self.remove_order(limit_order_to_be_removed)
 
@@ -129,8 +139,7 @@ class HangingOrdersTracker:
     def _did_complete_order(self,
                             event: Union[BuyOrderCompletedEvent, SellOrderCompletedEvent],
                             is_buy: bool):
-        hanging_order = next((hanging_order for hanging_order in self.strategy_current_hanging_orders
-                              if hanging_order.order_id == event.order_id), None)
+        hanging_order = self._hanging_orders_by_id.get(event.order_id)
 
         if hanging_order:
             self._did_complete_hanging_order(hanging_order)
@@ -145,15 +154,15 @@ class HangingOrdersTracker:
         if order:
             order_side = "BUY" if order.is_buy else "SELL"
             self.completed_hanging_orders.add(order)
-            self.strategy_current_hanging_orders.remove(order)
+            self._completed_hanging_order_ids.add(order.order_id)
+            self._remove_current_hanging_order(order)
             self.logger().notify(
                 f"({self.trading_pair}) Hanging maker {order_side} order {order.order_id} "
                 f"({order.trading_pair} {order.amount} @ "
                 f"{order.price}) has been completely filled."
             )
 
-            limit_order_to_be_removed = next((original_order for original_order in self.original_orders
-                                              if original_order.client_order_id == order.order_id), None)
+            limit_order_to_be_removed = self._original_orders_by_id.get(order.order_id)
             if limit_order_to_be_removed:
                 self.remove_order(limit_order_to_be_removed)
 
@@ -170,12 +179,12 @@ class HangingOrdersTracker:
         self.renew_hanging_orders_past_max_order_age()
 
     def _process_cancel_as_part_of_renew(self, event: OrderCancelledEvent):
-        renewing_order = next((order for order in self.orders_being_renewed if order.order_id == event.order_id), None)
-        if renewing_order:
+        renewing_order = self._hanging_orders_by_id.get(event.order_id)
+        if renewing_order and renewing_order in self.orders_being_renewed:
             self.logger().info(f"({self.trading_pair}) Hanging order {event.order_id} "
                                f"has been canceled as part of the renew process. "
                                f"Now the replacing order will be created.")
-            self.strategy_current_hanging_orders.remove(renewing_order)
+            self._remove_current_hanging_order(renewing_order)
             self.orders_being_renewed.remove(renewing_order)
             order_to_be_created = HangingOrder(None,
                                                renewing_order.trading_pair,
@@ -185,42 +194,63 @@ class HangingOrdersTracker:
                                                self.strategy.current_timestamp)
 
             executed_orders = self._execute_orders_in_strategy([order_to_be_created])
-            self.strategy_current_hanging_orders = self.strategy_current_hanging_orders.union(executed_orders)
-            for new_hanging_order in executed_orders:
-                limit_order_from_hanging_order = next((o for o in self.strategy.active_orders
-                                                       if o.client_order_id == new_hanging_order.order_id), None)
-                if limit_order_from_hanging_order:
-                    self.add_order(limit_order_from_hanging_order)
+            self._add_current_hanging_orders(executed_orders)
+            if executed_orders:
+                active_orders_by_id = {o.client_order_id: o for o in self.strategy.active_orders}
+                for new_hanging_order in executed_orders:
+                    limit_order_from_hanging_order = active_orders_by_id.get(new_hanging_order.order_id)
+                    if limit_order_from_hanging_order:
+                        self.add_order(limit_order_from_hanging_order)
+
+    def _add_current_hanging_orders(self, orders: Iterable[HangingOrder]):
+        for order in orders:
+            # Hanging orders are equal when they have the same side, price and amount. Only the first one is kept.
+            if order not in self.strategy_current_hanging_orders:
+                self.strategy_current_hanging_orders.add(order)
+                if order.order_id is not None:
+                    self._hanging_orders_by_id[order.order_id] = order
+                self._hanging_orders_changed = True
+
+    def _remove_current_hanging_order(self, order: HangingOrder):
+        self.strategy_current_hanging_orders.remove(order)
+        self._hanging_orders_by_id.pop(order.order_id, None)
+        self._hanging_orders_changed = True
 
     def add_order(self, order: LimitOrder):
-        self.original_orders.add(order)
+        if order not in self.original_orders:
+            self.original_orders.add(order)
+            self._original_orders_by_id[order.client_order_id] = order
+            self._original_orders_changed()
 
     def add_as_hanging_order(self, order: LimitOrder):
-        self.strategy_current_hanging_orders.add(self._get_hanging_order_from_limit_order(order))
+        self._add_current_hanging_orders([self._get_hanging_order_from_limit_order(order)])
         self.add_order(order)
 
     def remove_order(self, order: LimitOrder):
         if order in self.original_orders:
             self.original_orders.remove(order)
+            if self._original_orders_by_id.get(order.client_order_id) is order:
+                del self._original_orders_by_id[order.client_order_id]
+            self._original_orders_changed()
 
     def remove_all_orders(self):
         self.original_orders.clear()
+        self._original_orders_by_id.clear()
+        self._original_orders_changed()
 
     def remove_all_buys(self):
-        to_be_removed = []
-        for order in self.original_orders:
-            if order.is_buy:
-                to_be_removed.append(order)
+        to_be_removed = [order for order in self.original_orders if order.is_buy]
         for order in to_be_removed:
-            self.original_orders.remove(order)
+            self.remove_order(order)
 
     def remove_all_sells(self):
-        to_be_removed = []
-        for order in self.original_orders:
-            if not order.is_buy:
-                to_be_removed.append(order)
+        to_be_removed = [order for order in self.original_orders if not order.is_buy]
         for order in to_be_removed:
-            self.original_orders.remove(order)
+            self.remove_order(order)
+
+    def _original_orders_changed(self):
+        self._equivalent_orders = None
+        self._hanging_orders_changed = True
 
     def hanging_order_age(self, hanging_order: HangingOrder) -> float:
         """
@@ -254,10 +284,10 @@ class HangingOrdersTracker:
 
         self._cancel_multiple_orders_in_strategy([order.client_order_id for order in orders_to_be_removed])
 
-    def _get_equivalent_orders(self) -> Set[HangingOrder]:
-        if self.original_orders:
-            return self._get_equivalent_orders_no_aggregation(self.original_orders)
-        return set()
+    def _get_equivalent_orders(self) -> FrozenSet[HangingOrder]:
+        if self._equivalent_orders is None:
+            self._equivalent_orders = self._get_equivalent_orders_no_aggregation(self.original_orders)
+        return self._equivalent_orders
 
     @property
     def equivalent_orders(self) -> Set[HangingOrder]:
@@ -265,16 +295,14 @@ class HangingOrdersTracker:
         return self._get_equivalent_orders()
 
     def is_order_id_in_hanging_orders(self, order_id: str) -> bool:
-        return any((o.order_id == order_id for o in self.strategy_current_hanging_orders))
+        return order_id in self._hanging_orders_by_id
 
     def is_order_id_in_completed_hanging_orders(self, order_id: str) -> bool:
-        return any((o.order_id == order_id for o in self.completed_hanging_orders))
+        return order_id in self._completed_hanging_order_ids
 
     def is_hanging_order_in_strategy_active_orders(self, order: HangingOrder) -> bool:
-        return any(all(order.trading_pair == o.trading_pair,
-                       order.is_buy == o.is_buy,
-                       order.price == o.price,
-                       order.amount == o.quantity) for o in self.strategy.active_orders)
+        # Hanging orders are compared by trading pair, side, price and amount
+        return order in self._get_equivalent_orders_no_aggregation(self.strategy.active_orders)
 
     def is_potential_hanging_order(self, order: LimitOrder) -> bool:
         """Checks if the order is registered as a hanging order."""
@@ -290,6 +318,9 @@ class HangingOrdersTracker:
 
         self._add_hanging_orders_based_on_partially_executed_pairs()
 
+        if not self._hanging_orders_changed:
+            return
+
         equivalent_orders = self.equivalent_orders
         orders_to_create = equivalent_orders.difference(self.strategy_current_hanging_orders)
         orders_to_cancel = self.strategy_current_hanging_orders.difference(equivalent_orders)
@@ -304,7 +335,9 @@ class HangingOrdersTracker:
             self.logger().info(f"Need to cancel: {orders_to_cancel}")
 
         executed_orders = self._execute_orders_in_strategy(orders_to_create)
-        self.strategy_current_hanging_orders = self.strategy_current_hanging_orders.union(executed_orders)
+        self._add_current_hanging_orders(executed_orders)
+        # Keep comparing while there are hanging orders waiting for their cancel confirmation
+        self._hanging_orders_changed = len(orders_to_cancel) > 0
 
     def _execute_orders_in_strategy(self, candidate_orders: Set[HangingOrder]):
         new_hanging_orders = set()
@@ -343,8 +376,11 @@ class HangingOrdersTracker:
         return new_hanging_orders
 
     def _cancel_multiple_orders_in_strategy(self, order_ids: List[str]):
+        if not order_ids:
+            return
+        active_order_ids = {o.client_order_id for o in self.strategy.active_orders}
         for order_id in order_ids:
-            if any(o.client_order_id == order_id for o in self.strategy.active_orders):
+            if order_id in active_order_ids:
                 self.strategy.cancel_order(order_id)
                 self.orders_being_cancelled.add(order_id)
 
@@ -370,10 +406,13 @@ class HangingOrdersTracker:
 
     def candidate_hanging_orders_from_pairs(self):
         candidate_orders = []
+        active_orders = None
         for pair in self.current_created_pairs_of_orders:
             if pair.partially_filled():
                 unfilled_order = pair.get_unfilled_order()
+                if active_orders is None:
+                    active_orders = set(self.strategy.active_orders)
                 # Check if the unfilled order is in active_orders because it might have failed before being created
-                if unfilled_order in self.strategy.active_orders:
+                if unfilled_order in active_orders:
                     candidate_orders.append(unfilled_order)
         return candidate_orders
@@ -0,0 +1,80 @@
+from decimal import Decimal
+from typing import List, NamedTuple, Tuple
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.strategy.data_types import PriceSize, Proposal
+
+
+class OrderRefreshPlan(NamedTuple):
+    """
+    The orders to keep and to cancel, and the proposal levels to create, to move from the active orders to a proposal.
+    """
+    orders_to_keep: List[LimitOrder]
+    orders_to_cancel: List[LimitOrder]
+    buys_to_create: List[PriceSize]
+    sells_to_create: List[PriceSize]
+
+    @property
+    def is_empty(self) -> bool:
+        return (len(self.orders_to_cancel) == 0
+                and len(self.buys_to_create) == 0
+                and len(self.sells_to_create) == 0)
+
+
+def match_orders_to_levels(orders: List[LimitOrder],
+                           levels: List[PriceSize],
+                           tolerance_pct: Decimal) -> Tuple[List[LimitOrder], List[LimitOrder], List[PriceSize]]:
+    """
+    Matches the active orders of one side to the proposal levels of that side. An order matches a level when the
+    difference between their prices, relative to the order price, is within the tolerance. Both are walked sorted by
+    price, so the number of matches is the highest possible.
+    :param orders: the active orders of one side
+    :param levels: the proposal levels of the same side
+    :param tolerance_pct: the tolerance as a ratio, e.g. 0.01 for 1%
+    :return: the orders matched, the orders not matched and the levels not matched, in the order of the levels
+    """
+    sorted_orders = sorted(orders, key=lambda o: Decimal(str(o.price)))
+    sorted_level_indexes = sorted(range(len(levels)), key=lambda i: levels[i].price)
+    orders_to_keep = []
+    orders_to_cancel = []
+    matched_level_indexes = set()
+    order_index = level_index = 0
+
+    while order_index < len(sorted_orders) and level_index < len(sorted_level_indexes):
+        order = sorted_orders[order_index]
+        current = Decimal(str(order.price))
+        proposal = levels[sorted_level_indexes[level_index]].price
+        if abs(proposal - current) / current <= tolerance_pct:
+            orders_to_keep.append(order)
+            matched_level_indexes.add(sorted_level_indexes[level_index])
+            order_index += 1
+            level_index += 1
+        elif current < proposal:
+            orders_to_cancel.append(order)
+            order_index += 1
+        else:
+            level_index += 1
+    orders_to_cancel.extend(sorted_orders[order_index:])
+    levels_to_create = [level for i, level in enumerate(levels) if i not in matched_level_indexes]
+
+    return orders_to_keep, orders_to_cancel, levels_to_create
+
+
+def plan_order_refresh(active_orders: List[LimitOrder], proposal: Proposal, tolerance_pct: Decimal) -> OrderRefreshPlan:
+    """
+    Plans the minimal refresh of the active orders to the proposal: the orders within tolerance of a proposal level are
+    kept, so they don't lose their queue priority, and only the others are cancelled and replaced.
+    :param active_orders: the active orders to refresh
+    :param proposal: the new proposal
+    :param tolerance_pct: the tolerance as a ratio, e.g. 0.01 for 1%
+    :return: the refresh plan
+    """
+    buys_to_keep, buys_to_cancel, buys_to_create = match_orders_to_levels(
+        [o for o in active_orders if o.is_buy], proposal.buys, tolerance_pct)
+    sells_to_keep, sells_to_cancel, sells_to_create = match_orders_to_levels(
+        [o for o in active_orders if not o.is_buy], proposal.sells, tolerance_pct)
+
+    return OrderRefreshPlan(orders_to_keep=buys_to_keep + sells_to_keep,
+                            orders_to_cancel=buys_to_cancel + sells_to_cancel,
+                            buys_to_create=buys_to_create,
+                            sells_to_create=sells_to_create)
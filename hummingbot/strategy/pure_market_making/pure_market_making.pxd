@@ -24,6 +24,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         double _order_refresh_time
         double _max_order_age
         object _order_refresh_tolerance_pct
+        bint _incremental_order_refresh
+        set _kept_order_ids
         double _filled_order_delay
         bint _inventory_skew_enabled
         object _inventory_target_base_pct
@@ -58,8 +60,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
         object _moving_price_band
+        object _proposal_price
+        tuple _levels_config
+        list _buy_level_factors
+        list _sell_level_factors
+        list _level_sizes
 
     cdef object c_get_mid_price(self)
+    cdef object c_get_proposal_price(self)
+    cdef c_update_levels(self)
     cdef object c_create_base_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
@@ -75,6 +84,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_apply_add_transaction_costs(self, object proposal)
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
     cdef c_cancel_active_orders(self, object proposal)
+    cdef c_refresh_orders_incrementally(self, list active_orders, object proposal)
     cdef c_cancel_orders_below_min_spread(self)
     cdef c_cancel_active_orders_on_max_age_limit(self)
     cdef bint c_to_create_orders(self, object proposal)
@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from math import ceil, floor
+from math import ceil, floor, isnan
 from typing import Dict, List, Optional
 
 import numpy as np
@@ -19,6 +19,7 @@ from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 from hummingbot.strategy.hanging_orders_tracker import CreatedPairOfOrders, HangingOrdersTracker
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
+from hummingbot.strategy.order_refresh_planner import plan_order_refresh
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.utils import order_age
 from .data_types import PriceSize, Proposal
@@ -85,7 +86,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     bid_order_level_spreads: List[Decimal] = None,
                     ask_order_level_spreads: List[Decimal] = None,
                     should_wait_order_cancel_confirmation: bool = True,
-                    moving_price_band: Optional[MovingPriceBand] = None
+                    moving_price_band: Optional[MovingPriceBand] = None,
+                    incremental_order_refresh: bool = False
                     ):
         if order_override is None:
             order_override = {}
@@ -107,6 +109,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._order_refresh_time = order_refresh_time
         self._max_order_age = max_order_age
         self._order_refresh_tolerance_pct = order_refresh_tolerance_pct
+        self._incremental_order_refresh = incremental_order_refresh
+        self._kept_order_ids = set()
         self._filled_order_delay = filled_order_delay
         self._inventory_skew_enabled = inventory_skew_enabled
         self._inventory_target_base_pct = inventory_target_base_pct
@@ -144,6 +148,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._proposal_price = None
+        self._levels_config = None
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -185,6 +191,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def order_refresh_tolerance_pct(self, value: Decimal):
         self._order_refresh_tolerance_pct = value
 
+    @property
+    def incremental_order_refresh(self) -> bool:
+        return self._incremental_order_refresh
+
+    @incremental_order_refresh.setter
+    def incremental_order_refresh(self, value: bool):
+        self._incremental_order_refresh = value
+
     @property
     def order_amount(self) -> Decimal:
         return self._order_amount
@@ -711,6 +725,24 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._hanging_orders_tracker.unregister_events(self.active_markets)
         StrategyBase.c_stop(self, clock)
 
+    def next_event_timestamp(self) -> float:
+        """
+        Next refresh, cancel, max order age or in flight cancel expiration deadline. Price driven decisions are taken on
+        the ticks of market data events, hanging orders are still checked on every tick.
+        """
+        cdef double next_event
+        if not self._all_markets_ready or len(self._hanging_orders_tracker.strategy_current_hanging_orders) > 0:
+            return self._current_timestamp
+        next_event = min(self._create_timestamp, self._cancel_timestamp)
+        order_expiration = self.next_order_expiration_timestamp()
+        if not isnan(order_expiration):
+            next_event = min(next_event, order_expiration)
+        active_orders = self.active_non_hanging_orders
+        if len(active_orders) > 0:
+            oldest_creation_timestamp = min(order.creation_timestamp for order in active_orders) / 1e6
+            next_event = min(next_event, oldest_creation_timestamp + self._max_order_age + 1)
+        return max(next_event, self._current_timestamp)
+
     cdef c_tick(self, double timestamp):
         StrategyBase.c_tick(self, timestamp)
 
@@ -738,19 +770,24 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
             proposal = None
             if self._create_timestamp <= self._current_timestamp:
-                # 1. Create base order proposals
-                proposal = self.c_create_base_proposal()
-                # 2. Apply functions that limit numbers of buys and sells proposal
-                self.c_apply_order_levels_modifiers(proposal)
-                # 3. Apply functions that modify orders price
-                self.c_apply_order_price_modifiers(proposal)
-                # 4. Apply functions that modify orders size
-                self.c_apply_order_size_modifiers(proposal)
-                # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
-                self.c_apply_budget_constraint(proposal)
-
-                if not self._take_if_crossed:
-                    self.c_filter_out_takers(proposal)
+                # The proposal is built synchronously, so the reference price is read once and shared by all the steps
+                self._proposal_price = self.get_price()
+                try:
+                    # 1. Create base order proposals
+                    proposal = self.c_create_base_proposal()
+                    # 2. Apply functions that limit numbers of buys and sells proposal
+                    self.c_apply_order_levels_modifiers(proposal)
+                    # 3. Apply functions that modify orders price
+                    self.c_apply_order_price_modifiers(proposal)
+                    # 4. Apply functions that modify orders size
+                    self.c_apply_order_size_modifiers(proposal)
+                    # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
+                    self.c_apply_budget_constraint(proposal)
+
+                    if not self._take_if_crossed:
+                        self.c_filter_out_takers(proposal)
+                finally:
+                    self._proposal_price = None
 
             self._hanging_orders_tracker.process_tick()
 
@@ -762,13 +799,41 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
+    cdef object c_get_proposal_price(self):
+        """
+        Returns the reference price of the proposal being built in this tick, or the current price outside of it.
+        """
+        if self._proposal_price is not None:
+            return self._proposal_price
+        return self.get_price()
+
+    cdef c_update_levels(self):
+        """
+        Computes the spread factor of every buy and sell level and the order size of every level, which only depend on
+        the configuration, so every tick only multiplies them by the reference price and quantizes the results.
+        """
+        cdef:
+            tuple levels_config = (self._bid_spread, self._ask_spread, self._order_level_spread, self._order_amount,
+                                   self._order_level_amount, self._buy_levels, self._sell_levels)
+
+        if levels_config == self._levels_config:
+            return
+        self._buy_level_factors = [Decimal("1") - self._bid_spread - (level * self._order_level_spread)
+                                   for level in range(0, self._buy_levels)]
+        self._sell_level_factors = [Decimal("1") + self._ask_spread + (level * self._order_level_spread)
+                                    for level in range(0, self._sell_levels)]
+        self._level_sizes = [self._order_amount + (self._order_level_amount * level)
+                             for level in range(0, max(self._buy_levels, self._sell_levels))]
+        self._levels_config = levels_config
+
     cdef object c_create_base_proposal(self):
         cdef:
             ExchangeBase market = self._market_info.market
             list buys = []
             list sells = []
+            list sizes
 
-        buy_reference_price = sell_reference_price = self.get_price()
+        buy_reference_price = sell_reference_price = self.c_get_proposal_price()
 
         if self._inventory_cost_price_delegate is not None:
             inventory_cost_price = self._inventory_cost_price_delegate.get_price()
@@ -801,21 +866,21 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
+            self.c_update_levels()
+            # The buy and sell orders of a level have the same size, it is quantized once for both sides
+            levels_count = max(self._buy_levels if not buy_reference_price.is_nan() else 0,
+                               self._sell_levels if not sell_reference_price.is_nan() else 0)
+            sizes = [market.c_quantize_order_amount(self.trading_pair, size)
+                     for size in self._level_sizes[:levels_count]]
             if not buy_reference_price.is_nan():
-                for level in range(0, self._buy_levels):
-                    price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
+                for factor, size in zip(self._buy_level_factors, sizes):
                     if size > 0:
+                        price = market.c_quantize_order_price(self.trading_pair, buy_reference_price * factor)
                         buys.append(PriceSize(price, size))
             if not sell_reference_price.is_nan():
-                for level in range(0, self._sell_levels):
-                    price = sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
+                for factor, size in zip(self._sell_level_factors, sizes):
                     if size > 0:
+                        price = market.c_quantize_order_price(self.trading_pair, sell_reference_price * factor)
                         sells.append(PriceSize(price, size))
 
         return Proposal(buys, sells)
@@ -846,13 +911,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             self.c_apply_ping_pong(proposal)
 
     cdef c_apply_price_band(self, proposal):
-        if self._price_ceiling > 0 and self.get_price() >= self._price_ceiling:
+        if self._price_ceiling > 0 and self.c_get_proposal_price() >= self._price_ceiling:
             proposal.buys = []
-        if self._price_floor > 0 and self.get_price() <= self._price_floor:
+        if self._price_floor > 0 and self.c_get_proposal_price() <= self._price_floor:
             proposal.sells = []
 
     cdef c_apply_moving_price_band(self, proposal):
-        price = self.get_price()
+        price = self.c_get_proposal_price()
         self._moving_price_band.check_and_update_price_band(
             self.current_timestamp, price)
         if self._moving_price_band.check_price_ceiling_exceeded(price):
@@ -899,7 +964,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bid_ask_ratios = c_calculate_bid_ask_ratios_from_base_asset_ratio(
             float(base_balance),
             float(quote_balance),
-            float(self.get_price()),
+            float(self.c_get_proposal_price()),
             float(self._inventory_target_base_pct),
             float(total_order_size * self._inventory_range_multiplier)
         )
@@ -1188,6 +1253,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         """
         Cancels active non hanging orders, checks if the order prices are within tolerance threshold
         """
+        self._kept_order_ids = set()
         if self._cancel_timestamp > self._current_timestamp:
             return
 
@@ -1198,6 +1264,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             bint to_defer_canceling = False
         if len(active_orders) == 0:
             return
+        if proposal is not None and \
+                self._order_refresh_tolerance_pct >= 0 and \
+                self._incremental_order_refresh and \
+                not self._hanging_orders_enabled:
+            self.c_refresh_orders_incrementally(active_orders, proposal)
+            return
         if proposal is not None and \
                 self._order_refresh_tolerance_pct >= 0:
 
@@ -1219,6 +1291,20 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         # else:
         #     self.set_timers()
 
+    cdef c_refresh_orders_incrementally(self, list active_orders, object proposal):
+        """
+        Keeps the active orders within tolerance of a proposal level and cancels the others. The proposal is reduced to
+        the levels without an order, so only those are created and the kept orders don't lose their queue priority.
+        """
+        active_orders = [o for o in active_orders
+                         if o.client_order_id not in self._sb_order_tracker.in_flight_cancels]
+        plan = plan_order_refresh(active_orders, proposal, self._order_refresh_tolerance_pct)
+        for order in plan.orders_to_cancel:
+            self.c_cancel_order(self._market_info, order.client_order_id)
+        self._kept_order_ids = {o.client_order_id for o in plan.orders_to_keep}
+        proposal.buys = plan.buys_to_create
+        proposal.sells = plan.sells_to_create
+
     # Cancel Non-Hanging, Active Orders if Spreads are below minimum_spread
     cdef c_cancel_orders_below_min_spread(self):
         cdef:
@@ -1235,8 +1321,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 self.c_cancel_order(self._market_info, order.client_order_id)
 
     cdef bint c_to_create_orders(self, object proposal):
+        # Orders kept by an incremental refresh stay active, the proposal only has the levels to create
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
-                                            self._hanging_orders_tracker.is_potential_hanging_order(o)]
+                                            self._hanging_orders_tracker.is_potential_hanging_order(o)
+                                            and o.client_order_id not in self._kept_order_ids]
         return (self._create_timestamp < self._current_timestamp
                 and (not self._should_wait_order_cancel_confirmation or
                      len(self._sb_order_tracker.in_flight_cancels) == 0)
@@ -175,6 +175,13 @@ pure_market_making_config_map = {
                   type_str="decimal",
                   default=Decimal("0"),
                   validator=lambda v: validate_decimal(v, -10, 10, inclusive=True)),
+    "incremental_order_refresh":
+        ConfigVar(key="incremental_order_refresh",
+                  prompt="Do you want to refresh only the orders whose price moved beyond the refresh tolerance "
+                         "and keep the others? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
     "order_amount":
         ConfigVar(key="order_amount",
                   prompt=order_amount_prompt,
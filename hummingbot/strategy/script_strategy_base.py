@@ -90,7 +90,8 @@ class ScriptStrategyBase(StrategyPyBase):
             amount: Decimal,
             order_type: OrderType,
             price=s_decimal_nan,
-            position_action=PositionAction.OPEN) -> str:
+            position_action=PositionAction.OPEN,
+            trigger_price=s_decimal_nan) -> str:
         """
         A wrapper function to buy_with_specific_market.
 
@@ -100,12 +101,14 @@ class ScriptStrategyBase(StrategyPyBase):
         :param order_type: The type of the order
         :param price: An order price
         :param position_action: A position action (for perpetual market only)
+        :param trigger_price: The trigger price (for STOP_MARKET and TAKE_PROFIT_MARKET orders only)
 
         :return: The client assigned id for the new order
         """
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.logger().info(f"Creating {trading_pair} buy order: price: {price} amount: {amount}.")
-        return self.buy_with_specific_market(market_pair, amount, order_type, price, position_action=position_action)
+        return self.buy_with_specific_market(market_pair, amount, order_type, price, position_action=position_action,
+                                             trigger_price=trigger_price)
 
     def sell(self,
              connector_name: str,
@@ -113,7 +116,8 @@ class ScriptStrategyBase(StrategyPyBase):
              amount: Decimal,
              order_type: OrderType,
              price=s_decimal_nan,
-             position_action=PositionAction.OPEN) -> str:
+             position_action=PositionAction.OPEN,
+             trigger_price=s_decimal_nan) -> str:
         """
         A wrapper function to sell_with_specific_market.
 
@@ -123,12 +127,14 @@ class ScriptStrategyBase(StrategyPyBase):
         :param order_type: The type of the order
         :param price: An order price
         :param position_action: A position action (for perpetual market only)
+        :param trigger_price: The trigger price (for STOP_MARKET and TAKE_PROFIT_MARKET orders only)
 
         :return: The client assigned id for the new order
         """
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.logger().info(f"Creating {trading_pair} sell order: price: {price} amount: {amount}.")
-        return self.sell_with_specific_market(market_pair, amount, order_type, price, position_action=position_action)
+        return self.sell_with_specific_market(market_pair, amount, order_type, price, position_action=position_action,
+                                              trigger_price=trigger_price)
 
     def cancel(self,
                connector_name: str,
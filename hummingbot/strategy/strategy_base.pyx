@@ -203,9 +203,7 @@ cdef class StrategyBase(TimeIterator):
                          order_filled_event.trade_fee)
         past_trades = []
         for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
+            past_trades += [event_to_trade(ofe, market.display_name) for ofe in market.order_filled_events]
 
         return sorted(past_trades, key=lambda x: x.timestamp)
 
@@ -310,6 +308,19 @@ cdef class StrategyBase(TimeIterator):
         self._sb_order_tracker.c_stop(clock)
         self.c_remove_markets(list(self._sb_markets))
 
+    def next_event_timestamp(self) -> float:
+        # Strategies are ticked on every clock tick unless they report their own schedule
+        return self._current_timestamp
+
+    def next_order_expiration_timestamp(self) -> float:
+        """
+        Timestamp when the next in flight cancel expires, and the order can be cancelled again, NaN if there is none.
+        """
+        in_flight_cancels = self._sb_order_tracker.in_flight_cancels
+        if len(in_flight_cancels) == 0:
+            return NaN
+        return min(in_flight_cancels.values()) + self._sb_order_tracker.CANCEL_EXPIRY_DURATION
+
     cdef c_add_markets(self, list markets):
         cdef:
             ConnectorBase typed_market
@@ -501,18 +512,21 @@ cdef class StrategyBase(TimeIterator):
                                  order_type=OrderType.MARKET,
                                  price=s_decimal_nan,
                                  expiration_seconds=NaN,
-                                 position_action=PositionAction.OPEN):
+                                 position_action=PositionAction.OPEN,
+                                 trigger_price=s_decimal_nan):
         return self.c_buy_with_specific_market(market_trading_pair_tuple, amount,
                                                order_type,
                                                price,
                                                expiration_seconds,
-                                               position_action)
+                                               position_action,
+                                               trigger_price)
 
     cdef str c_buy_with_specific_market(self, object market_trading_pair_tuple, object amount,
                                         object order_type=OrderType.MARKET,
                                         object price=s_decimal_nan,
                                         double expiration_seconds=NaN,
-                                        position_action=PositionAction.OPEN):
+                                        position_action=PositionAction.OPEN,
+                                        object trigger_price=s_decimal_nan):
         if self._sb_delegate_lock:
             raise RuntimeError("Delegates are not allowed to execute orders directly.")
 
@@ -524,6 +538,9 @@ cdef class StrategyBase(TimeIterator):
                       "position_action": position_action}
             ConnectorBase market = market_trading_pair_tuple.market
 
+        if order_type.is_trigger_type():
+            kwargs["trigger_price"] = trigger_price
+
         if market not in self._sb_markets:
             raise ValueError(f"Market object for buy order is not in the whitelisted markets set.")
 
@@ -537,7 +554,7 @@ cdef class StrategyBase(TimeIterator):
         # Start order tracking
         if order_type.is_limit_type():
             self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id, True, price, amount)
-        elif order_type == OrderType.MARKET:
+        elif order_type == OrderType.MARKET or order_type.is_trigger_type():
             self.c_start_tracking_market_order(market_trading_pair_tuple, order_id, True, amount)
 
         return order_id
@@ -546,18 +563,21 @@ cdef class StrategyBase(TimeIterator):
                                   order_type=OrderType.MARKET,
                                   price=s_decimal_nan,
                                   expiration_seconds=NaN,
-                                  position_action=PositionAction.OPEN):
+                                  position_action=PositionAction.OPEN,
+                                  trigger_price=s_decimal_nan):
         return self.c_sell_with_specific_market(market_trading_pair_tuple, amount,
                                                 order_type,
                                                 price,
                                                 expiration_seconds,
-                                                position_action)
+                                                position_action,
+                                                trigger_price)
 
     cdef str c_sell_with_specific_market(self, object market_trading_pair_tuple, object amount,
                                          object order_type=OrderType.MARKET,
                                          object price=s_decimal_nan,
                                          double expiration_seconds=NaN,
-                                         position_action=PositionAction.OPEN):
+                                         position_action=PositionAction.OPEN,
+                                         object trigger_price=s_decimal_nan):
         if self._sb_delegate_lock:
             raise RuntimeError("Delegates are not allowed to execute orders directly.")
 
@@ -569,6 +589,9 @@ cdef class StrategyBase(TimeIterator):
                       "position_action": position_action}
             ConnectorBase market = market_trading_pair_tuple.market
 
+        if order_type.is_trigger_type():
+            kwargs["trigger_price"] = trigger_price
+
         if market not in self._sb_markets:
             raise ValueError(f"Market object for sell order is not in the whitelisted markets set.")
 
@@ -579,7 +602,7 @@ cdef class StrategyBase(TimeIterator):
         # Start order tracking
         if order_type.is_limit_type():
             self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id, False, price, amount)
-        elif order_type == OrderType.MARKET:
+        elif order_type == OrderType.MARKET or order_type.is_trigger_type():
             self.c_start_tracking_market_order(market_trading_pair_tuple, order_id, False, amount)
 
         return order_id